@@ -0,0 +1,248 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+# Ekransız sunucularda da çalışsın: matplotlib Agg ile, Tk penceresi açılmadan
+os.environ["MPLBACKEND"] = "Agg"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from history import make_history
+from live_chart import BlitLiveChart
+from sim_engine import SimEngine
+from report import build_report_figure, collect_report
+from sramvsdrm import build_performance_axes, redraw_chart
+from stack_distance import make_analyzer
+from workloads import iter_workload
+
+
+# Performans ölçümleri ve gerileme (regression) kontrolü.
+#   engine.*  : SimEngine erişim/saniye; HIT ağırlıklı ve MISS ağırlıklı akışlar, hızlı run() döngüsü ve
+#               arayüzün kullandığı abone'li access() yolu, birden fazla SRAM ve DRAM boyutunda
+#   chart.*   : update_charts'ın kare başına maliyeti (ms); blit'li hızlı grafik ve tam yeniden çizim,
+#               1k/10k/100k tarihçe noktasında. Motor adımı ve tarihçeye ekleme ölçüme dahil değildir.
+#   report.*  : rapor verisinin toplanıp figürün oluşturulup çizilme süresi (ms), birden fazla SRAM boyutunda
+# Sonuçlar JSON'a yazılır; --baseline verilirse eşik (--threshold) üzerindeki kötüleşmelerde çıkış kodu 1 olur.
+
+SRAM_SIZES = [(3, 3), (32, 32), (128, 128)]
+DRAM_SIZES = [(256, 256), (1024, 1024)]   # MISS akışının çalışma kümesi (2 x en büyük SRAM) ikisine de sığar
+CHART_POINTS = [1000, 10000, 100000]
+QUICK_SRAM_SIZES = [(3, 3), (32, 32)]
+QUICK_DRAM_SIZES = [(64, 64), (1024, 1024)]
+QUICK_CHART_POINTS = [1000, 10000]
+
+
+def _best(function, repeat):
+
+    # function'ı repeat kez çalıştırır, en kısa süreyi (saniye) döndürür; gürültüye karşı en iyisi alınır.
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _best_frames(frame, prepare, frames, repeat):
+
+    # _best gibi, ama yalnızca frame() süreleri toplanır; her kareden önceki prepare() ölçüme girmez.
+
+    best = float("inf")
+    for _ in range(repeat):
+        elapsed = 0.0
+        for _ in range(frames):
+            prepare()
+            start = time.perf_counter()
+            frame()
+            elapsed += time.perf_counter() - start
+        best = min(best, elapsed)
+    return best
+
+
+def _size_name(rows, cols, prefix="sram"):
+    return f"{prefix}{rows}x{cols}"
+
+
+def _engine(rows, cols, dram=DRAM_SIZES[-1]):
+    return SimEngine(sram_rows=rows, sram_cols=cols, dram_rows=dram[0], dram_cols=dram[1])
+
+
+# --- motor ---
+def bench_engine(sizes, dram_sizes, accesses, repeat):
+    results = {}
+    for rows, cols in sizes:
+        capacity = rows * cols
+        streams = {
+            # Çalışma kümesi kapasitenin yarısı: ısındıktan sonra her erişim HIT
+            "hit": list(iter_workload(f"looping:working_set={max(1, capacity // 2)}", accesses)),
+            # Çalışma kümesi kapasitenin iki katı: LRU'da her erişim MISS ve çıkarma
+            "miss": list(iter_workload(f"looping:working_set={2 * capacity}", accesses)),
+        }
+        for dram in dram_sizes:
+            if dram[0] * dram[1] < 2 * capacity: continue  # MISS akışı DRAM'e sığmaz
+            name = f"{_size_name(rows, cols)}.{_size_name(*dram, prefix='dram')}"
+            for kind, keys in streams.items():
+                engine = _engine(rows, cols, dram)
+                engine.run(keys)  # ısınma: DRAM konumları ve önbellek dolu
+
+                def fast():
+                    engine.run(keys)
+
+                stepper = _engine(rows, cols, dram); stepper.subscribe(lambda result: None); stepper.run(keys)
+
+                def step():
+                    access = stepper.access
+                    for key in keys: access(key)
+
+                results[f"engine.run.{kind}.{name}"] = _rate(len(keys), _best(fast, repeat))
+                results[f"engine.access.{kind}.{name}"] = _rate(len(keys), _best(step, repeat))
+    return results
+
+
+def _rate(count, seconds):
+    return {"value": count / seconds, "unit": "erişim/s", "better": "higher"}
+
+
+def _milliseconds(seconds):
+    return {"value": seconds * 1000, "unit": "ms", "better": "lower"}
+
+
+# --- canlı grafik ---
+def _history_rows(count, seed=0):
+
+    # Arayüzün her adımda tarihçeye eklediği satırlar (on_engine_step ile aynı sütunlar).
+
+    rows = []
+    engine = _engine(3, 3)
+    engine.subscribe(lambda result: rows.append((
+        engine.total_sram_delay, engine.total_dram_delay, engine.total_sram_energy, engine.total_dram_energy,
+        engine.total_dram_refresh_energy, engine.sram_access_count, engine.dram_access_count)))
+    engine.run(iter_workload("zipf:footprint=64", count, seed=seed))
+    return rows
+
+
+def _filled_history(rows, points):
+    history = make_history("full")
+    for row in rows[:points]: history.append(*row)
+    return history
+
+
+def _chart():
+    figure = Figure(figsize=(6, 4))
+    canvas = FigureCanvasAgg(figure)
+    ax1, ax2, series = build_performance_axes(figure)
+    return canvas, (ax1, ax2), series
+
+
+def bench_chart(points_list, frames, repeat):
+
+    # Her karede bir yeni adım eklenir (normal animasyon); ölçülen yalnızca update_charts'ın yaptığı iştir.
+    # Satırlar önceden üretilir ve kareler arasında, ölçüm dışında tarihçeye eklenir.
+
+    results = {}
+    rows = _history_rows(max(points_list) + frames * repeat)
+    for points in points_list:
+        history = _filled_history(rows, points)
+        canvas, axes, series = _chart()
+        chart = BlitLiveChart(canvas, "step", series, history)
+        canvas.draw(); chart.update()  # arka plan yakalanır, mevcut tarihçe işlenir
+        feed = iter(rows[points:])
+
+        def append_row():
+            history.append(*next(feed))
+
+        results[f"chart.blit.{points}pts"] = _milliseconds(_best_frames(chart.update, append_row, frames, repeat) / frames)
+
+        history = _filled_history(rows, points)
+        canvas, axes, series = _chart()
+        feed = iter(rows[points:])
+        full_frames = max(1, frames // 10)
+
+        def full_redraw():
+            redraw_chart(canvas, axes, series, history)
+
+        results[f"chart.full.{points}pts"] = _milliseconds(_best_frames(full_redraw, append_row, full_frames, repeat) / full_frames)
+    return results
+
+
+# --- rapor ---
+def bench_report(sizes, accesses, repeat):
+    results = {}
+    for rows, cols in sizes:
+        analyzer = make_analyzer()
+        engine = _engine(rows, cols)
+        engine.subscribe(lambda result: analyzer.feed(result.key))
+        engine.run(iter_workload(f"zipf:footprint={8 * rows * cols}", accesses))
+
+        def build():
+            FigureCanvasAgg(build_report_figure(collect_report(engine.totals(), analyzer, engine.sram_capacity))).draw()
+
+        results[f"report.build.{_size_name(rows, cols)}"] = _milliseconds(_best(build, repeat))
+    return results
+
+
+# --- karşılaştırma ---
+def compare(results, baseline, threshold):
+
+    # Ortak ölçümleri karşılaştırır, tabloyu yazdırır ve eşiği aşan gerilemelerin adlarını döndürür.
+
+    regressions = []
+    print(f"\n{'ölçüm':<48}{'temel':>14}{'şimdi':>14}{'değişim':>10}")
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None: print(f"{name:<48}{'-':>14}{current['value']:>14.4g}{'yeni':>10}"); continue
+        change = current["value"] / reference["value"] - 1 if reference["value"] else 0.0
+        worse = -change if current["better"] == "higher" else change
+        status = ""
+        if worse > threshold: regressions.append(name); status = "  GERİLEME"
+        print(f"{name:<48}{reference['value']:>14.4g}{current['value']:>14.4g}{change:>+10.1%}{status}")
+    return regressions
+
+
+def run_benchmarks(quick=False, only=None):
+    sizes = QUICK_SRAM_SIZES if quick else SRAM_SIZES
+    dram_sizes = QUICK_DRAM_SIZES if quick else DRAM_SIZES
+    repeat = 3 if quick else 5
+    groups = {
+        "engine": lambda: bench_engine(sizes, dram_sizes, 50000 if quick else 200000, repeat),
+        "chart": lambda: bench_chart(QUICK_CHART_POINTS if quick else CHART_POINTS, 20 if quick else 50, repeat),
+        "report": lambda: bench_report(sizes, 20000 if quick else 100000, 2 if quick else 3),
+    }
+    results = {}
+    for group, function in groups.items():
+        if only and group not in only: continue
+        print(f"{group}...", file=sys.stderr, flush=True)
+        results.update(function())
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SRAM/DRAM simülatörü performans ölçümleri")
+    parser.add_argument("--out", default="benchmark_results.json", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--baseline", help="Karşılaştırılacak önceki sonuç dosyası (JSON)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="İzin verilen en fazla kötüleşme oranı (0.2 = %%20)")
+    parser.add_argument("--quick", action="store_true", help="Daha küçük boyutlar ve daha az tekrar")
+    parser.add_argument("--only", action="append", choices=["engine", "chart", "report"], help="Yalnızca seçilen grupları çalıştır")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.quick, args.only)
+    meta = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+            "machine": platform.machine(), "platform": platform.platform(), "matplotlib": matplotlib.__version__, "quick": args.quick}
+    with open(args.out, "w", encoding="utf-8") as f: json.dump({"meta": meta, "results": results}, f, indent=2)
+    print(f"Sonuçlar yazıldı: {args.out}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f: baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions: sys.exit(f"\n{len(regressions)} ölçüm %{args.threshold * 100:.0f} eşiğinden fazla geriledi: {', '.join(regressions)}")
+        print("\nGerileme yok.")
+    else:
+        for name, result in results.items(): print(f"{name:<48}{result['value']:>14.4g} {result['unit']}")
@@ -0,0 +1,148 @@
+import heapq
+from itertools import count
+
+
+# Olay güdümlü (discrete-event) DRAM zamanlama modeli.
+# Simülasyon zamanı (ns) bir öncelik kuyruğundaki olaylarla ilerler: istek tamamlanmaları ve her tREFI'de bir
+# yenileme (REF) komutu. Her bankanın açık satır tamponu vardır; istek gecikmesi satır durumuna göre değişir:
+#   satır isabeti  (row hit)      : tCAS
+#   kapalı satır   (row miss)     : tRCD + tCAS             (+ aktivasyon enerjisi)
+#   satır çakışması (row conflict): tRP + tRCD + tCAS       (+ ön şarj ve aktivasyon enerjisi)
+# Farklı bankalara giden istekler paralel ilerler, yalnızca veri yolu (tBURST) paylaşılır. En fazla
+# max_outstanding istek aynı anda bekleyebilir; kuyruk doluysa yeni istek ilk tamamlanmaya kadar bekler.
+# Boşta geçen süre tick'lenmez: advance() sıradaki olaya atlar, art arda kaçırılan yenilemeler tek adımda sayılır.
+#
+# Adres eşleme: ardışık row_size adres bir DRAM satırını oluşturur, ardışık satırlar bankalara sırayla dağıtılır
+# (satır düzeyinde banka serpiştirme). Adres, arayüzdeki ızgara konumundan değil anahtarın kendisinden gelir.
+
+# Olay türleri
+COMPLETE = 0
+REFRESH = 1
+
+ROW_HIT, ROW_MISS, ROW_CONFLICT = "hit", "miss", "conflict"
+
+# Anlık görüntüye yazılan değişken durum (zamanlama ve enerji ayarları hariç)
+STATE_FIELDS = ("now", "open_rows", "bank_ready", "bus_free", "outstanding", "row_hits", "row_misses",
+                "row_conflicts", "refreshes", "total_refresh_energy")
+
+
+class DRAMModel:
+    def __init__(self, banks=8, t_cas=14, t_rcd=14, t_rp=14, t_burst=4, t_refi=7800, t_rfc=350,
+                 read_energy=2.0, write_energy=2.2, activate_energy=1.0, precharge_energy=0.5,
+                 refresh_energy=3.0, max_outstanding=4, row_size=128):
+        if banks < 1: raise ValueError("En az bir banka gerekli")
+        if row_size < 1: raise ValueError("row_size en az 1 olmalı")
+        if max_outstanding < 1: raise ValueError("max_outstanding en az 1 olmalı")
+        if t_refi <= 0: raise ValueError("t_refi pozitif olmalı")
+        self.banks = banks
+        self.row_size = row_size  # bir DRAM satırındaki adres sayısı (örn. 8 KiB satır / 64 B önbellek satırı)
+        # --- Zamanlama (ns) ---
+        self.t_cas, self.t_rcd, self.t_rp, self.t_burst = t_cas, t_rcd, t_rp, t_burst
+        self.t_refi, self.t_rfc = t_refi, t_rfc
+        # --- Enerji (pJ) ---
+        self.read_energy, self.write_energy = read_energy, write_energy
+        self.activate_energy, self.precharge_energy = activate_energy, precharge_energy
+        self.refresh_energy = refresh_energy
+        self.max_outstanding = max_outstanding
+        self.reset()
+
+    def reset(self):
+        self.now = 0
+        self._events = []
+        self._sequence = count()
+        self.open_rows = [None] * self.banks
+        self.bank_ready = [0] * self.banks
+        self.bus_free = 0
+        self.outstanding = 0
+        self.row_hits = 0
+        self.row_misses = 0
+        self.row_conflicts = 0
+        self.refreshes = 0
+        self.total_refresh_energy = 0
+        self._push(self.t_refi, REFRESH)
+
+    def _push(self, time, kind):
+        heapq.heappush(self._events, (time, next(self._sequence), kind))
+
+    # Adres -> (banka, banka içi satır)
+    def map_address(self, address):
+        line = address // self.row_size
+        return line % self.banks, line // self.banks
+
+    def advance(self, time):
+
+        # time'a kadar olan olayları işler ve bu aralıkta harcanan yenileme enerjisini döndürür.
+
+        energy = 0
+        events = self._events
+        while events and events[0][0] <= time:
+            when, _, kind = heapq.heappop(events)
+            if kind == COMPLETE:
+                self.outstanding -= 1
+                continue
+            # Yenileme: time'a kadar kaçırılan tüm REF'ler tek seferde; tamamlanmalar bankaları
+            # etkilemediği için yalnızca sonuncusunun bankaları meşgul etmesi önemlidir.
+            refreshes = (time - when) // self.t_refi + 1
+            last = when + (refreshes - 1) * self.t_refi
+            start = max(last, max(self.bank_ready))
+            self.bank_ready = [start + self.t_rfc] * self.banks
+            self.open_rows = [None] * self.banks  # REF öncesi tüm bankalar ön şarj edilir
+            self.refreshes += refreshes
+            energy += refreshes * self.refresh_energy
+            self._push(last + self.t_refi, REFRESH)
+        self.now = max(self.now, time)
+        self.total_refresh_energy += energy
+        return energy
+
+    def access(self, address, time, write=False):
+
+        # time anında gelen isteği zamanlar.
+        # (verilme zamanı, tamamlanma zamanı, erişim enerjisi, yenileme enerjisi, satır durumu) döndürür;
+        # kuyruk doluysa verilme zamanı ilk tamamlanmaya kadar ertelenir.
+
+        refresh_energy = self.advance(time)
+        while self.outstanding >= self.max_outstanding:
+            time = self._events[0][0]
+            refresh_energy += self.advance(time)
+
+        bank, row = self.map_address(address)
+        start = max(time, self.bank_ready[bank])
+        open_row = self.open_rows[bank]
+        if open_row == row:
+            self.row_hits += 1; state = ROW_HIT
+            latency = self.t_cas; energy = 0
+        elif open_row is None:
+            self.row_misses += 1; state = ROW_MISS
+            latency = self.t_rcd + self.t_cas; energy = self.activate_energy
+        else:
+            self.row_conflicts += 1; state = ROW_CONFLICT
+            latency = self.t_rp + self.t_rcd + self.t_cas; energy = self.precharge_energy + self.activate_energy
+        energy += self.write_energy if write else self.read_energy
+
+        # Satır açıldıktan sonra aynı bankaya sonraki sütun komutu tBURST sonra verilebilir (isabetler boru hattında)
+        self.open_rows[bank] = row
+        self.bank_ready[bank] = start + latency - self.t_cas + self.t_burst
+        done = max(start + latency, self.bus_free) + self.t_burst
+        self.bus_free = done
+        self.outstanding += 1
+        self._push(done, COMPLETE)
+        return time, done, energy, refresh_energy, state
+
+    def get_state(self):
+        state = {name: getattr(self, name) for name in STATE_FIELDS}
+        state["events"] = [list(event) for event in self._events]
+        return state
+
+    def set_state(self, state):
+        if len(state["open_rows"]) != self.banks: raise ValueError("Anlık görüntü farklı sayıda banka ile alınmış")
+        for name in STATE_FIELDS:
+            value = state[name]
+            setattr(self, name, list(value) if isinstance(value, list) else value)
+        self._events = [tuple(event) for event in state["events"]]; heapq.heapify(self._events)
+        self._sequence = count(max((sequence for _, sequence, _ in self._events), default=-1) + 1)
+
+    def drain_time(self):
+
+        # Bekleyen son isteğin tamamlanacağı an.
+
+        return max(self.now, self.bus_free)
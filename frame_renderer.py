@@ -0,0 +1,45 @@
+import time
+
+
+# Sabit kare hızında çizim için hücre değişikliklerini biriktirir.
+# Adımlar arasında aynı hücreye yapılan değişiklikler birleştirilir (son değer kazanır) ve her karede
+# tek geçişte uygulanır; vurgu (flash) sönmeleri için hücre başına ayrı after() çağrısı yerine
+# son tarih tutulur ve kare döngüsünde kontrol edilir.
+
+FRAME_MS = 33  # ~30 FPS
+
+
+class FrameRenderer:
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._pending = {}   # widget -> {seçenek: değer}
+        self._restore = {}   # widget -> (son tarih, asıl arka plan)
+
+    def set(self, widget, **options):
+        self._pending.setdefault(widget, {}).update(options)
+
+    def flash(self, widget, color, original_bg, duration_ms):
+        self.set(widget, bg=color)
+        self._restore[widget] = (self.clock() + duration_ms / 1000, original_bg)
+
+    def clear(self):
+        self._pending.clear()
+        self._restore.clear()
+
+    def has_work(self):
+        return bool(self._pending or self._restore)
+
+    def flush(self):
+
+        # Bekleyen tüm değişiklikleri uygular. Süresi dolan vurgular, bu karede yeni değişiklik almadıysa söner
+        # (böylece her vurgu en az bir kare görünür).
+
+        now = self.clock()
+        pending = self._pending
+        for widget in [w for w, (deadline, _) in self._restore.items() if deadline <= now and w not in pending]:
+            pending[widget] = {"bg": self._restore.pop(widget)[1]}
+        applied = 0
+        for widget, options in pending.items():
+            if widget.winfo_exists(): widget.config(**options); applied += 1
+        pending.clear()
+        return applied
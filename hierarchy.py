@@ -0,0 +1,278 @@
+import json
+from policies import make_policy
+
+
+# Çok seviyeli (L1/L2/L3...), küme ilişkili (set-associative) SRAM önbellek hiyerarşisi ve DRAM.
+# Her seviye adresin satır numarasıyla bir kümeye eşlenir; arama ve yer değiştirme yalnızca o
+# kümenin politikasında yapılır, bu yüzden erişim maliyeti önbellek boyutuyla büyümez.
+#
+# Kapsama politikaları:
+#   inclusive : alt seviye üsttekilerin hepsini içerir; alttan çıkan satır üstlerden de geçersiz kılınır
+#   nine      : ne kapsayıcı ne dışlayıcı; seviyeler bağımsız doldurulur
+#   exclusive : bir satır tek seviyede bulunur; üstten çıkan satır bir alt seviyeye iner
+# Yazmalar: write_back (kirli bit, çıkarılınca aşağı yazılır) veya write-through;
+# write_allocate=False iken yazma MISS'i önbelleği doldurmaz, doğrudan DRAM'e gider.
+#
+# SimEngine'den ayrı, arayüzsüz bir modeldir (yalnızca --hierarchy ile çalışır); access() verinin bulunduğu
+# seviyeyi döndürür (len(levels) ise DRAM), sonuçlar totals()/level_totals() ve plot_hierarchy_report ile okunur.
+
+INCLUSION_POLICIES = ("inclusive", "nine", "exclusive")
+
+
+class CacheLevel:
+    def __init__(self, name, size, associativity, line_size=64, latency=1,
+                 read_energy=0.5, write_energy=0.6, policy="LRU"):
+        if size % (associativity * line_size): raise ValueError(f"{name}: boyut, ilişkililik x satır boyutunun katı olmalı")
+        self.name = name
+        self.size = size
+        self.associativity = associativity
+        self.line_size = line_size
+        self.latency = latency
+        self.read_energy = read_energy
+        self.write_energy = write_energy
+        self.policy_name = policy
+        self.num_sets = size // (associativity * line_size)
+        self.reset()
+
+    def reset(self):
+        self.sets = [make_policy(self.policy_name, self.associativity) for _ in range(self.num_sets)]
+        self.dirty = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writebacks = 0
+        self.total_delay = 0
+        self.total_energy = 0
+
+    # Satır adresi: satırın ilk baytı
+    def line_address(self, address):
+        return address - address % self.line_size
+
+    def _set_of(self, line):
+        return self.sets[(line // self.line_size) % self.num_sets]
+
+    def contains(self, address):
+        line = self.line_address(address)
+        return line in self._set_of(line)
+
+    def touch(self, address):
+        line = self.line_address(address)
+        self._set_of(line).access(line)
+
+    def insert(self, address, dirty=False):
+
+        # Satırı ekler; küme doluysa politikanın kurbanını (satır, kirli_mi) olarak döndürür.
+
+        line = self.line_address(address)
+        evicted = self._set_of(line).access(line)[1]
+        if dirty: self.dirty.add(line)
+        if evicted is None: return None
+        self.evictions += 1
+        was_dirty = evicted in self.dirty
+        self.dirty.discard(evicted)
+        return evicted, was_dirty
+
+    def remove(self, address):
+
+        # Satırı çıkarır; kirliyse True, yoksa None döndürür.
+
+        line = self.line_address(address)
+        cache_set = self._set_of(line)
+        if line not in cache_set: return None
+        cache_set.remove(line)
+        was_dirty = line in self.dirty
+        self.dirty.discard(line)
+        return was_dirty
+
+    def mark_dirty(self, address):
+        self.dirty.add(self.line_address(address))
+
+
+class CacheHierarchy:
+    def __init__(self, levels, memory_latency=50, memory_read_energy=2.0, memory_write_energy=2.2,
+                 dram_refresh_energy=3.0, dram_refresh_interval=10,
+                 inclusion="inclusive", write_back=True, write_allocate=True):
+        if not levels: raise ValueError("En az bir önbellek seviyesi gerekli")
+        if inclusion not in INCLUSION_POLICIES: raise ValueError(f"Bilinmeyen kapsama politikası: {inclusion}")
+        line_sizes = [level.line_size for level in levels]
+        if inclusion == "exclusive" and len(set(line_sizes)) > 1: raise ValueError("exclusive hiyerarşide satır boyutları eşit olmalı")
+        if any(upper > lower for upper, lower in zip(line_sizes, line_sizes[1:])): raise ValueError("Satır boyutu alt seviyelerde küçülemez")
+        self.levels = list(levels)
+        self.memory_latency = memory_latency
+        self.memory_read_energy = memory_read_energy
+        self.memory_write_energy = memory_write_energy
+        self.dram_refresh_energy = dram_refresh_energy
+        self.dram_refresh_interval = dram_refresh_interval
+        self.inclusion = inclusion
+        self.write_back = write_back
+        self.write_allocate = write_allocate
+        self.level_names = [level.name for level in self.levels] + ["DRAM"]
+        self.reset()
+
+    @classmethod
+    def from_config(cls, config):
+
+        # {"levels": [{"name": "L1", "size": 32768, "associativity": 8, ...}, ...], "memory": {...}, ...}
+
+        levels = [CacheLevel(**level) for level in config["levels"]]
+        memory = config.get("memory", {})
+        return cls(levels,
+                   memory_latency=memory.get("latency", 50),
+                   memory_read_energy=memory.get("read_energy", 2.0),
+                   memory_write_energy=memory.get("write_energy", 2.2),
+                   dram_refresh_energy=memory.get("refresh_energy", 3.0),
+                   dram_refresh_interval=memory.get("refresh_interval", 10),
+                   inclusion=config.get("inclusion", "inclusive"),
+                   write_back=config.get("write_back", True),
+                   write_allocate=config.get("write_allocate", True))
+
+    @classmethod
+    def from_json(cls, path):
+        with open(path, "r", encoding="utf-8") as f: return cls.from_config(json.load(f))
+
+    def reset(self):
+        for level in self.levels: level.reset()
+        self.step_count = 0
+        self.memory_reads = 0
+        self.memory_writes = 0
+        self.memory_delay = 0
+        self.memory_energy = 0
+        self.total_dram_refresh_energy = 0
+
+    # --- satır yerleştirme ve kurban zinciri ---
+    def _back_invalidate(self, index, line):
+
+        # Kapsayıcı hiyerarşide alt seviyeden çıkan satırı üst seviyelerden siler; üstte kirli kopya varsa True.
+
+        dirty = False
+        span = self.levels[index].line_size
+        for upper in self.levels[:index]:
+            for address in range(line, line + span, upper.line_size):
+                if upper.remove(address): dirty = True
+        return dirty
+
+    def _place(self, index, address, dirty, energies):
+        if index == len(self.levels):
+            if dirty: self._memory_write(energies)
+            return
+        level = self.levels[index]
+        if level.contains(address):
+            if dirty: level.mark_dirty(address); energies[index] += level.write_energy
+            return
+        victim = level.insert(address, dirty)
+        energies[index] += level.write_energy
+        if victim is None: return
+        victim_line, victim_dirty = victim
+        if self.inclusion == "inclusive" and self._back_invalidate(index, victim_line): victim_dirty = True
+        if self.inclusion == "exclusive":
+            self._place(index + 1, victim_line, victim_dirty, energies)
+        elif victim_dirty:
+            level.writebacks += 1
+            self._place(index + 1, victim_line, True, energies)
+
+    def _memory_write(self, energies):
+        self.memory_writes += 1
+        energies[-1] += self.memory_write_energy
+
+    # --- tek erişim ---
+    def access(self, address, write=False):
+        levels = self.levels; count = len(levels)
+        delays = [0] * (count + 1); energies = [0] * (count + 1)
+
+        hit_level = count
+        for index, level in enumerate(levels):
+            delays[index] = level.latency; energies[index] = level.read_energy
+            if level.contains(address):
+                level.hits += 1; hit_level = index
+                break
+            level.misses += 1
+
+        allocate = not write or self.write_allocate
+        if hit_level == count:
+            delays[count] = self.memory_latency
+            if allocate:
+                self.memory_reads += 1; energies[count] += self.memory_read_energy
+        else:
+            levels[hit_level].touch(address)
+
+        # Doldurma
+        owner = hit_level
+        if allocate:
+            if self.inclusion == "exclusive":
+                if hit_level > 0:
+                    dirty = levels[hit_level].remove(address) if hit_level < count else False
+                    self._place(0, address, bool(dirty), energies)
+            else:
+                for index in range(min(hit_level, count) - 1, -1, -1): self._place(index, address, False, energies)
+            owner = 0
+
+        # Yazma
+        if write:
+            if owner < count:
+                energies[owner] += levels[owner].write_energy
+                if self.write_back: levels[owner].mark_dirty(address)
+                else: self._memory_write(energies)
+            else:
+                self._memory_write(energies)
+
+        self.step_count += 1
+        refresh_energy = 0
+        if self.step_count % self.dram_refresh_interval == 0:
+            refresh_energy = self.dram_refresh_energy
+            self.total_dram_refresh_energy += refresh_energy
+        for level, delay, energy in zip(levels, delays, energies):
+            level.total_delay += delay; level.total_energy += energy
+        self.memory_delay += delays[count]; self.memory_energy += energies[count]
+        return hit_level
+
+    def run(self, accesses):
+
+        # accesses: adresler veya (adres, yazma_mı) çiftleri.
+
+        access = self.access
+        for item in accesses:
+            if isinstance(item, tuple): access(*item)
+            else: access(item)
+        return self.totals()
+
+    def totals(self):
+        totals = {"steps": self.step_count, "inclusion": self.inclusion}
+        for level in self.levels:
+            totals[f"{level.name}_hits"] = level.hits
+            totals[f"{level.name}_misses"] = level.misses
+            totals[f"{level.name}_writebacks"] = level.writebacks
+            totals[f"{level.name}_delay"] = level.total_delay
+            totals[f"{level.name}_energy"] = level.total_energy
+        totals["dram_reads"] = self.memory_reads
+        totals["dram_writes"] = self.memory_writes
+        totals["dram_delay"] = self.memory_delay
+        totals["dram_energy"] = self.memory_energy
+        totals["dram_refresh_energy"] = self.total_dram_refresh_energy
+        return totals
+
+    def level_totals(self):
+
+        # (ad, toplam gecikme, toplam enerji) seviye başına; son satır DRAM (enerjiye yenileme dahil değil).
+
+        rows = [(level.name, level.total_delay, level.total_energy) for level in self.levels]
+        rows.append(("DRAM", self.memory_delay, self.memory_energy))
+        return rows
+
+
+# --- N seviyeli rapor grafiği (arayüzsüz, Agg) ---
+def plot_hierarchy_report(hierarchy, path):
+    from matplotlib.figure import Figure
+
+    names, delays, energies = zip(*hierarchy.level_totals())
+    fig = Figure(figsize=(6 * 3, 6))
+    axes = fig.subplots(1, 3)
+    fig.suptitle(f"Bellek Hiyerarşisi Karşılaştırması ({hierarchy.inclusion})", fontsize=14)
+    axes[0].bar(names, delays, color='royalblue'); axes[0].set_ylabel("Toplam Birikimli Gecikme (ns)"); axes[0].set_title("Seviye Başına Gecikme")
+    axes[1].bar(names, energies, color='orange', label="Erişim")
+    axes[1].bar(["DRAM"], [hierarchy.total_dram_refresh_energy], bottom=[energies[-1]], color='gold', label="Refresh")
+    axes[1].set_ylabel("Toplam Enerji (pJ)"); axes[1].set_title("Seviye Başına Enerji"); axes[1].legend()
+    hits = [level.hits for level in hierarchy.levels]; misses = [level.misses for level in hierarchy.levels]
+    axes[2].bar(names[:-1], hits, color='lightskyblue', label="HIT"); axes[2].bar(names[:-1], misses, bottom=hits, color='khaki', label="MISS")
+    axes[2].set_ylabel("Erişim Sayısı"); axes[2].set_title("Seviye Başına HIT/MISS"); axes[2].legend()
+    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
+    fig.savefig(path)
@@ -0,0 +1,227 @@
+from array import array
+
+
+# Simülasyon tarihçesi için sütunlu, dizi (array) tabanlı depolar.
+# Her adım her sütuna kutulanmış Python nesnesi yerine tek bir makine sayısı olarak yazılır.
+#  - ColumnarHistory : tüm adımlar, kapasite doldukça iki katına çıkan önceden ayrılmış tamponlar
+#  - RingHistory     : yalnızca son max_rows adım (sabit bellek)
+#  - RollupHistory   : son adımlar tam ayrıntılı, eskileri seyreltilmiş (çok çözünürlüklü, sabit bellek)
+# Tüm sütunlar birikimli olduğu için eski adımların seyreltilmesi, blok sonundaki satırı tutmak demektir.
+#
+# Satır başına 28 bayt: gecikme/enerji toplamları 'f' (float32; grafik için yeterli, değerler her adımda motorun
+# kesin toplamından yazıldığı için hata birikmez), sayaçlar 'I'. Adım numarası saklanmaz: her satır bir adımdır,
+# "step" sütunu satırın sırasından (appended) türetilir. Yalnızca RollupHistory'nin özet satırları adımı saklar.
+# Son toplamlar tarihçeden değil motordan (SimEngine.totals) okunur.
+
+STEP_COLUMN = "step"
+STEP_TYPECODE = "q"
+
+HISTORY_COLUMNS = (
+    ("sram_delay", "f"),
+    ("dram_delay", "f"),
+    ("sram_energy", "f"),
+    ("dram_energy", "f"),
+    ("refresh_energy", "f"),
+    ("sram_access", "I"),
+    ("dram_access", "I"),
+)
+
+
+def _zeros(typecode, count):
+    buffer = array(typecode)
+    buffer.frombytes(bytes(count * buffer.itemsize))
+    return buffer
+
+
+class ColumnarHistory:
+    def __init__(self, columns=HISTORY_COLUMNS, initial_capacity=1024):
+        self.columns = tuple(columns)
+        self.names = tuple(name for name, _ in self.columns)
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self._initial_capacity = max(1, initial_capacity)
+        self.clear()
+
+    def clear(self):
+        self._capacity = self._initial_capacity
+        self._data = [_zeros(typecode, self._capacity) for _, typecode in self.columns]
+        self._length = 0
+        self.appended = 0  # bugüne kadar eklenen toplam satır
+
+    def __len__(self):
+        return self._length
+
+    def _grow(self):
+        for column in self._data: column.frombytes(bytes(self._capacity * column.itemsize))
+        self._capacity *= 2
+
+    def append(self, *values):
+        if self._length == self._capacity: self._grow()
+        row = self._length
+        for column, value in zip(self._data, values): column[row] = value
+        self._length += 1
+        self.appended += 1
+
+    def _derived(self, name):
+        return name == STEP_COLUMN and name not in self._index
+
+    def _steps(self, start, stop):
+
+        # Tutulan satırlardan [start, stop) aralığının adım numaraları (ilk tutulan satır: appended - len + 1).
+
+        first = self.appended - self._length + 1
+        return array(STEP_TYPECODE, range(first + start, first + stop))
+
+    def _slice(self, name, start, stop):
+        if self._derived(name): return self._steps(start, stop)
+        return self._data[self._index[name]][start:stop]
+
+    def last(self, name, default=0):
+        if not self._length: return default
+        if self._derived(name): return self.appended
+        return self._data[self._index[name]][self._length - 1]
+
+    def column(self, name):
+
+        # Sütunun mantıksal satırlarının kopyası (tüm grafiği yeniden çizen eski yol ve raporlar için).
+
+        return self._slice(name, 0, self._length)
+
+    def read_since(self, appended, names):
+
+        # 'appended' sayısından sonra eklenen ve hâlâ tutulan satırları döndürür: (yeni toplam, [sütun parçaları]).
+        # Canlı grafik yalnızca yeni adımları okur, tüm tarihçe kopyalanmaz.
+
+        start = min(max(appended, 0), self._length)
+        return self.appended, [self._slice(name, start, self._length) for name in names]
+
+    def memory_bytes(self):
+        return sum(column.itemsize * len(column) for column in self._data)
+
+    # --- anlık görüntü (snapshot.py): tutulan satırlar sırayla, sütun başına bir dizi ---
+    def get_state(self):
+        return {"appended": self.appended, "columns": [self.column(name) for name in self.names]}
+
+    def load_state(self, state):
+        self.clear()
+        columns = state["columns"]
+        if len(columns) != len(self._data): raise ValueError(f"Tarihçe sütun sayısı uyuşmuyor: {len(columns)} != {len(self._data)}")
+        length = len(columns[0]) if columns else 0
+        while self._capacity < length: self._grow()
+        for column, values in zip(self._data, columns): column[:length] = values
+        self._length = length
+        self.appended = state["appended"]
+
+
+class RingHistory(ColumnarHistory):
+    def __init__(self, columns=HISTORY_COLUMNS, max_rows=100000):
+        self.max_rows = max(1, max_rows)
+        super().__init__(columns, self.max_rows)
+
+    def clear(self):
+        super().clear()
+        self._head = 0  # en eski satırın fiziksel konumu
+
+    def append(self, *values):
+        if self._length < self.max_rows:
+            row = (self._head + self._length) % self.max_rows
+            self._length += 1
+        else:
+            row = self._head
+            self._head = (self._head + 1) % self.max_rows
+        for column, value in zip(self._data, values): column[row] = value
+        self.appended += 1
+
+    def _ordered(self, column, start, stop):
+        first, last = self._head + start, self._head + stop
+        if last <= self.max_rows: return column[first:last]
+        if first >= self.max_rows: return column[first - self.max_rows:last - self.max_rows]
+        return column[first:] + column[:last - self.max_rows]
+
+    def _slice(self, name, start, stop):
+        if self._derived(name): return self._steps(start, stop)
+        return self._ordered(self._data[self._index[name]], start, stop)
+
+    def last(self, name, default=0):
+        if not self._length: return default
+        if self._derived(name): return self.appended
+        return self._data[self._index[name]][(self._head + self._length - 1) % self.max_rows]
+
+    def read_since(self, appended, names):
+        start = min(max(appended - (self.appended - self._length), 0), self._length)
+        return self.appended, [self._slice(name, start, self._length) for name in names]
+
+
+class RollupHistory:
+    def __init__(self, columns=HISTORY_COLUMNS, detail_rows=10000, max_coarse_rows=10000, rollup_factor=10):
+        self.columns = tuple(columns)
+        self.names = tuple(name for name, _ in self.columns)
+        self.detail_rows = detail_rows
+        self.max_coarse_rows = max(2, max_coarse_rows)
+        self.initial_rollup_factor = max(1, rollup_factor)
+        self.clear()
+
+    def clear(self):
+        self.detail = RingHistory(self.columns, self.detail_rows)
+        # Özet satırları seyrek olduğundan adım numarası türetilemez, ayrı sütunda saklanır
+        self.coarse = ColumnarHistory(((STEP_COLUMN, STEP_TYPECODE),) + self.columns, min(1024, self.max_coarse_rows))
+        self.rollup_factor = self.initial_rollup_factor  # bir özet satırının kapsadığı adım sayısı
+        self._pending = 0
+
+    @property
+    def appended(self):
+        return self.detail.appended
+
+    def __len__(self):
+        return len(self.coarse) + len(self.detail)
+
+    def append(self, *values):
+        detail = self.detail
+        if len(detail) == detail.max_rows:
+            # Ayrıntıdan düşecek en eski satır; her bloğun son satırı özet olarak saklanır
+            self._pending += 1
+            if self._pending >= self.rollup_factor:
+                self.coarse.append(detail.appended - len(detail) + 1, *(column[detail._head] for column in detail._data))
+                self._pending = 0
+                if len(self.coarse) > self.max_coarse_rows: self._coarsen()
+        detail.append(*values)
+
+    def _coarsen(self):
+
+        # Özet satırlarının yarısını atar (her çiftin son satırı kalır); blok boyutu iki katına çıkar.
+
+        coarse = self.coarse
+        count = len(coarse)
+        kept = list(range(1, count, 2))
+        if count % 2: kept.append(count - 1)
+        for column in coarse._data:
+            for new_row, old_row in enumerate(kept): column[new_row] = column[old_row]
+        coarse._length = len(kept)
+        self.rollup_factor *= 2
+
+    def last(self, name, default=0):
+        if len(self.detail): return self.detail.last(name)
+        return self.coarse.last(name, default)
+
+    def column(self, name):
+        return self.coarse.column(name) + self.detail.column(name)
+
+    def read_since(self, appended, names):
+        return self.detail.read_since(appended, names)
+
+    def memory_bytes(self):
+        return self.coarse.memory_bytes() + self.detail.memory_bytes()
+
+    def get_state(self):
+        return {"coarse": self.coarse.get_state(), "detail": self.detail.get_state(), "rollup_factor": self.rollup_factor, "pending": self._pending}
+
+    def load_state(self, state):
+        self.clear()
+        self.coarse.load_state(state["coarse"]); self.detail.load_state(state["detail"])
+        self.rollup_factor = state["rollup_factor"]; self._pending = state["pending"]
+
+
+def make_history(mode="full", max_rows=100000):
+    if mode == "full": return ColumnarHistory()
+    if mode == "ring": return RingHistory(max_rows=max_rows)
+    if mode == "rollup": return RollupHistory(detail_rows=max_rows // 2, max_coarse_rows=max_rows // 2)
+    raise ValueError(f"Bilinmeyen tarihçe modu: {mode}")
@@ -0,0 +1,152 @@
+# Uzun çalıştırmalarda da kare başına sabit maliyetli canlı çizgi grafiği.
+#  - Tarihçe deposu (history.py) artımlı okunur: her karede yalnızca yeni adımlar işlenir.
+#  - Min/max seyreltme: nokta sayısı eksenin piksel genişliğiyle sınırlıdır.
+#  - Blitting: eksenler, ızgara ve legend bir kez çizilip arka plan olarak saklanır,
+#    her karede yalnızca çizgiler yeniden çizilir. Eksen sınırları sadece veri taştığında büyütülür.
+
+
+#Bir serinin kovalar halinde min/max özeti. Kova sayısı sınırı aşınca komşu kovalar birleştirilir.
+class MinMaxDecimator:
+    def __init__(self, max_buckets):
+        self.max_buckets = max(2, int(max_buckets))
+        self.reset()
+
+    def reset(self):
+        self.bucket_size = 1
+        self._fill = 0               # son kovadaki nokta sayısı
+        self.min_x = []; self.min_y = []
+        self.max_x = []; self.max_y = []
+        self.low = None; self.high = None
+
+    def append(self, x, y):
+        if self.low is None or y < self.low: self.low = y
+        if self.high is None or y > self.high: self.high = y
+        if self._fill == 0 or self._fill >= self.bucket_size:
+            self.min_x.append(x); self.min_y.append(y); self.max_x.append(x); self.max_y.append(y)
+            self._fill = 1
+            if len(self.min_x) > self.max_buckets: self._merge()
+            return
+        self._fill += 1
+        if y < self.min_y[-1]: self.min_x[-1] = x; self.min_y[-1] = y
+        if y > self.max_y[-1]: self.max_x[-1] = x; self.max_y[-1] = y
+
+    def extend(self, xs, ys):
+        for x, y in zip(xs, ys): self.append(x, y)
+
+    def _merge(self):
+
+        # Komşu kova çiftlerini birleştirir; kova boyutu iki katına çıkar.
+
+        min_x, min_y, max_x, max_y = [], [], [], []
+        count = len(self.min_x)
+        for i in range(0, count - 1, 2):
+            j = i if self.min_y[i] <= self.min_y[i + 1] else i + 1
+            min_x.append(self.min_x[j]); min_y.append(self.min_y[j])
+            j = i if self.max_y[i] >= self.max_y[i + 1] else i + 1
+            max_x.append(self.max_x[j]); max_y.append(self.max_y[j])
+        if count % 2:
+            # Eşi olmayan son (yarım) kova olduğu gibi kalır
+            min_x.append(self.min_x[-1]); min_y.append(self.min_y[-1]); max_x.append(self.max_x[-1]); max_y.append(self.max_y[-1])
+        else:
+            self._fill += self.bucket_size
+        self.min_x, self.min_y, self.max_x, self.max_y = min_x, min_y, max_x, max_y
+        self.bucket_size *= 2
+
+    def points(self):
+
+        # Her kova için min ve max noktası, x sırasına göre.
+
+        xs, ys = [], []
+        for x0, y0, x1, y1 in zip(self.min_x, self.min_y, self.max_x, self.max_y):
+            if x0 <= x1: xs += (x0, x1); ys += (y0, y1)
+            else: xs += (x1, x0); ys += (y1, y0)
+        return xs, ys
+
+
+class BlitLiveChart:
+    def __init__(self, canvas, x_name, series, history=None, growth=1.5):
+
+        # series: [(Line2D, sütun adı), ...]; sütunlar history deposundan okunur.
+
+        self.canvas = canvas
+        self.figure = canvas.figure
+        self.x_name = x_name
+        self.series = series
+        self.names = [x_name] + [name for _, name in series]
+        self.history = history
+        self.growth = growth
+        self.axes = []
+        for line, _ in series:
+            line.set_animated(True)
+            if line.axes not in self.axes: self.axes.append(line.axes)
+        self._background = None
+        self._draw_cid = canvas.mpl_connect('draw_event', self._on_draw)
+        self.reset()
+
+    def set_history(self, history):
+        self.history = history
+        self.reset()
+
+    def _bucket_limit(self):
+        return max(int(min(ax.bbox.width for ax in self.axes)), 64)
+
+    def reset(self):
+        self._consumed = 0
+        self._last_x = None
+        self._decimators = [MinMaxDecimator(self._bucket_limit()) for _ in self.series]
+        for line, _ in self.series: line.set_data([], [])
+        self._limits_need_reset = True
+
+    def close(self):
+
+        # Normal (blitsiz) çizime dönüş.
+
+        self.canvas.mpl_disconnect(self._draw_cid)
+        for line, _ in self.series: line.set_animated(False)
+        self._background = None
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self):
+        for line, _ in self.series: line.axes.draw_artist(line)
+
+    def _grow_limits(self):
+
+        # Veri mevcut sınırları aştıysa sınırları geometrik olarak büyütür; değişiklik olduysa True.
+
+        changed = self._limits_need_reset
+        if changed:
+            for ax in self.axes: ax.set_xlim(0, 10); ax.set_ylim(0, 1)
+            self._limits_need_reset = False
+        if self._last_x is None: return changed
+        last_x = self._last_x
+        for ax in self.axes:
+            x_low, x_high = ax.get_xlim()
+            if last_x > x_high: ax.set_xlim(x_low, last_x * self.growth); changed = True
+            decimators = [d for (line, _), d in zip(self.series, self._decimators) if line.axes is ax and d.high is not None]
+            if not decimators: continue
+            low = min(d.low for d in decimators); high = max(d.high for d in decimators)
+            y_low, y_high = ax.get_ylim()
+            if high > y_high or low < y_low:
+                new_high = high * self.growth if high > y_high else y_high
+                new_low = min(y_low, low * self.growth if low < 0 else low)
+                ax.set_ylim(new_low, new_high); changed = True
+        return changed
+
+    def update(self):
+        if self.history is None: return
+        if self.history.appended < self._consumed: self.reset()
+        if self.history.appended > self._consumed:
+            self._consumed, (new_x, *new_columns) = self.history.read_since(self._consumed, self.names)
+            for (line, _), decimator, new_y in zip(self.series, self._decimators, new_columns):
+                decimator.extend(new_x, new_y)
+                line.set_data(*decimator.points())
+            if len(new_x): self._last_x = new_x[-1]
+        if self._grow_limits() or self._background is None:
+            self.canvas.draw()  # draw_event arka planı yeniden alır ve çizgileri çizer
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        self.canvas.blit(self.figure.bbox)
@@ -0,0 +1,157 @@
+import tkinter as tk
+from collections import namedtuple
+from tkinter import ttk
+
+
+# Büyük SRAM/DRAM tabloları için sanallaştırılmış hücre ızgarası.
+# Hücre başına widget yerine tek bir tk.Canvas kullanılır; hücre içerikleri sözlüklerde tutulur ve
+# yalnızca görünen penceredeki hücreler için dikdörtgen/metin öğesi çizilir. Kaydırma çubukları, fare
+# tekerleği ile kaydırma ve Ctrl+tekerlek ile yakınlaştırma desteklenir; milyonlarca hücrede de
+# çizim maliyeti pencere boyutuyla sınırlıdır.
+
+MIN_CELL_SIZE = 8
+MAX_CELL_SIZE = 48
+TEXT_MIN_CELL_SIZE = 20  # bundan küçük hücrelerde metin gösterilmez
+
+
+# FrameRenderer'ın widget yerine kullandığı hafif hücre tanıtıcısı (config / winfo_exists).
+# Aynı hücre için üretilen tanıtıcılar eşit olduğundan kare içindeki değişiklikler birleşir.
+class GridCell(namedtuple("GridCell", ["grid", "row", "col"])):
+    __slots__ = ()
+
+    def config(self, **options):
+        self.grid.set_cell(self.row, self.col, **options)
+
+    def winfo_exists(self):
+        return self.grid.winfo_exists()
+
+
+class VirtualGrid:
+    def __init__(self, parent, rows, cols, cell_size=36, max_width=480, max_height=360, bg="white"):
+        self.rows, self.cols = rows, cols
+        self.cell_size = cell_size
+        self.default_bg = bg
+        self._text = {}    # hücre -> metin
+        self._bg = {}      # hücre -> arka plan (yalnızca varsayılandan farklı olanlar)
+        self._items = {}   # görünen hücre -> (dikdörtgen, metin) öğe kimlikleri
+        self._view = None  # (ilk satır, son satır, ilk sütun, son sütun), son değerler hariç
+
+        self.frame = ttk.Frame(parent)
+        self.canvas = tk.Canvas(self.frame, bg="gray90", highlightthickness=0,
+                                width=min(cols * cell_size, max_width), height=min(rows * cell_size, max_height))
+        self.xscroll = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.yscroll = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(xscrollcommand=self._on_xscroll, yscrollcommand=self._on_yscroll)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.yscroll.grid(row=0, column=1, sticky="ns")
+        self.xscroll.grid(row=1, column=0, sticky="ew")
+        self.frame.rowconfigure(0, weight=1); self.frame.columnconfigure(0, weight=1)
+        self._update_scrollregion()
+
+        self.canvas.bind("<Configure>", lambda event: self.refresh())
+        self.canvas.bind("<MouseWheel>", lambda event: self._scroll(self.canvas.yview, -event.delta))
+        self.canvas.bind("<Shift-MouseWheel>", lambda event: self._scroll(self.canvas.xview, -event.delta))
+        self.canvas.bind("<Control-MouseWheel>", lambda event: self.zoom(1.25 if event.delta > 0 else 0.8))
+        self.canvas.bind("<Button-4>", lambda event: self._scroll(self.canvas.yview, -1))  # X11
+        self.canvas.bind("<Button-5>", lambda event: self._scroll(self.canvas.yview, 1))
+        self.canvas.bind("<Control-Button-4>", lambda event: self.zoom(1.25))
+        self.canvas.bind("<Control-Button-5>", lambda event: self.zoom(0.8))
+
+    # --- hücre içeriği ---
+    def cell(self, row, col):
+        return GridCell(self, row, col)
+
+    def set_cell(self, row, col, text=None, bg=None):
+        slot = row * self.cols + col
+        if text is not None:
+            if text: self._text[slot] = text
+            else: self._text.pop(slot, None)
+        if bg is not None:
+            if bg != self.default_bg: self._bg[slot] = bg
+            else: self._bg.pop(slot, None)
+        items = self._items.get(slot)
+        if items is not None:
+            if bg is not None: self.canvas.itemconfig(items[0], fill=bg)
+            if text is not None: self.canvas.itemconfig(items[1], text=self._visible_text(slot))
+
+    def cell_text(self, row, col):
+        return self._text.get(row * self.cols + col, "")
+
+    def cell_bg(self, row, col):
+        return self._bg.get(row * self.cols + col, self.default_bg)
+
+    def clear(self):
+        self._text.clear(); self._bg.clear()
+        self._redraw()
+
+    def winfo_exists(self):
+        return self.canvas.winfo_exists()
+
+    # --- görünen pencere ---
+    def _visible_text(self, slot):
+        return self._text.get(slot, "") if self.cell_size >= TEXT_MIN_CELL_SIZE else ""
+
+    def _on_xscroll(self, first, last):
+        self.xscroll.set(first, last); self.refresh()
+
+    def _on_yscroll(self, first, last):
+        self.yscroll.set(first, last); self.refresh()
+
+    def _scroll(self, view, delta):
+        view(tk.SCROLL, 1 if delta > 0 else -1, tk.UNITS)
+
+    def refresh(self):
+
+        # Görünen pencere değiştiyse pencereden çıkan hücrelerin öğelerini siler, girenleri çizer.
+
+        canvas = self.canvas; size = self.cell_size
+        left, top = canvas.canvasx(0), canvas.canvasy(0)
+        view = (max(0, int(top // size)), min(self.rows, int((top + canvas.winfo_height()) // size) + 1),
+                max(0, int(left // size)), min(self.cols, int((left + canvas.winfo_width()) // size) + 1))
+        if view == self._view: return
+        self._view = view
+        first_row, last_row, first_col, last_col = view
+        cols = self.cols
+        visible = {row * cols + col for row in range(first_row, last_row) for col in range(first_col, last_col)}
+        items = self._items
+        for slot in [slot for slot in items if slot not in visible]: canvas.delete(*items.pop(slot))
+        font = ("Arial", max(6, size // 4))
+        for slot in visible:
+            if slot in items: continue
+            row, col = divmod(slot, cols)
+            x, y = col * size, row * size
+            rect = canvas.create_rectangle(x + 1, y + 1, x + size - 1, y + size - 1, fill=self._bg.get(slot, self.default_bg), outline="black")
+            text = canvas.create_text(x + size / 2, y + size / 2, text=self._visible_text(slot), font=font)
+            items[slot] = (rect, text)
+
+    def _redraw(self):
+        self.canvas.delete(tk.ALL); self._items.clear(); self._view = None
+        self.refresh()
+
+    def _update_scrollregion(self):
+        self.canvas.configure(scrollregion=(0, 0, self.cols * self.cell_size, self.rows * self.cell_size))
+
+    def zoom(self, factor):
+
+        # Hücre boyutunu değiştirir; pencerenin sol üst köşesindeki hücre yerinde kalır.
+
+        size = max(MIN_CELL_SIZE, min(MAX_CELL_SIZE, int(round(self.cell_size * factor))))
+        if size == self.cell_size: return
+        x_fraction, y_fraction = self.canvas.xview()[0], self.canvas.yview()[0]
+        self.cell_size = size
+        self._update_scrollregion()
+        self.canvas.xview_moveto(x_fraction); self.canvas.yview_moveto(y_fraction)
+        self._redraw()
+
+    def see(self, row, col):
+
+        # Hücre görünmüyorsa pencereyi hücreyi ortalayacak şekilde kaydırır.
+
+        if self._view is not None:
+            first_row, last_row, first_col, last_col = self._view
+            if first_row <= row < last_row - 1 and first_col <= col < last_col - 1: return
+        canvas = self.canvas; size = self.cell_size
+        width, height = self.cols * size, self.rows * size
+        canvas.xview_moveto(max(0, (col + 0.5) * size - canvas.winfo_width() / 2) / width)
+        canvas.yview_moveto(max(0, (row + 0.5) * size - canvas.winfo_height() / 2) / height)
+        self.refresh()
@@ -0,0 +1,304 @@
+import random
+from collections import OrderedDict
+
+
+# SRAM yer değiştirme politikaları. Hepsi erişim başına O(1) (CLOCK amortize O(1)).
+# Ortak arayüz:
+#   access(key) -> (hit, evicted)  erişimi kaydeder; MISS'te anahtarı ekler, doluysa kurbanı çıkarır
+#   remove(key)                    anahtarı politikaya danışmadan çıkarır (geçersiz kılma, dışlayıcı önbellek)
+#   key in policy, len(policy), keys() (önbellekteki anahtarlar, önce çıkarılacaklar)
+#   get_state() / load_state(state)  anlık görüntü için düz veri (listeler, sayılar; snapshot.py)
+
+
+class ReplacementPolicy:
+    name = ""
+
+    def __init__(self, capacity):
+        if capacity < 1: raise ValueError("Kapasite en az 1 olmalı")
+        self.capacity = capacity
+
+    def access(self, key):
+        raise NotImplementedError
+
+    def remove(self, key):
+        raise NotImplementedError
+
+    def keys(self):
+        raise NotImplementedError
+
+    def get_state(self):
+        raise NotImplementedError
+
+    def load_state(self, state):
+        raise NotImplementedError
+
+    def __contains__(self, key):
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+
+class LRUPolicy(ReplacementPolicy):
+    name = "LRU"
+
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._order = OrderedDict()
+
+    def access(self, key):
+        order = self._order
+        if key in order:
+            order.move_to_end(key)
+            return True, None
+        evicted = order.popitem(last=False)[0] if len(order) >= self.capacity else None
+        order[key] = None
+        return False, evicted
+
+    def remove(self, key): del self._order[key]
+    def keys(self): return list(self._order)
+    def get_state(self): return {"order": list(self._order)}
+    def load_state(self, state): self._order = OrderedDict.fromkeys(state["order"])
+    def __contains__(self, key): return key in self._order
+    def __len__(self): return len(self._order)
+
+
+class FIFOPolicy(LRUPolicy):
+    name = "FIFO"
+
+    def access(self, key):
+        order = self._order
+        if key in order: return True, None
+        evicted = order.popitem(last=False)[0] if len(order) >= self.capacity else None
+        order[key] = None
+        return False, evicted
+
+
+class ClockPolicy(ReplacementPolicy):
+    name = "CLOCK"
+
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._slots = []          # saat kadranındaki anahtarlar
+        self._referenced = []     # ikinci şans (referans) bitleri
+        self._slot_of = {}
+        self._hand = 0
+
+    def access(self, key):
+        slot = self._slot_of.get(key)
+        if slot is not None:
+            self._referenced[slot] = True
+            return True, None
+        if len(self._slots) < self.capacity:
+            self._slot_of[key] = len(self._slots)
+            self._slots.append(key); self._referenced.append(True)
+            return False, None
+        referenced = self._referenced; hand = self._hand
+        while referenced[hand]:
+            referenced[hand] = False
+            hand = (hand + 1) % self.capacity
+        evicted = self._slots[hand]
+        del self._slot_of[evicted]
+        self._slots[hand] = key; referenced[hand] = True; self._slot_of[key] = hand
+        self._hand = (hand + 1) % self.capacity
+        return False, evicted
+
+    def remove(self, key):
+
+        # Boşalan yuvaya son yuva taşınır; kadran kapasiteye kadar yeniden dolar.
+
+        slot = self._slot_of.pop(key)
+        last_key = self._slots.pop(); last_referenced = self._referenced.pop()
+        if slot < len(self._slots):
+            self._slots[slot] = last_key; self._referenced[slot] = last_referenced; self._slot_of[last_key] = slot
+        if self._hand >= len(self._slots): self._hand = 0
+
+    def keys(self):
+        return self._slots[self._hand:] + self._slots[:self._hand]
+
+    def get_state(self):
+        return {"slots": list(self._slots), "referenced": list(self._referenced), "hand": self._hand}
+
+    def load_state(self, state):
+        self._slots = list(state["slots"]); self._referenced = [bool(bit) for bit in state["referenced"]]
+        self._slot_of = {key: slot for slot, key in enumerate(self._slots)}
+        self._hand = state["hand"]
+
+    def __contains__(self, key): return key in self._slot_of
+    def __len__(self): return len(self._slots)
+
+
+class LFUPolicy(ReplacementPolicy):
+    name = "LFU"
+
+    def __init__(self, capacity):
+
+        # Frekans kovaları: frekans -> anahtarlar (aynı frekansta en eski kullanılan önce çıkar).
+
+        super().__init__(capacity)
+        self._frequency = {}
+        self._buckets = {}
+        self._min_frequency = 0
+
+    def _bump(self, key):
+        frequency = self._frequency[key]
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency: self._min_frequency = frequency + 1
+        self._frequency[key] = frequency + 1
+        self._buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def access(self, key):
+        if key in self._frequency:
+            self._bump(key)
+            return True, None
+        evicted = None
+        if len(self._frequency) >= self.capacity:
+            if self._min_frequency not in self._buckets: self._min_frequency = min(self._buckets)  # remove() sonrası
+            bucket = self._buckets[self._min_frequency]
+            evicted = bucket.popitem(last=False)[0]
+            if not bucket: del self._buckets[self._min_frequency]
+            del self._frequency[evicted]
+        self._frequency[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_frequency = 1
+        return False, evicted
+
+    def remove(self, key):
+        frequency = self._frequency.pop(key)
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket: del self._buckets[frequency]
+
+    def keys(self):
+        return [key for frequency in sorted(self._buckets) for key in self._buckets[frequency]]
+
+    def get_state(self):
+        return {"buckets": [[frequency, list(bucket)] for frequency, bucket in self._buckets.items()], "min_frequency": self._min_frequency}
+
+    def load_state(self, state):
+        self._buckets = {frequency: OrderedDict.fromkeys(keys) for frequency, keys in state["buckets"]}
+        self._frequency = {key: frequency for frequency, keys in state["buckets"] for key in keys}
+        self._min_frequency = state["min_frequency"]
+
+    def __contains__(self, key): return key in self._frequency
+    def __len__(self): return len(self._frequency)
+
+
+class ARCPolicy(ReplacementPolicy):
+    name = "ARC"
+
+    def __init__(self, capacity):
+
+        # Adaptive Replacement Cache: T1 (bir kez görülen), T2 (sık görülen) ve bunların
+        # hayalet listeleri B1/B2. p, T1 için hedef boyuttur ve hayalet isabetlerine göre uyarlanır.
+
+        super().__init__(capacity)
+        self._t1, self._t2 = OrderedDict(), OrderedDict()
+        self._b1, self._b2 = OrderedDict(), OrderedDict()
+        self._p = 0
+
+    def _replace(self, key):
+        if self._t1 and (not self._t2 or len(self._t1) > self._p or (key in self._b2 and len(self._t1) == self._p)):
+            evicted = self._t1.popitem(last=False)[0]; self._b1[evicted] = None
+        else:
+            evicted = self._t2.popitem(last=False)[0]; self._b2[evicted] = None
+        return evicted
+
+    def access(self, key):
+        t1, t2, b1, b2, capacity = self._t1, self._t2, self._b1, self._b2, self.capacity
+        if key in t1:
+            del t1[key]; t2[key] = None
+            return True, None
+        if key in t2:
+            t2.move_to_end(key)
+            return True, None
+        evicted = None
+        if key in b1:
+            self._p = min(capacity, self._p + max(len(b2) // len(b1), 1))
+            if len(t1) + len(t2) >= capacity: evicted = self._replace(key)
+            del b1[key]; t2[key] = None
+            return False, evicted
+        if key in b2:
+            self._p = max(0, self._p - max(len(b1) // len(b2), 1))
+            if len(t1) + len(t2) >= capacity: evicted = self._replace(key)
+            del b2[key]; t2[key] = None
+            return False, evicted
+        l1 = len(t1) + len(b1)
+        if l1 == capacity:
+            if len(t1) < capacity:
+                b1.popitem(last=False)
+                if len(t1) + len(t2) >= capacity: evicted = self._replace(key)
+            else:
+                evicted = t1.popitem(last=False)[0]
+        elif l1 < capacity and l1 + len(t2) + len(b2) >= capacity:
+            if l1 + len(t2) + len(b2) == 2 * capacity: b2.popitem(last=False)
+            if len(t1) + len(t2) >= capacity: evicted = self._replace(key)
+        t1[key] = None
+        return False, evicted
+
+    def remove(self, key):
+        if key in self._t1: del self._t1[key]
+        else: del self._t2[key]
+
+    def keys(self): return list(self._t1) + list(self._t2)
+
+    def get_state(self):
+        return {"t1": list(self._t1), "t2": list(self._t2), "b1": list(self._b1), "b2": list(self._b2), "p": self._p}
+
+    def load_state(self, state):
+        self._t1, self._t2 = OrderedDict.fromkeys(state["t1"]), OrderedDict.fromkeys(state["t2"])
+        self._b1, self._b2 = OrderedDict.fromkeys(state["b1"]), OrderedDict.fromkeys(state["b2"])
+        self._p = state["p"]
+    def __contains__(self, key): return key in self._t1 or key in self._t2
+    def __len__(self): return len(self._t1) + len(self._t2)
+
+
+class RandomPolicy(ReplacementPolicy):
+    name = "RANDOM"
+
+    def __init__(self, capacity, seed=0):
+        super().__init__(capacity)
+        self._keys = []
+        self._index = {}
+        self._random = random.Random(seed)
+
+    def access(self, key):
+        if key in self._index: return True, None
+        if len(self._keys) < self.capacity:
+            self._index[key] = len(self._keys); self._keys.append(key)
+            return False, None
+        slot = self._random.randrange(self.capacity)
+        evicted = self._keys[slot]
+        del self._index[evicted]
+        self._keys[slot] = key; self._index[key] = slot
+        return False, evicted
+
+    def remove(self, key):
+        slot = self._index.pop(key)
+        last_key = self._keys.pop()
+        if slot < len(self._keys): self._keys[slot] = last_key; self._index[last_key] = slot
+
+    def keys(self): return list(self._keys)
+
+    def get_state(self):
+        version, internal, gauss = self._random.getstate()
+        return {"keys": list(self._keys), "random": [version, list(internal), gauss]}
+
+    def load_state(self, state):
+        self._keys = list(state["keys"]); self._index = {key: slot for slot, key in enumerate(self._keys)}
+        version, internal, gauss = state["random"]
+        self._random.setstate((version, tuple(internal), gauss))
+
+    def __contains__(self, key): return key in self._index
+    def __len__(self): return len(self._keys)
+
+
+POLICIES = {policy.name: policy for policy in (LRUPolicy, FIFOPolicy, ClockPolicy, LFUPolicy, ARCPolicy, RandomPolicy)}
+
+
+def make_policy(name, capacity):
+    try: return POLICIES[name.upper()](capacity)
+    except KeyError: raise ValueError(f"Bilinmeyen politika: {name} (seçenekler: {', '.join(POLICIES)})") from None
@@ -0,0 +1,128 @@
+import json
+import time
+from collections import deque
+
+
+# Sıcak yol evrelerinin perf_counter_ns ile ölçümü.
+# Ölçülecek metotlar instrument() ile kaydedilir; profil açıldığında nesne üzerindeki metot zamanlayıcılı bir
+# sarmalayıcıyla değiştirilir, kapatıldığında asıl metot geri konur. Böylece kapalıyken hiçbir ek maliyet yoktur.
+# İç içe evrelerde histogramlar öz süreyi (alt evreler hariç) tutar; Chrome trace'e ise toplam süre yazılır.
+# Her evre için son `window` ölçüm saklanır (kayan pencere), yüzdelikler istendiğinde hesaplanır.
+
+DEFAULT_WINDOW = 2048
+DEFAULT_TRACE_EVENTS = 200000
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class PhaseProfiler:
+    def __init__(self, window=DEFAULT_WINDOW, max_trace_events=DEFAULT_TRACE_EVENTS, clock=time.perf_counter_ns):
+        self.window = window
+        self.clock = clock
+        self.enabled = False
+        self._targets = []        # (nesne, metot adı, evre)
+        self._originals = []      # etkinken: (nesne, metot adı, örnekte tanımlı mıydı, asıl değer)
+        self._stack = []          # iç içe çağrılarda alt evrelerin toplam süresi
+        self.trace = deque(maxlen=max_trace_events)  # (evre, başlangıç ns, süre ns)
+        self.reset()
+
+    def reset(self):
+        self.samples = {}         # evre -> deque(öz süre ns)
+        self.counts = {}
+        self.totals = {}          # evre -> toplam öz süre ns
+        self.trace.clear()
+        self.origin = self.clock()
+
+    # --- ölçülecek yerler ---
+    def instrument(self, obj, name, phase=None):
+        self._targets.append((obj, name, phase or name))
+        if self.enabled: self._patch(obj, name, phase or name)
+
+    def _patch(self, obj, name, phase):
+        own = name in getattr(obj, "__dict__", {})
+        original = getattr(obj, name)
+        self._originals.append((obj, name, own, original))
+        setattr(obj, name, self.wrap(original, phase))
+
+    def enable(self):
+        if self.enabled: return
+        self.enabled = True
+        for obj, name, phase in self._targets: self._patch(obj, name, phase)
+
+    def disable(self):
+        if not self.enabled: return
+        self.enabled = False
+        for obj, name, own, original in reversed(self._originals):
+            if own: setattr(obj, name, original)
+            else: delattr(obj, name)
+        self._originals.clear(); self._stack.clear()
+
+    def wrap(self, function, phase):
+        clock = self.clock; stack = self._stack; record = self.record
+
+        def timed(*args, **kwargs):
+            stack.append(0)
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                duration = clock() - start
+                children = stack.pop()
+                if stack: stack[-1] += duration
+                record(phase, start, duration, duration - children)
+
+        return timed
+
+    def record(self, phase, start, duration, self_time=None):
+        samples = self.samples.get(phase)
+        if samples is None:
+            samples = self.samples[phase] = deque(maxlen=self.window)
+            self.counts[phase] = 0; self.totals[phase] = 0
+        if self_time is None: self_time = duration
+        samples.append(self_time)
+        self.counts[phase] += 1
+        self.totals[phase] += self_time
+        self.trace.append((phase, start, duration))
+
+    # --- özet ve dışa aktarma ---
+    def summary(self):
+
+        # {evre: {count, total_ms, mean_us, p50_us, p95_us, p99_us, max_us}}; yüzdelikler son `window` ölçümden.
+
+        result = {}
+        for phase, samples in self.samples.items():
+            if not samples: continue
+            ordered = sorted(samples)
+            result[phase] = {
+                "count": self.counts[phase],
+                "total_ms": self.totals[phase] / 1e6,
+                "mean_us": sum(ordered) / len(ordered) / 1e3,
+                "p50_us": _percentile(ordered, 0.50) / 1e3,
+                "p95_us": _percentile(ordered, 0.95) / 1e3,
+                "p99_us": _percentile(ordered, 0.99) / 1e3,
+                "max_us": ordered[-1] / 1e3,
+            }
+        return result
+
+    def status_text(self, limit=4):
+
+        # Durum çubuğu için toplam öz süreye göre en pahalı evreler.
+
+        summary = self.summary()
+        phases = sorted(summary, key=lambda phase: self.totals[phase], reverse=True)[:limit]
+        return " | ".join(f"{phase} p50 {summary[phase]['p50_us']:.1f} / p95 {summary[phase]['p95_us']:.1f} / "
+                          f"p99 {summary[phase]['p99_us']:.1f} µs" for phase in phases)
+
+    def export_json(self, path):
+        with open(path, "w", encoding="utf-8") as f: json.dump({"window": self.window, "phases": self.summary()}, f, indent=2)
+
+    def export_chrome_trace(self, path):
+
+        # chrome://tracing veya Perfetto ile açılabilen "complete" (ph=X) olayları; zamanlar µs.
+
+        origin = self.origin
+        events = [{"name": phase, "ph": "X", "pid": 1, "tid": 1, "ts": (start - origin) / 1e3, "dur": duration / 1e3}
+                  for phase, start, duration in self.trace]
+        with open(path, "w", encoding="utf-8") as f: json.dump({"traceEvents": events, "displayTimeUnit": "ns"}, f)
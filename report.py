@@ -0,0 +1,150 @@
+import base64
+import html
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from stack_distance import capacity_points
+
+
+# Simülasyon sonu raporu. Son toplamlar (gecikme, erişim/yenileme enerjisi, HIT/MISS, kaçırma oranı eğrisi)
+# collect_report ile bir kez hesaplanır; figür pyplot ve Tk kullanılmadan Agg ile çizildiğinden ayrı bir
+# iş parçacığında oluşturulabilir. ReportCache aynı simülasyon durumu için hesaplanan toplamları ve
+# çizimleri saklar: rapor yeniden açıldığında figür tekrar kurulmaz.
+#   png / svg : rapor figürü
+#   json      : makinece okunabilir toplamlar
+#   html      : toplam tablosu ve gömülü PNG figür
+
+REPORT_FORMATS = ("png", "svg", "json", "html")
+DISPLAY_DPI = 64   # arayüz penceresi (24x6 inç figür ~1536x384 piksel)
+EXPORT_DPI = 150
+
+
+def collect_report(totals, mrc_analyzer, sram_capacity):
+
+    # SimEngine.totals() ve kaçırma oranı analizcisinden rapor verisini (JSON'a yazılabilir sözlük) oluşturur.
+
+    curve = mrc_analyzer.curve(capacity_points(max(2 * sram_capacity, mrc_analyzer.distinct_keys)))
+    steps = totals["steps"]
+    return {
+        "totals": dict(totals),
+        "sram_capacity": sram_capacity,
+        "latency": {"sram": totals["sram_delay"], "dram": totals["dram_delay"]},
+        "energy": {"sram": totals["sram_energy"], "dram_access": totals["dram_energy"],
+                   "dram_refresh": totals["dram_refresh_energy"], "dram_total": totals["dram_energy"] + totals["dram_refresh_energy"]},
+        "accesses": {"hits": totals["sram_hits"], "misses": totals["dram_misses"],
+                     "hit_ratio": totals["sram_hits"] / steps if steps else 0.0},
+        "miss_ratio_curve": {"capacities": curve.capacities, "miss_ratios": curve.miss_ratios()},
+    }
+
+
+def build_report_figure(report):
+    sram_capacity = report["sram_capacity"]
+    final_sram_delay, final_dram_delay = report["latency"]["sram"], report["latency"]["dram"]
+    energy = report["energy"]
+    final_sram_energy, final_dram_energy, final_refresh_energy, final_total_dram_energy = energy["sram"], energy["dram_access"], energy["dram_refresh"], energy["dram_total"]
+    final_sram_access, final_dram_access = report["accesses"]["hits"], report["accesses"]["misses"]
+    fig = Figure(figsize=(24, 6)); axes = fig.subplots(1, 4); fig.suptitle("Bellek Performans Karşılaştırması (Simülasyon Sonu)", fontsize=14)
+    axes[0].bar(['SRAM', 'DRAM'], [final_sram_delay, final_dram_delay], color=['blue','goldenrod']); axes[0].set_ylabel("Toplam Birikimli Gecikme (ns)"); axes[0].set_title("Toplam Gecikme")
+    max_delay = max(final_sram_delay, final_dram_delay, 1)
+    for i, v in enumerate([final_sram_delay, final_dram_delay]): axes[0].text(i, v + 0.01 * max_delay, f"{v:.0f}", ha='center', va='bottom')
+    axes[0].set_ylim(bottom=0)
+    max_energy_for_scale = max(final_sram_energy, final_total_dram_energy, 1); axes[1].bar(['SRAM', 'DRAM Toplam'], [final_sram_energy, final_total_dram_energy], color=['deepskyblue', 'gold']); axes[1].set_ylabel("Toplam Enerji (pJ)"); axes[1].set_title("Toplam Enerji Tüketimi")
+    if final_dram_energy > 0.05 * max_energy_for_scale : axes[1].text(1, final_dram_energy / 2, f"Erişim\n{final_dram_energy:.1f} pJ", ha='center', va='center', color='black', weight='bold', fontsize='x-small')
+    if final_refresh_energy > 0.05 * max_energy_for_scale: axes[1].text(1, final_dram_energy + final_refresh_energy / 2, f"Refresh\n{final_refresh_energy:.1f} pJ", ha='center', va='center', color='black', weight='bold', fontsize='x-small')
+    axes[1].set_ylim(bottom=0); axes[1].text(0, final_sram_energy + 0.01 * max_energy_for_scale, f"{final_sram_energy:.1f}", ha='center', va='bottom'); axes[1].text(1, final_total_dram_energy + 0.01 * max_energy_for_scale, f"Toplam:{final_total_dram_energy:.1f}", ha='center', va='bottom', fontsize='small')
+    axes[2].bar(['SRAM (HIT)', 'DRAM (MISS)'], [final_sram_access, final_dram_access], color=['lightskyblue','khaki']); axes[2].set_ylabel("Toplam Erişim Sayısı"); axes[2].set_title("Erişim Sayısı (HIT/MISS)")
+    max_access = max(final_sram_access, final_dram_access, 1)
+    for i, v in enumerate([final_sram_access, final_dram_access]): axes[2].text(i, v + 0.01 * max_access, str(v), ha='center', va='bottom')
+    axes[2].set_ylim(bottom=0)
+    capacities, miss_ratios = report["miss_ratio_curve"]["capacities"], report["miss_ratio_curve"]["miss_ratios"]
+    axes[3].plot(capacities, miss_ratios, color='purple', marker='.'); axes[3].set_xlabel("SRAM Kapasitesi (hücre)"); axes[3].set_ylabel("Kaçırma Oranı"); axes[3].set_title("Kaçırma Oranı Eğrisi (LRU)")
+    if sram_capacity in capacities: axes[3].axvline(sram_capacity, color='gray', linestyle='--'); axes[3].plot([sram_capacity], [miss_ratios[capacities.index(sram_capacity)]], 'o', color='red', label=f"Mevcut ({sram_capacity})"); axes[3].legend()
+    axes[3].set_ylim(0, 1.05); axes[3].grid(True, linestyle='--')
+    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
+    return fig
+
+
+# --- çizim ve dışa aktarma (Tk'sız; her iş parçacığında çağrılabilir) ---
+def render_figure(report, fmt="png", dpi=EXPORT_DPI):
+    buffer = io.BytesIO()
+    FigureCanvasAgg(build_report_figure(report)).print_figure(buffer, format=fmt, dpi=dpi)
+    return buffer.getvalue()
+
+
+def report_json(report):
+    return json.dumps(report, indent=2, ensure_ascii=False)
+
+
+def report_html(report, png=None):
+
+    # Tek dosyalık HTML: toplam tablosu ve (verilmezse çizilen) PNG figür base64 olarak gömülü.
+
+    if png is None: png = render_figure(report, "png")
+    rows = "\n".join(f"<tr><th>{html.escape(str(name))}</th><td>{html.escape(f'{value:g}' if isinstance(value, float) else str(value))}</td></tr>"
+                     for name, value in report["totals"].items())
+    image = base64.b64encode(png).decode("ascii")
+    return (f"<!DOCTYPE html>\n<html lang=\"tr\">\n<head><meta charset=\"utf-8\"><title>Nihai Performans Raporu</title></head>\n<body>\n"
+            f"<h1>Nihai Performans Raporu</h1>\n<img src=\"data:image/png;base64,{image}\" style=\"max-width:100%\">\n"
+            f"<table border=\"1\" cellpadding=\"4\">\n{rows}\n</table>\n"
+            f"<script type=\"application/json\" id=\"report\">{html.escape(report_json(report), quote=False)}</script>\n</body>\n</html>\n")
+
+
+def report_format(path):
+    fmt = os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt not in REPORT_FORMATS: raise ValueError(f"Desteklenmeyen rapor biçimi: {path} (seçenekler: {', '.join(REPORT_FORMATS)})")
+    return fmt
+
+
+def export_report(report, path, png=None):
+
+    # Biçim dosya uzantısından seçilir; önceden çizilmiş png verilirse PNG/HTML için yeniden çizilmez.
+
+    fmt = report_format(path)
+    if fmt == "json": data = report_json(report).encode("utf-8")
+    elif fmt == "html": data = report_html(report, png).encode("utf-8")
+    elif fmt == "png" and png is not None: data = png
+    else: data = render_figure(report, fmt)
+    with open(path, "wb") as f: f.write(data)
+    return path
+
+
+class ReportCache:
+
+    # Simülasyon durumu (key) değişmedikçe rapor verisi ve çizimler yeniden kullanılır.
+    # Çizim ve dışa aktarma tek işçili bir iş parçacığı havuzunda yapılır; sonuçlar Future olarak döner.
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report")
+        self.clear()
+
+    def clear(self):
+        self.key = None
+        self.report = None
+        self._renders = {}   # (biçim, dpi) -> Future(bytes)
+
+    def get(self, key, collect):
+        if key != self.key or self.report is None:
+            self.clear()
+            self.report = collect()
+            self.key = key
+        return self.report
+
+    def render(self, fmt="png", dpi=EXPORT_DPI):
+        future = self._renders.get((fmt, dpi))
+        if future is None or (future.done() and future.exception() is not None):
+            future = self._renders[(fmt, dpi)] = self._executor.submit(render_figure, self.report, fmt, dpi)
+        return future
+
+    def export(self, path):
+        report_format(path)  # geçersiz uzantı hemen bildirilir
+        cached = self._renders.get(("png", EXPORT_DPI))
+        png = cached.result() if cached is not None and cached.done() and cached.exception() is None else None
+        return self._executor.submit(export_report, self.report, path, png)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
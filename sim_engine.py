@@ -0,0 +1,376 @@
+from array import array
+from collections import namedtuple
+from itertools import islice
+
+from dram_model import DRAMModel
+from policies import make_policy
+
+
+# Tek bir erişimin sonucu. Arayüz ve betikler bu kompakt kaydı kullanır.
+#   hit            : SRAM'de bulunduysa True
+#   sram_pos       : verinin SRAM'deki (satır, sütun) konumu
+#   dram_pos       : MISS durumunda verinin DRAM'deki konumu (HIT'te None)
+#   dram_new       : veri DRAM'e ilk kez yazıldıysa True
+#   evicted        : SRAM dolu olduğu için politikanın çıkardığı anahtar (yoksa None)
+StepResult = namedtuple("StepResult", [
+    "step", "key", "hit", "sram_pos", "dram_pos", "dram_new", "evicted",
+    "sram_delay", "sram_energy", "dram_delay", "dram_energy", "refresh_energy",
+])
+
+
+class SimulationError(Exception):
+    pass
+
+
+# Sabit kapasiteli hücre havuzu (satır-öncelikli hücre numaraları). Serbest bırakılan hücreler bir
+# yığında (free list) tutulur, hiç kullanılmamış hücreler sırayla verilir; allocate/release O(1).
+class SlotAllocator:
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.free = []
+        self.next_unused = 0
+
+    def allocate(self):
+
+        # Boş hücre numarası; havuz doluysa None.
+
+        if self.free: return self.free.pop()
+        if self.next_unused >= self.capacity: return None
+        self.next_unused += 1
+        return self.next_unused - 1
+
+    def release(self, slot):
+        self.free.append(slot)
+
+    def __len__(self):
+        return self.next_unused - len(self.free)
+
+
+DRAM_MODELS = ("flat", "event")
+
+# Anlık görüntüye (snapshot.py) yazılan sayaçlar
+ENGINE_COUNTERS = ("step_count", "sram_access_count", "dram_access_count", "sram_write_count", "total_sram_delay",
+                   "total_dram_delay", "total_sram_energy", "total_dram_energy", "total_dram_refresh_energy", "time")
+ENGINE_CONFIG = ("sram_rows", "sram_cols", "dram_rows", "dram_cols", "sram_access_delay", "dram_access_delay",
+                 "sram_read_energy", "sram_write_energy", "dram_read_energy", "dram_write_energy", "dram_refresh_energy",
+                 "dram_refresh_interval", "dram_model", "dram_banks", "dram_timing")
+
+
+# Sayısal parametre denetimi: (ad, tamsayı mı, en küçük değer). Geçersiz değerler (örn. taramada 0 yenileme
+# aralığı ya da "5" gibi bir metin) çalıştırma ortasında değil, motor kurulurken ValueError verir.
+ENGINE_LIMITS = (("sram_rows", True, 1), ("sram_cols", True, 1), ("dram_rows", True, 1), ("dram_cols", True, 1),
+                 ("sram_access_delay", False, 0), ("dram_access_delay", False, 0),
+                 ("sram_read_energy", False, 0), ("sram_write_energy", False, 0), ("dram_read_energy", False, 0),
+                 ("dram_write_energy", False, 0), ("dram_refresh_energy", False, 0),
+                 ("dram_refresh_interval", True, 1), ("dram_banks", True, 1))
+
+
+def _check_parameter(name, value, integer, minimum):
+    kinds = int if integer else (int, float)
+    if isinstance(value, bool) or not isinstance(value, kinds):
+        raise ValueError(f"{name} {'bir tamsayı' if integer else 'bir sayı'} olmalı: {value!r}")
+    if not value >= minimum: raise ValueError(f"{name} en az {minimum} olmalı: {value!r}")  # NaN da reddedilir
+
+
+#Tk'dan bağımsız SRAM/DRAM simülasyon motoru (yer değiştirme politikası, sayaçlar, enerji/gecikme hesabı).
+class SimEngine:
+    def __init__(self, sram_rows=3, sram_cols=3, dram_rows=6, dram_cols=6,
+                 sram_access_delay=5, dram_access_delay=50,
+                 sram_read_energy=0.5, sram_write_energy=0.6,
+                 dram_read_energy=2.0, dram_write_energy=2.2, dram_refresh_energy=3.0,
+                 dram_refresh_interval=10, policy="LRU",
+                 dram_model="flat", dram_banks=8, dram_timing=None):
+        arguments = locals()
+        for name, integer, minimum in ENGINE_LIMITS: _check_parameter(name, arguments[name], integer, minimum)
+        if dram_timing is not None and not isinstance(dram_timing, dict): raise ValueError(f"dram_timing bir sözlük olmalı: {dram_timing!r}")
+
+        # --- Tablo Bellek Ayarları ---
+        self.sram_rows, self.sram_cols = sram_rows, sram_cols
+        self.sram_capacity = self.sram_rows * self.sram_cols
+        self.dram_rows, self.dram_cols = dram_rows, dram_cols
+        self.dram_capacity = self.dram_rows * self.dram_cols
+
+        # --- Gecikme Değerleri (ns) ---
+        self.sram_access_delay = sram_access_delay
+        self.dram_access_delay = dram_access_delay
+
+        # --- Enerji Değerleri (pJ) ---
+        self.sram_read_energy = sram_read_energy
+        self.sram_write_energy = sram_write_energy
+        self.dram_read_energy = dram_read_energy
+        self.dram_write_energy = dram_write_energy
+        self.dram_refresh_energy = dram_refresh_energy
+
+        # --- DRAM Yenileme Ayarları ---
+        self.dram_refresh_interval = dram_refresh_interval
+
+        # --- DRAM Zamanlama Modeli ---
+        # flat : her MISS dram_access_delay sürer, her dram_refresh_interval adımda bir yenileme
+        # event: bankalar, açık satır tamponları ve tREFI ile zamanlanan yenilemeler (dram_model.DRAMModel);
+        #        dram_timing, DRAMModel parametrelerini (t_cas, t_refi, max_outstanding...) değiştirir
+        if dram_model not in DRAM_MODELS: raise ValueError(f"Bilinmeyen DRAM modeli: {dram_model} (seçenekler: {', '.join(DRAM_MODELS)})")
+        self.dram_model = dram_model
+        self.dram_banks = dram_banks
+        self.dram_timing = dict(dram_timing or {})
+
+        # --- SRAM Yer Değiştirme Politikası (policies.POLICIES) ---
+        self.policy_name = policy
+
+        self._listeners = []
+        self.reset()
+
+    def reset(self):
+
+        # Önbelleği, konum haritalarını ve tüm sayaçları sıfırlar.
+
+        self.policy = make_policy(self.policy_name, self.sram_capacity)
+        self.policy_name = self.policy.name
+        self.sram_visual_map = {}
+        self.dram_visual_map = {}
+        self.step_count = 0
+        self.sram_access_count = 0
+        self.dram_access_count = 0
+        self.sram_write_count = 0
+        self.total_sram_delay = 0
+        self.total_dram_delay = 0
+        self.total_sram_energy = 0
+        self.total_dram_energy = 0
+        self.total_dram_refresh_energy = 0
+        self.time = 0  # simülasyon zamanı (ns)
+        self.dram = None
+        if self.dram_model == "event":
+            self.dram = DRAMModel(banks=self.dram_banks, read_energy=self.dram_read_energy, write_energy=self.dram_write_energy,
+                                  refresh_energy=self.dram_refresh_energy, **self.dram_timing)
+        self._sram_slots = SlotAllocator(self.sram_capacity)
+        self._dram_slots = SlotAllocator(self.dram_capacity)
+        self._dram_released = 0  # DRAM konum haritasından silinen anahtar sayısı (fark görüntüleri için)
+
+    # --- abonelik ---
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners: self._listeners.remove(callback)
+
+    # --- tek erişim ---
+    def access(self, key):
+        sram_map = self.sram_visual_map
+        if key in sram_map:
+            self.sram_access_count += 1
+            self.policy.access(key)
+            hit, sram_pos, dram_pos, dram_new, evicted = True, sram_map[key], None, False, None
+            sram_delay, sram_energy, dram_delay, dram_energy = self.sram_access_delay, self.sram_read_energy, 0, 0
+        else:
+            dram_pos = self.dram_visual_map.get(key)
+            dram_new = dram_pos is None
+            if dram_new:
+                slot = self._dram_slots.allocate()
+                if slot is None: raise SimulationError("DRAM görsel alanı doldu!")
+                dram_pos = divmod(slot, self.dram_cols)
+                self.dram_visual_map[key] = dram_pos
+            self.dram_access_count += 1
+            if self.dram is None:
+                dram_delay, dram_energy = self.dram_access_delay, self.dram_read_energy
+            else:
+                # Tamsayı anahtarlar adrestir; diğerleri (yazılan karakterler) için DRAM hücre numarası (ilk erişim sırası)
+                address = key if isinstance(key, int) else dram_pos[0] * self.dram_cols + dram_pos[1]
+                issue_time, done, dram_energy, refresh_energy, _ = self.dram.access(address, self.time)
+                dram_delay = done - self.time  # kuyruk beklemesi dahil
+            evicted = self.policy.access(key)[1]
+            if evicted is not None:
+                sram_pos = sram_map.pop(evicted)
+            else:
+                sram_pos = divmod(self._sram_slots.allocate(), self.sram_cols)
+            sram_map[key] = sram_pos
+            self.sram_write_count += 1
+            hit = False
+            sram_delay, sram_energy = 0, self.sram_write_energy
+
+        self.step_count += 1
+        if self.dram is None:
+            # Sıralı işlemci: adım, gecikmesi kadar sürer
+            self.time += sram_delay + dram_delay
+            refresh_energy = 0
+            if self.step_count % self.dram_refresh_interval == 0: refresh_energy = self.dram_refresh_energy
+        else:
+            # Her adım bir SRAM araması sürer; MISS'ler DRAM'de arka planda tamamlanır (kuyruk doluysa beklenir)
+            if hit: issue_time = self.time; refresh_energy = self.dram.advance(self.time)
+            self.time = issue_time + self.sram_access_delay
+        self.total_dram_refresh_energy += refresh_energy
+        self.total_sram_delay += sram_delay
+        self.total_dram_delay += dram_delay
+        self.total_sram_energy += sram_energy
+        self.total_dram_energy += dram_energy
+
+        result = StepResult(self.step_count, key, hit, sram_pos, dram_pos, dram_new, evicted,
+                            sram_delay, sram_energy, dram_delay, dram_energy, refresh_energy)
+        for callback in self._listeners: callback(result)
+        return result
+
+    # --- geçersiz kılma ---
+    def invalidate(self, key, release_dram=False):
+
+        # Anahtarı SRAM'den politikaya danışmadan çıkarır ve hücresini serbest bırakır; release_dram=True
+        # iken DRAM hücresi de boşalır (veri silinmiş sayılır). (sram_pos, dram_pos) döndürür; boşalmayan taraf None.
+
+        sram_pos = self.sram_visual_map.pop(key, None)
+        if sram_pos is not None:
+            self.policy.remove(key)
+            self._sram_slots.release(sram_pos[0] * self.sram_cols + sram_pos[1])
+        dram_pos = self.dram_visual_map.pop(key, None) if release_dram else None
+        if dram_pos is not None: self._dram_slots.release(dram_pos[0] * self.dram_cols + dram_pos[1]); self._dram_released += 1
+        return sram_pos, dram_pos
+
+    # --- toplu çalıştırma ---
+    def run(self, keys):
+
+        # Erişim akışını sonuna kadar işler ve son toplamları döndürür.
+        # Abone yoksa StepResult üretmeyen hızlı döngü kullanılır.
+
+        if self._listeners or self.dram is not None:
+            for key in keys: self.access(key)
+            return self.totals()
+
+        sram_map = self.sram_visual_map; dram_map = self.dram_visual_map
+        policy_access = self.policy.access; pop = sram_map.pop
+        dram_capacity = self.dram_capacity
+        sram_cols = self.sram_cols; dram_cols = self.dram_cols
+        sram_free = self._sram_slots.free; dram_free = self._dram_slots.free
+        sram_next = self._sram_slots.next_unused; dram_next = self._dram_slots.next_unused
+        hits = 0; misses = 0
+        try:
+            for key in keys:
+                if key in sram_map:
+                    hits += 1
+                    policy_access(key)
+                    continue
+                if key not in dram_map:
+                    if dram_free: dram_map[key] = divmod(dram_free.pop(), dram_cols)
+                    elif dram_next < dram_capacity: dram_map[key] = divmod(dram_next, dram_cols); dram_next += 1
+                    else: raise SimulationError("DRAM görsel alanı doldu!")
+                misses += 1
+                evicted = policy_access(key)[1]
+                if evicted is not None:
+                    sram_map[key] = pop(evicted)
+                elif sram_free:
+                    sram_map[key] = divmod(sram_free.pop(), sram_cols)
+                else:
+                    sram_map[key] = divmod(sram_next, sram_cols); sram_next += 1
+        finally:
+            self._commit_batch(hits, misses, sram_next, dram_next)
+        return self.totals()
+
+    def _commit_batch(self, hits, misses, sram_next, dram_next):
+
+        # Hızlı döngüde yerel tutulan sayaçları motor durumuna yazar.
+
+        interval = self.dram_refresh_interval
+        start = self.step_count
+        self.step_count = start + hits + misses
+        self._sram_slots.next_unused = sram_next; self._dram_slots.next_unused = dram_next
+        self.sram_access_count += hits
+        self.dram_access_count += misses
+        self.sram_write_count += misses
+        self.total_sram_delay += hits * self.sram_access_delay
+        self.total_dram_delay += misses * self.dram_access_delay
+        self.time += hits * self.sram_access_delay + misses * self.dram_access_delay
+        self.total_sram_energy += hits * self.sram_read_energy + misses * self.sram_write_energy
+        self.total_dram_energy += misses * self.dram_read_energy
+        self.total_dram_refresh_energy += (self.step_count // interval - start // interval) * self.dram_refresh_energy
+
+    # --- durum kaydı ve geri yükleme (snapshot.py) ---
+    def config(self):
+        config = {name: getattr(self, name) for name in ENGINE_CONFIG}
+        config["policy"] = self.policy_name
+        return config
+
+    def get_state(self, dram_from=0):
+
+        # Motor durumunu düz veri olarak döndürür (listeler, sayılar, array'ler; snapshot.py).
+        # Konumlar satır-öncelikli hücre numarası olarak yazılır. DRAM konum haritası eklenme sırasını korur ve
+        # yalnızca büyür; dram_from'dan önceki girdiler yazılmaz (fark kaydı).
+
+        sram_cols, dram_cols = self.sram_cols, self.dram_cols
+        dram_items = list(islice(self.dram_visual_map.items(), dram_from, None))
+        return {
+            "counters": [getattr(self, name) for name in ENGINE_COUNTERS],
+            "dram_shape": [self.dram_rows, self.dram_cols, self.dram_model],
+            "policy_name": self.policy_name, "sram_capacity": self.sram_capacity, "sram_cols": sram_cols,
+            "policy": self.policy.get_state(),
+            "sram_keys": list(self.sram_visual_map),
+            "sram_cells": array("q", [row * sram_cols + col for row, col in self.sram_visual_map.values()]),
+            "sram_slots": [self._sram_slots.next_unused, array("q", self._sram_slots.free)],
+            "dram_slots": [self._dram_slots.next_unused, array("q", self._dram_slots.free)],
+            "dram_keys": [key for key, _ in dram_items],
+            "dram_cells": array("q", [row * dram_cols + col for _, (row, col) in dram_items]),
+            "dram_released": self._dram_released,
+            "dram": self.dram.get_state() if self.dram is not None else None,
+        }
+
+    def set_state(self, state, dram_keys, dram_cells):
+
+        # get_state çıktısını geri yükler; dram_keys/dram_cells tüm DRAM konumlarıdır (fark zincirinden birleştirilmiş).
+        # Politika veya SRAM boyutu farklıysa önbellek anahtarları çıkarılma sırasıyla yeni politikaya yerleştirilir
+        # (en son kullanılanlar kalır); gecikme/enerji/yenileme ayarları motorun kendi değerleridir.
+
+        if list(state["dram_shape"]) != [self.dram_rows, self.dram_cols, self.dram_model]:
+            raise ValueError("Anlık görüntü farklı bir DRAM boyutu/modeli ile alınmış")
+        for name, value in zip(ENGINE_COUNTERS, state["counters"]): setattr(self, name, value)
+        saved_policy = make_policy(state["policy_name"], state["sram_capacity"]); saved_policy.load_state(state["policy"])
+        if saved_policy.name == self.policy_name.upper() and (state["sram_capacity"], state["sram_cols"]) == (self.sram_capacity, self.sram_cols):
+            self.policy = saved_policy
+            self.sram_visual_map = {key: divmod(cell, self.sram_cols) for key, cell in zip(state["sram_keys"], state["sram_cells"])}
+            self._sram_slots = SlotAllocator(self.sram_capacity)
+            self._sram_slots.next_unused, free = state["sram_slots"]; self._sram_slots.free = list(free)
+        else:
+            self.policy = make_policy(self.policy_name, self.sram_capacity)
+            self.sram_visual_map = {}
+            keys = saved_policy.keys()[-self.sram_capacity:]
+            for slot, key in enumerate(keys):
+                self.policy.access(key); self.sram_visual_map[key] = divmod(slot, self.sram_cols)
+            self._sram_slots = SlotAllocator(self.sram_capacity); self._sram_slots.next_unused = len(keys)
+        self.policy_name = self.policy.name
+        dram_cols = self.dram_cols
+        self.dram_visual_map = {key: divmod(cell, dram_cols) for key, cell in zip(dram_keys, dram_cells)}
+        self._dram_slots = SlotAllocator(self.dram_capacity)
+        self._dram_slots.next_unused, free = state["dram_slots"]; self._dram_slots.free = list(free)
+        self._dram_released = state["dram_released"]
+        if self.dram is not None: self.dram.set_state(state["dram"])
+
+    def totals(self):
+        return {
+            "policy": self.policy_name,
+            "steps": self.step_count,
+            "sram_hits": self.sram_access_count,
+            "dram_misses": self.dram_access_count,
+            "sram_writes": self.sram_write_count,
+            "sram_delay": self.total_sram_delay,
+            "dram_delay": self.total_dram_delay,
+            "sram_energy": self.total_sram_energy,
+            "dram_energy": self.total_dram_energy,
+            "dram_refresh_energy": self.total_dram_refresh_energy,
+            "elapsed_time": self.time if self.dram is None else max(self.time, self.dram.drain_time()),
+            "dram_row_hits": self.dram.row_hits if self.dram else 0,
+            "dram_row_misses": self.dram.row_misses if self.dram else 0,
+            "dram_row_conflicts": self.dram.row_conflicts if self.dram else 0,
+            "dram_refreshes": self.dram.refreshes if self.dram else self.step_count // self.dram_refresh_interval,
+        }
+
+
+# --- Politika karşılaştırma ---
+def compare_policies(keys, policies, chunk_size=1 << 16, **engine_kwargs):
+
+    # Aynı erişim akışını tek geçişte birden fazla politikaya uygular; akış parça parça
+    # okunduğu için trace üreteçleri de kullanılabilir. {politika: son toplamlar} döndürür.
+
+    engines = {}
+    for name in policies:
+        engine = SimEngine(policy=name, **engine_kwargs)
+        engines[engine.policy_name] = engine
+    keys = iter(keys)
+    while True:
+        chunk = list(islice(keys, chunk_size))
+        if not chunk: break
+        for engine in engines.values(): engine.run(chunk)
+    return {name: engine.totals() for name, engine in engines.items()}
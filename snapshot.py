@@ -0,0 +1,209 @@
+import json
+import struct
+import sys
+import weakref
+import zlib
+from array import array
+from collections import deque, namedtuple
+from itertools import islice
+
+from sim_engine import SimEngine
+
+
+# Simülatör durumunun anlık görüntüleri (snapshot): önbellek içeriği ve politika sırası, SRAM/DRAM konum
+# haritaları, sayaçlar, tarihçe ve girdi konumu. Uzun bir trace dallanma noktasına kadar bir kez simüle edilir;
+# sonra aynı görüntüden farklı politika/kapasite/yenileme aralığıyla birden fazla dal (fork) devam ettirilebilir.
+#
+# Her full_every görüntüden biri tam, aradakiler bir öncekine göre farktır: DRAM haritası ve tarihçe yalnızca
+# büyüdüğünden farka sadece yeni girdiler/satırlar yazılır; boyutu SRAM kapasitesiyle sınırlı durum (politika,
+# SRAM haritası, sayaçlar) her görüntüde tamdır. Geri yükleme, en yakın tam görüntüden hedefe kadar olan zinciri uygular.
+#
+# Kayıtlar yalnızca düz veri içerir (pickle yok, yüklenen dosya kod çalıştıramaz): zlib ile sıkıştırılmış
+# [JSON uzunluğu][JSON belge][sayı dizileri]. Belgedeki {"$array": [tür kodu, uzunluk]} işaretleri, belgeden
+# sonra sırayla gelen little-endian array verisini gösterir (tarihçe sütunları, hücre numaraları).
+#
+# Dosya biçimi: başlık (SNAPSHOT_MAGIC, sürüm, full_every), ardından her görüntü için
+# (adım, üst görüntü (-1 = tam), uzunluk) ve sıkıştırılmış kayıt.
+
+SNAPSHOT_MAGIC = b"SDSNAP\x00\x00"
+SNAPSHOT_VERSION = 3
+FILE_HEADER = struct.Struct("<8sII")
+RECORD_HEADER = struct.Struct("<qqQ")
+DOCUMENT_LENGTH = struct.Struct("<I")
+ARRAY_TAG = "$array"
+ARRAY_TYPECODES = "bBhHiIlLqQfd"
+DEFAULT_FULL_EVERY = 16
+
+Snapshot = namedtuple("Snapshot", ["index", "step", "parent", "size"])
+Restored = namedtuple("Restored", ["engine", "position", "history"])
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def advance_input(iterator, count, feed=None):
+
+    # Girdi akışında count erişimi simüle etmeden atlar (geri yüklenen görüntünün girdi konumuna gelmek için).
+    # feed verilirse atlanan her anahtar ona verilir (örn. kaçırma oranı analizcisini yeniden kurmak için).
+
+    if feed is None: deque(islice(iterator, count), maxlen=0)
+    else:
+        for key in islice(iterator, count): feed(key)
+    return iterator
+
+
+# --- kayıt kodlama ---
+def encode_record(payload):
+    arrays = []
+
+    def tag(value):
+        if not isinstance(value, array): raise TypeError(f"Anlık görüntüye yazılamayan tür: {type(value).__name__}")
+        arrays.append(value)
+        return {ARRAY_TAG: [value.typecode, len(value)]}
+
+    document = json.dumps(payload, default=tag, separators=(",", ":")).encode("utf-8")
+    parts = [DOCUMENT_LENGTH.pack(len(document)), document]
+    for values in arrays:
+        if sys.byteorder == "big": values = array(values.typecode, values); values.byteswap()
+        parts.append(values.tobytes())
+    return zlib.compress(b"".join(parts), 1)
+
+
+def decode_record(blob):
+    try:
+        data = zlib.decompress(blob)
+        (length,) = DOCUMENT_LENGTH.unpack_from(data)
+        offset = DOCUMENT_LENGTH.size + length
+
+        def untag(obj):
+            nonlocal offset
+            if ARRAY_TAG not in obj: return obj
+            typecode, count = obj[ARRAY_TAG]
+            if typecode not in ARRAY_TYPECODES or not isinstance(count, int) or count < 0: raise ValueError("geçersiz dizi")
+            values = array(typecode)
+            size = count * values.itemsize
+            if offset + size > len(data): raise ValueError("eksik dizi verisi")
+            values.frombytes(data[offset:offset + size]); offset += size
+            if sys.byteorder == "big": values.byteswap()
+            return values
+
+        return json.loads(data[DOCUMENT_LENGTH.size:DOCUMENT_LENGTH.size + length].decode("utf-8"), object_hook=untag)
+    except (zlib.error, struct.error, ValueError, TypeError) as e:
+        raise SnapshotError(f"Anlık görüntü kaydı bozuk: {e}") from None
+
+
+class SnapshotStore:
+    def __init__(self, full_every=DEFAULT_FULL_EVERY):
+        if full_every < 1: raise ValueError("full_every en az 1 olmalı")
+        self.full_every = full_every
+        self.clear()
+
+    def clear(self):
+        self._records = []   # (adım, üst görüntü veya -1, sıkıştırılmış kayıt)
+        # motor -> (görüntü, zincir derinliği, DRAM haritası, DRAM haritası uzunluğu, silinen DRAM girdisi, tarihçe, tarihçe satırı)
+        # Fark yalnızca motor bu görüntüden beri aynı haritalara ekleme yaptıysa alınabilir.
+        self._heads = weakref.WeakKeyDictionary()
+
+    def __len__(self):
+        return len(self._records)
+
+    def snapshots(self):
+        return [Snapshot(index, step, parent, len(blob)) for index, (step, parent, blob) in enumerate(self._records)]
+
+    # --- görüntü alma ---
+    def take(self, engine, history=None, position=None):
+
+        # Görüntü alır ve numarasını döndürür. position: girdi akışında tüketilen erişim sayısı (varsayılan adım sayısı).
+
+        parent, depth, dram_from, rows = -1, 0, 0, None
+        head = self._heads.get(engine)
+        if head is not None:
+            index, head_depth, dram_map, dram_len, dram_released, head_history, appended = head
+            if (head_depth + 1 < self.full_every and dram_map is engine.dram_visual_map and len(dram_map) >= dram_len
+                    and dram_released == engine._dram_released and head_history is history):
+                if history is not None:
+                    _, rows = history.read_since(appended, history.names)
+                    if len(rows[0]) != history.appended - appended: rows = None  # ara satırlar tarihçeden düşmüş
+                if history is None or rows is not None: parent, depth, dram_from = index, head_depth + 1, dram_len
+
+        payload = {"engine": engine.get_state(dram_from), "position": engine.step_count if position is None else position}
+        if parent == -1: payload["config"] = engine.config(); payload["history"] = history.get_state() if history is not None else None
+        else: payload["history_rows"] = rows
+        blob = encode_record(payload)
+        self._records.append((engine.step_count, parent, blob))
+        index = len(self._records) - 1
+        self._mark(engine, index, depth, history)
+        return index
+
+    def _mark(self, engine, index, depth, history):
+        self._heads[engine] = (index, depth, engine.dram_visual_map, len(engine.dram_visual_map), engine._dram_released,
+                               history, history.appended if history is not None else 0)
+
+    # --- geri yükleme ---
+    def _chain(self, index):
+        if not 0 <= index < len(self._records): raise SnapshotError(f"Geçersiz görüntü numarası: {index}")
+        chain = []
+        while index != -1:
+            step, parent, blob = self._records[index]
+            chain.append(decode_record(blob))
+            index = parent
+        chain.reverse()
+        return chain
+
+    def restore(self, index, engine, history=None):
+
+        # Görüntüyü verilen motora (ve görüntü tarihçe içeriyorsa aynı türdeki history deposuna) yükler.
+        # Motorun ayarları (politika, SRAM boyutu, gecikme/enerji, yenileme aralığı) korunur; farklıysa görüntüden
+        # bu ayarlarla devam edilir (dal). Restored(engine, position, history) döndürür.
+
+        chain = self._chain(index)
+        try:
+            if history is not None:
+                if chain[0]["history"] is None: raise SnapshotError("Anlık görüntüde tarihçe yok")
+                history.load_state(chain[0]["history"])
+            dram_keys, dram_cells = [], array("q")
+            for payload in chain:
+                dram_keys.extend(payload["engine"]["dram_keys"]); dram_cells.extend(payload["engine"]["dram_cells"])
+                if history is not None and payload.get("history_rows") is not None:
+                    for row in zip(*payload["history_rows"]): history.append(*row)
+            target = chain[-1]
+            engine.set_state(target["engine"], dram_keys, dram_cells)
+        except (KeyError, TypeError, IndexError, ValueError) as e:
+            raise SnapshotError(f"Anlık görüntü kaydı bozuk: {e}") from None
+        self._mark(engine, index, len(chain) - 1, history)
+        return Restored(engine, target["position"], history)
+
+    def fork(self, index, history=None, **overrides):
+
+        # Görüntünün alındığı ayarlarla (overrides ile değiştirilerek) yeni bir motor oluşturup görüntüyü yükler.
+
+        engine = SimEngine(**{**self._chain(index)[0]["config"], **overrides})
+        return self.restore(index, engine, history)
+
+    # --- dosya ---
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(FILE_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.full_every))
+            for step, parent, blob in self._records:
+                f.write(RECORD_HEADER.pack(step, parent, len(blob))); f.write(blob)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            header = f.read(FILE_HEADER.size)
+            if len(header) < FILE_HEADER.size: raise SnapshotError(f"Anlık görüntü dosyası değil: {path}")
+            magic, version, full_every = FILE_HEADER.unpack(header)
+            if magic != SNAPSHOT_MAGIC: raise SnapshotError(f"Anlık görüntü dosyası değil: {path}")
+            if version != SNAPSHOT_VERSION: raise SnapshotError(f"Desteklenmeyen anlık görüntü sürümü: {version}")
+            store = cls(full_every)
+            while True:
+                record = f.read(RECORD_HEADER.size)
+                if not record: break
+                if len(record) < RECORD_HEADER.size: raise SnapshotError(f"Anlık görüntü dosyası eksik: {path}")
+                step, parent, length = RECORD_HEADER.unpack(record)
+                blob = f.read(length)
+                if len(blob) < length or not -1 <= parent < len(store._records): raise SnapshotError(f"Anlık görüntü dosyası bozuk: {path}")
+                store._records.append((step, parent, blob))
+        return store
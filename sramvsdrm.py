@@ -1,38 +1,43 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+import argparse
+import base64
+import csv
+import sys
+import os
+import time
+from itertools import islice
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from collections import OrderedDict
+from sim_engine import SimEngine, compare_policies, DRAM_MODELS
+from policies import POLICIES
+from trace_loader import iter_trace, iter_trace_ops, TraceFormatError
+from workloads import iter_workload
+from hierarchy import CacheHierarchy, plot_hierarchy_report
+from stack_distance import make_analyzer
+from live_chart import BlitLiveChart
+from history import make_history
+from frame_renderer import FrameRenderer, FRAME_MS
+from memory_grid import VirtualGrid
+from profiler import PhaseProfiler
+from snapshot import SnapshotError, SnapshotStore, advance_input
+from report import DISPLAY_DPI, ReportCache, collect_report, export_report, report_format
 
 
 #Simülatör arayüzünü ve başlangıç değerlerini ayarlar.
 class MemorySimulator:
-    def __init__(self, root):
+    def __init__(self, root, history_mode="full", history_rows=100000, profile=False, snapshot_every=0, **engine_kwargs):
         
         
         self.root = root
         self.root.title("SRAM/DRAM Simülatörü")
 
-        # --- Tablo Bellek Ayarları ---
-        self.sram_rows, self.sram_cols = 3, 3
-        self.sram_capacity = self.sram_rows * self.sram_cols
-        self.dram_rows, self.dram_cols = 6, 6
-
-        # --- Gerçekçi Gecikme Değerleri ---
-        self.sram_access_delay = 5
-        self.dram_access_delay = 50
-
-        # --- Gerçekçi Enerji Değerleri ---
-        self.sram_read_energy = 0.5
-        self.sram_write_energy = 0.6
-        self.dram_read_energy = 2.0
-        self.dram_write_energy = 2.2
-        self.dram_refresh_energy = 3.0
-
-        # --- DRAM Yenileme Ayarları ---
-        self.dram_refresh_interval = 10
-        self.total_dram_refresh_energy = 0
+        # --- Simülasyon Motoru (tablo boyutları, gecikme ve enerji değerleri motorda) ---
+        self.engine = SimEngine(**engine_kwargs)
+        self._engine_listener = self.engine.subscribe(self.on_engine_step)
+        self.sram_rows, self.sram_cols = self.engine.sram_rows, self.engine.sram_cols
+        self.dram_rows, self.dram_cols = self.engine.dram_rows, self.engine.dram_cols
 
         # --- Animasyon Hızı ---
         self.animation_speed = 500 # ms
@@ -40,11 +45,21 @@ class MemorySimulator:
         # --- Simülasyon Durumu ---
         self.simulation_running = False
         self.input_iterator = None
+        self.trace_path = None
         self._after_id = None
-        self.report_window = None
+        self.report_window = None; self.report_cache = ReportCache(); self._report_image = None
+        self.renderer = FrameRenderer()
+        self._last_result = None; self._pending_status = None
+        self._show_report_after_frame = False; self._charted_steps = 0
+        self._next_step_time = 0; self._follow_pos = None
+        self.history_mode, self.history_rows = history_mode, history_rows
+        self.profiler = PhaseProfiler(); self._frame_due = 0; self._profile_next_update = 0
+        self.snapshots = SnapshotStore(); self.snapshot_every = snapshot_every; self._next_snapshot_step = snapshot_every; self._resume_ready = False
 
         # --- Arayüz Elemanları ---
         self.setup_ui()
+        self.setup_profiler()
+        if profile: self.profile_var.set(True); self.toggle_profiling()
 
         # --- Metrikler, Tarihçe ve Görsel Konum Takibi Sıfırlama---
         self.reset_metrics()
@@ -63,11 +78,19 @@ class MemorySimulator:
         ttk.Label(control_frame, text="Verilerin Girişi:").pack(side=tk.LEFT, padx=5)
         self.entry = ttk.Entry(control_frame, width=30)
         self.entry.pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Trace Yükle", command=self.load_trace).pack(side=tk.LEFT, padx=5)
+        ttk.Label(control_frame, text="İş Yükü:").pack(side=tk.LEFT, padx=5)
+        self.workload_var = tk.StringVar(value="")
+        ttk.Combobox(control_frame, textvariable=self.workload_var, values=WORKLOAD_PRESETS, width=28).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Başlat", command=self.start_simulation).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Duraklat", command=self.pause_simulation).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Adım", command=self.step_simulation).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Sıfırla", command=self.reset_simulation).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Raporu Göster", command=self.show_final_report).pack(side=tk.LEFT, padx=5)
+        ttk.Label(control_frame, text="Politika:").pack(side=tk.LEFT, padx=5)
+        self.policy_var = tk.StringVar(value=self.engine.policy_name)
+        policy_box = ttk.Combobox(control_frame, textvariable=self.policy_var, values=list(POLICIES), state="readonly", width=8)
+        policy_box.pack(side=tk.LEFT, padx=5); policy_box.bind("<<ComboboxSelected>>", self.change_policy)
 
         # Hız Kontrol
         speed_frame = ttk.Frame(self.root, padding="10")
@@ -78,6 +101,18 @@ class MemorySimulator:
         self.speed_scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self.speed_label = ttk.Label(speed_frame, text=f"{int(self.animation_speed)}ms")
         self.speed_label.pack(side=tk.LEFT, padx=5)
+        self.fast_chart_var = tk.BooleanVar(value=True)
+        self.turbo_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(speed_frame, text="Turbo", variable=self.turbo_var).pack(side=tk.LEFT, padx=5)
+        ttk.Checkbutton(speed_frame, text="Hızlı Grafik", variable=self.fast_chart_var, command=self.toggle_fast_chart).pack(side=tk.LEFT, padx=5)
+        self.follow_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(speed_frame, text="DRAM Takip", variable=self.follow_var).pack(side=tk.LEFT, padx=5)
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(speed_frame, text="Profil (F12)", variable=self.profile_var, command=self.toggle_profiling).pack(side=tk.LEFT, padx=5)
+        ttk.Button(speed_frame, text="Profili Kaydet", command=self.export_profile).pack(side=tk.LEFT, padx=5)
+        ttk.Button(speed_frame, text="Görüntü Al", command=self.take_snapshot).pack(side=tk.LEFT, padx=5)
+        self.snapshot_box = ttk.Combobox(speed_frame, values=[], state="readonly", width=24); self.snapshot_box.pack(side=tk.LEFT, padx=5)
+        ttk.Button(speed_frame, text="Geri Yükle", command=self.restore_snapshot).pack(side=tk.LEFT, padx=5)
 
         # Bellek Görselleştirme
         self.setup_memory_grids()
@@ -88,6 +123,8 @@ class MemorySimulator:
         # Durum Çubuğu
         self.status_label = ttk.Label(self.root, text="Hazır", relief=tk.SUNKEN, anchor=tk.W)
         self.status_label.grid(row=4, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
+        self.profile_label = ttk.Label(self.root, text="", relief=tk.SUNKEN, anchor=tk.W, font=('Courier', 9))
+        self.profile_label.grid(row=5, column=0, columnspan=2, sticky="ew", padx=10, pady=(0, 5)); self.profile_label.grid_remove()
 
     def update_speed(self, val):
         
@@ -101,220 +138,321 @@ class MemorySimulator:
         
         #SRAM ve DRAM belleklerini temsil eden gridleri oluşturur.
         
-        sram_frame = ttk.LabelFrame(self.root, text=f"SRAM (Önbellek {self.sram_rows}x{self.sram_cols}) - LRU")
-        sram_frame.grid(row=2, column=0, padx=10, pady=10, sticky="nsew")
-        self.sram_labels = self.create_grid(sram_frame, self.sram_rows, self.sram_cols)
+        self.sram_frame = ttk.LabelFrame(self.root, text=self.sram_frame_title())
+        self.sram_frame.grid(row=2, column=0, padx=10, pady=10, sticky="nsew")
+        self.sram_grid = self.create_grid(self.sram_frame, self.sram_rows, self.sram_cols)
 
         dram_frame = ttk.LabelFrame(self.root, text=f"DRAM (Ana Bellek {self.dram_rows}x{self.dram_cols})")
         dram_frame.grid(row=2, column=1, padx=10, pady=10, sticky="nsew")
-        self.dram_labels = self.create_grid(dram_frame, self.dram_rows, self.dram_cols)
+        self.dram_grid = self.create_grid(dram_frame, self.dram_rows, self.dram_cols)
+
+    def sram_frame_title(self):
+        return f"SRAM (Önbellek {self.sram_rows}x{self.sram_cols}) - {self.engine.policy_name}"
+
+    # Politika değişince simülasyon baştan başlar (önbellek durumu politikaya özgüdür).
+    def change_policy(self, event=None):
+        self.engine.policy_name = self.policy_var.get()
+        self.reset_simulation()
+        self.sram_frame.config(text=self.sram_frame_title())
+        self.update_status(f"Politika: {self.engine.policy_name}. Sistem sıfırlandı.")
 
     def create_grid(self, parent, rows, cols):
         
-        # Belirtilen boyutlardaki kutucuklardan bir tablo oluşturur.
+        # Belirtilen boyutlarda, yalnızca görünen hücreleri çizen kaydırılabilir bir tablo oluşturur.
+        # Kaydırma: tekerlek / Shift+tekerlek, yakınlaştırma: Ctrl+tekerlek.
        
-        labels = []
-        for i in range(rows):
-            row_labels = []
-            for j in range(cols):
-                label = tk.Label(parent, text="", width=4, height=2, relief="solid", bg="white", font=('Arial', 10))
-                label.grid(row=i, column=j, padx=2, pady=2)
-                row_labels.append(label)
-            labels.append(row_labels)
-        return labels
+        grid = VirtualGrid(parent, rows, cols)
+        grid.frame.pack(expand=True, fill=tk.BOTH, padx=2, pady=2)
+        return grid
 
     
     # setup_chart FONKSİYONU canlı çizgi grafiği için
 
     def setup_chart(self):
        
-        self.fig, self.ax1 = plt.subplots(figsize=(6, 4))
-        self.ax2 = self.ax1.twinx()
+        self.fig = plt.figure(figsize=(6, 4))
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.root)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.grid(row=3, column=0, columnspan=2, padx=10, pady=10, sticky="nsew")
-        self.fig.suptitle("Bellek Performansı ve Kullanımı")
-
-        # Sol Y ekseni (Gecikme)
-        self.ax1.set_xlabel("Adım Sayısı")
-        self.ax1.set_ylabel("Toplam Gecikme (ns)", color='royalblue') # Etiket güncellendi
-        self.ax1.tick_params(axis='y', labelcolor='royalblue')
-        self.ax1.grid(True, axis='y')
-
-        # Sağ Y ekseni (Enerji)
-        self.ax2.set_ylabel("Enerji Kullanımı(pJ)", color='red')
-        self.ax2.tick_params(axis='y', labelcolor='red')
-        self.ax2.grid(True, axis='y', linestyle='--')
-
-        # --- Çizgileri oluştur (GECİKME ve ENERJİ) ---
-        self.line_sram_delay, = self.ax1.plot([], [], label='SRAM Gecikme (ns)', color='blue')
-        self.line_dram_delay, = self.ax1.plot([], [], label='DRAM Gecikme (ns)', color='darkorange')
-        self.line_sram_energy, = self.ax2.plot([], [], label='SRAM Enerji (pJ)', color='cornflowerblue')
-        self.line_dram_energy, = self.ax2.plot([], [], label='DRAM Enerji (pJ)', color='orange')
-
-        # --- Legend'ları birleştir (SADECE KALANLAR İÇİN) ---
-        lines1, labels1 = self.ax1.get_legend_handles_labels()
-        lines2, labels2 = self.ax2.get_legend_handles_labels()
-        self.ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
+        self.ax1, self.ax2, series = build_performance_axes(self.fig)
+        (self.line_sram_delay, _), (self.line_dram_delay, _), (self.line_sram_energy, _), (self.line_dram_energy, _) = series
+
+        # Hızlı grafik: blitting + min/max seyreltme (veri kaynakları reset_metrics içinde bağlanır)
+        self.live_chart = None
+        if self.fast_chart_var.get(): self.live_chart = BlitLiveChart(self.canvas, "step", self.chart_series())
 
         self.canvas.draw()
 
+    # Grafik çizgileri ve tarihçe deposundaki sütunları
+    def chart_series(self):
+        return [(self.line_sram_delay, "sram_delay"), (self.line_dram_delay, "dram_delay"),
+                (self.line_sram_energy, "sram_energy"), (self.line_dram_energy, "dram_energy")]
+
+    def toggle_fast_chart(self):
+        if self.fast_chart_var.get() and self.live_chart is None:
+            self.live_chart = BlitLiveChart(self.canvas, "step", self.chart_series(), self.history)
+        elif not self.fast_chart_var.get() and self.live_chart is not None:
+            self.live_chart.close(); self.live_chart = None
+        self.update_charts()
+
 
     def reset_metrics(self):
         
         # Tüm performans metriklerini, önbelleği ve geçmiş verilerini sıfırlar.
         
-        self.sram_access_count = 0
-        self.dram_access_count = 0
-        self.sram_write_count = 0
-        self.cache = {}
-        self.sram_visual_map = OrderedDict()
-        self.dram_visual_map = {}
-        self.step_count = 0
-        self.steps_history = []
-        self.sram_cumulative_delay_history = []
-        self.dram_cumulative_delay_history = []
-        self.sram_cumulative_energy_history = []
-        self.dram_cumulative_energy_history = []
-        self.dram_refresh_cumulative_energy_history = []
-        self.sram_access_history = [] # Rapor için tutuluyor
-        self.dram_access_history = [] # Rapor için tutuluyor
-        self.total_dram_refresh_energy = 0
+        self.engine.reset()
+        self.history = make_history(self.history_mode, self.history_rows) # Grafik ve rapor bu depodan okur
+        self.mrc_analyzer = make_analyzer() # Rapordaki kaçırma oranı eğrisi için (tek geçiş)
+        if self.live_chart is not None: self.live_chart.set_history(self.history)
 
     # --- start_simulation, pause_simulation, step_simulation ---
 
-    def start_simulation(self):
+    def load_trace(self):
+        path = filedialog.askopenfilename(title="Trace Dosyası Seç", filetypes=[("Trace", "*.txt *.trace *.bin"), ("Tümü", "*.*")])
+        if not path: return
+        self.trace_path = path; self.entry.delete(0, tk.END); self.workload_var.set("")
+        self.update_status(f"Trace yüklendi: {os.path.basename(path)} (metin kutusu boşken kullanılır)")
+
+    # Metin kutusu doluysa her karakter bir erişimdir; boşsa seçilen sentetik iş yükü, o da yoksa yüklenen trace dosyası akış olarak okunur.
+    def create_input_iterator(self):
         input_text = self.entry.get().strip().upper()
-        if not input_text: messagebox.showwarning("Uyarı", "Lütfen bir metin girin!"); return
-        self.reset_simulation(); self.input_iterator = iter(input_text)
+        if input_text: return iter(input_text)
+        workload = self.workload_var.get().strip()
+        if workload:
+            try: return iter_workload(workload, GUI_WORKLOAD_COUNT)
+            except ValueError as e: messagebox.showerror("İş Yükü", str(e)); return None
+        if self.trace_path: return iter_trace(self.trace_path)
+        messagebox.showwarning("Uyarı", "Lütfen bir metin girin veya trace yükleyin!"); return None
+
+    def start_simulation(self):
+        if self._resume_ready:
+            # Geri yüklenen görüntüden devam
+            self._resume_ready = False; self.simulation_running = True; self.update_status(f"Adım {self.engine.step_count} sonrasından devam ediliyor...")
+            self._next_step_time = time.perf_counter(); self.schedule_frame(); return
+        input_iterator = self.create_input_iterator()
+        if input_iterator is None: return
+        self.reset_simulation(); self.input_iterator = input_iterator; self.clear_snapshots()
         self.simulation_running = True; self.update_status("Simülasyon başlatıldı...")
-        self.process_next_char()
+        self._next_step_time = time.perf_counter()
+        self.schedule_frame()
     def pause_simulation(self):
         if not self.simulation_running: return
-        self.simulation_running = False; self.update_status("Simülasyon duraklatıldı.")
-        if self._after_id: self.root.after_cancel(self._after_id); self._after_id = None
+        self.simulation_running = False; self._pending_status = f"Adım {self.engine.step_count} sonrası duraklatıldı."
+        self.schedule_frame()
     def step_simulation(self):
         if not hasattr(self, 'input_iterator') or self.input_iterator is None:
-             input_text = self.entry.get().strip().upper()
-             if not input_text: messagebox.showwarning("Uyarı", "Lütfen bir metin girin!"); return
-             self.reset_simulation(); self.input_iterator = iter(input_text)
+             input_iterator = self.create_input_iterator()
+             if input_iterator is None: return
+             self.reset_simulation(); self.input_iterator = input_iterator; self.clear_snapshots()
              self.update_status("Adım modunda başla...")
-        if self.simulation_running: self.pause_simulation()
-        self.process_next_char(single_step=True)
+        if self.simulation_running: self.pause_simulation(); self._pending_status = None
+        self._resume_ready = False
+        if self.input_iterator is None: self.update_status("Lütfen önce 'Başlat' veya geçerli bir metinle 'Adım' kullanın."); return
+        self.process_next_char(max_steps=1)
+        self.schedule_frame()
+
+    # --- profil: evre ölçümleri (kapalıyken sarmalayıcı yok, ek maliyet yok) ---
+    def setup_profiler(self):
+        profiler = self.profiler
+        profiler.instrument(self, "process_next_char")
+        profiler.instrument(self.engine, "access", "engine.access")
+        profiler.instrument(self, "on_engine_step")  # öz süre: tarihçe ve MRC
+        profiler.instrument(self, "draw_step")       # hücre değişikliklerinin kaydı (highlight_cell)
+        profiler.instrument(self.renderer, "flush", "renderer.flush")
+        profiler.instrument(self, "update_charts")
+        profiler.instrument(self, "update_status")
+        profiler.instrument(self, "show_final_report")
+        self.root.bind("<F12>", lambda event: (self.profile_var.set(not self.profile_var.get()), self.toggle_profiling()))
+
+    def toggle_profiling(self):
+        if self.profile_var.get():
+            self.profiler.reset(); self.profiler.enable(); self.profile_label.grid()
+            self.profile_label.config(text="Profil açık, ölçüm bekleniyor...")
+        else:
+            self.profiler.disable(); self.profile_label.grid_remove()
+        # Motor aboneliği yeniden bağlanır (profil açıksa zamanlayıcılı on_engine_step)
+        self.engine.unsubscribe(self._engine_listener); self._engine_listener = self.engine.subscribe(self.on_engine_step)
+
+    def export_profile(self):
+        if not self.profiler.samples: messagebox.showinfo("Profil", "Henüz profil ölçümü yok. 'Profil' seçeneğini açıp simülasyonu çalıştırın."); return
+        path = filedialog.asksaveasfilename(title="Profili Kaydet", defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not path: return
+        trace_path = os.path.splitext(path)[0] + ".trace.json"
+        try: self.profiler.export_json(path); self.profiler.export_chrome_trace(trace_path)
+        except OSError as e: messagebox.showerror("Profil", f"Profil kaydedilemedi:\n{e}"); return
+        self.update_status(f"Profil kaydedildi: {os.path.basename(path)} (özet), {os.path.basename(trace_path)} (Chrome trace)")
+
+    # --- anlık görüntüler: dallanma noktasına kadar bir kez simüle edip oradan farklı politikayla devam etmek için ---
+    def take_snapshot(self, periodic=False):
+        if self.engine.step_count == 0:
+            if not periodic: messagebox.showinfo("Anlık Görüntü", "Simülasyon henüz başlamadı.")
+            return
+        index = self.snapshots.take(self.engine, self.history)
+        self.schedule_next_snapshot(); self.update_snapshot_list(); self.snapshot_box.current(index)
+        if not periodic: self.update_status(f"Anlık görüntü #{index} alındı (adım {self.engine.step_count}).")
+
+    def schedule_next_snapshot(self):
+        if self.snapshot_every: self._next_snapshot_step = (self.engine.step_count // self.snapshot_every + 1) * self.snapshot_every
+
+    def clear_snapshots(self):
+        self.snapshots.clear(); self.update_snapshot_list(); self.snapshot_box.set(""); self._next_snapshot_step = self.snapshot_every
+
+    def update_snapshot_list(self):
+        self.snapshot_box.config(values=[f"#{snapshot.index} adım {snapshot.step} ({'tam' if snapshot.parent < 0 else 'fark'}, {snapshot.size / 1024:.0f} KB)"
+                                         for snapshot in self.snapshots.snapshots()])
+
+    def restore_snapshot(self):
+
+        # Seçilen görüntüye döner; politika kutusunda farklı bir politika seçiliyse görüntüden o politikayla devam edilir.
+        # Girdi akışı görüntünün konumuna kadar simüle edilmeden ilerletilir (kaçırma oranı analizcisi bu sırada
+        # yeniden kurulur, görüntüye yazılmaz); Başlat/Adım kaldığı yerden sürdürür.
+
+        index = self.snapshot_box.current()
+        if index < 0: messagebox.showinfo("Anlık Görüntü", "Önce listeden bir anlık görüntü seçin."); return
+        input_iterator = self.create_input_iterator()
+        if input_iterator is None: return
+        self.reset_simulation(); self.engine.policy_name = self.policy_var.get()
+        try: restored = self.snapshots.restore(index, self.engine, self.history)
+        except (ValueError, SnapshotError) as e: messagebox.showerror("Anlık Görüntü", str(e)); self.reset_simulation(); return
+        if self.live_chart is not None: self.live_chart.set_history(self.history)
+        self.input_iterator = advance_input(input_iterator, restored.position, self.mrc_analyzer.feed)
+        self.schedule_next_snapshot()
+        self.draw_memory_state(); self._charted_steps = -1; self._resume_ready = True
+        self.sram_frame.config(text=self.sram_frame_title())
+        self._pending_status = f"#{index} görüntüsüne dönüldü (adım {self.engine.step_count}, {self.engine.policy_name}). Devam için Başlat veya Adım."
+        self.schedule_frame()
+
+    def draw_memory_state(self):
+
+        # Tabloları motorun konum haritalarından yeniden doldurur (yalnızca görünen hücreler çizilir).
+
+        self.clear_grids()
+        for grid, positions in ((self.sram_grid, self.engine.sram_visual_map), (self.dram_grid, self.engine.dram_visual_map)):
+            for key, (row, col) in positions.items(): grid.set_cell(row, col, text=format_key(key))
+
+    # --- kare döngüsü: adımlar, hücre değişiklikleri, grafik ve durum çubuğu kare başına bir kez ---
+    def schedule_frame(self):
+        if self._after_id is None:
+            self._after_id = self.root.after(FRAME_MS, self.on_frame)
+            if self.profiler.enabled: self._frame_due = time.perf_counter_ns() + FRAME_MS * 1000000
+
+    def on_frame(self):
+        self._after_id = None
+        if self.profiler.enabled and self._frame_due:
+            # Karenin planlanandan ne kadar geç başladığı: Tk'nın olay işleme ve pencere çizimi süresi
+            start = time.perf_counter_ns(); self.profiler.record("tk.loop", self._frame_due, max(0, start - self._frame_due))
+        if self.simulation_running:
+            now = time.perf_counter()
+            if self.turbo_var.get():
+                # Turbo: kare süresinin çoğu adımlara ayrılır, yalnızca son durum çizilir
+                self.process_next_char(deadline=now + FRAME_MS * 0.7 / 1000)
+            else:
+                # Normal: her animation_speed ms'de bir adım; birikmiş gecikme bir kareden fazlaysa atılır
+                interval = self.animation_speed / 1000
+                if now >= self._next_step_time:
+                    due = int((now - self._next_step_time) / interval) + 1
+                    steps = min(due, int(FRAME_MS // self.animation_speed) + 1)
+                    self.process_next_char(max_steps=steps)
+                    self._next_step_time += steps * interval
+                    if self._next_step_time < now - interval: self._next_step_time = now
+        self.render_frame()
+        if self.simulation_running or self.renderer.has_work(): self.schedule_frame()
+        if self._show_report_after_frame: self._show_report_after_frame = False; self.show_final_report()
+
+    def render_frame(self):
+        self.renderer.flush()
+        # Periyodik anlık görüntü kare sınırında alınır (motor aboneliğinde değil)
+        if self.snapshot_every and self.engine.step_count >= self._next_snapshot_step: self.take_snapshot(periodic=True)
+        if self._follow_pos is not None:
+            if self.follow_var.get(): self.dram_grid.see(*self._follow_pos)
+            self._follow_pos = None
+        if self._last_result is not None: self.update_status(self.describe_step(self._last_result)); self._last_result = None
+        if self._pending_status is not None: self.update_status(self._pending_status); self._pending_status = None
+        if self.history.appended != self._charted_steps: self._charted_steps = self.history.appended; self.update_charts()
+        if self.profiler.enabled and time.perf_counter() >= self._profile_next_update:
+            self._profile_next_update = time.perf_counter() + 0.5
+            text = self.profiler.status_text()
+            if text: self.profile_label.config(text=text)
 
     # --- işlemlere başlama  ---
-    def process_next_char(self, single_step=False):
-        if not self.simulation_running and not single_step: return
-        if self.input_iterator is None: self.update_status("Lütfen önce 'Başlat' veya geçerli bir metinle 'Adım' kullanın."); return
+    def process_next_char(self, max_steps=None, deadline=None):
+
+        # En fazla max_steps adım ya da deadline (perf_counter) dolana kadar simülasyonu ilerletir.
+
+        if self.input_iterator is None: return
+        access = self.engine.access; input_iterator = self.input_iterator; steps = 0
         try:
-            char = next(self.input_iterator); self.step_count += 1
-            refresh_occurred = False; step_refresh_energy = 0
-            if self.step_count > 0 and self.step_count % self.dram_refresh_interval == 0:
-                refresh_occurred = True; step_refresh_energy = self.dram_refresh_energy; self.total_dram_refresh_energy += step_refresh_energy
-            sram_delay, sram_energy, dram_delay, dram_energy, status_msg = self.process_char(char)
-            prev_sram_delay = self.sram_cumulative_delay_history[-1] if self.sram_cumulative_delay_history else 0
-            prev_dram_delay = self.dram_cumulative_delay_history[-1] if self.dram_cumulative_delay_history else 0
-            prev_sram_energy = self.sram_cumulative_energy_history[-1] if self.sram_cumulative_energy_history else 0
-            prev_dram_energy = self.dram_cumulative_energy_history[-1] if self.dram_cumulative_energy_history else 0
-            prev_refresh_energy = self.dram_refresh_cumulative_energy_history[-1] if self.dram_refresh_cumulative_energy_history else 0
-            self.steps_history.append(self.step_count)
-            self.sram_cumulative_delay_history.append(prev_sram_delay + sram_delay)
-            self.dram_cumulative_delay_history.append(prev_dram_delay + dram_delay)
-            self.sram_cumulative_energy_history.append(prev_sram_energy + sram_energy)
-            self.dram_cumulative_energy_history.append(prev_dram_energy + dram_energy)
-            self.dram_refresh_cumulative_energy_history.append(prev_refresh_energy + step_refresh_energy)
-            self.sram_access_history.append(self.sram_access_count)
-            self.dram_access_history.append(self.dram_access_count)
-            if refresh_occurred: status_msg += f" | DRAM Refresh (+ J)"
-            self.update_status(f"Adım {self.step_count}: {status_msg}")
-            self.update_charts() 
-            self.root.update_idletasks()
-            if self.simulation_running and not single_step:
-                self._after_id = self.root.after(int(self.animation_speed), self.process_next_char)
-            else:
-                self._after_id = None
-                if not single_step: self.update_status(f"Adım {self.step_count} sonrası duraklatıldı.")
+            while True:
+                access(next(input_iterator)); steps += 1
+                if max_steps is not None and steps >= max_steps: break
+                if deadline is not None and steps % 64 == 0 and time.perf_counter() >= deadline: break
         except StopIteration:
-            self.simulation_running = False; self.update_status(f"Simülasyon tamamlandı! ({self.step_count} adım)")
-            self.update_charts()
-            if self._after_id: self.root.after_cancel(self._after_id); self._after_id = None
-            self.show_final_report()
+            self.simulation_running = False
+            self._pending_status = f"Simülasyon tamamlandı! ({self.engine.step_count} adım)"
+            self._show_report_after_frame = True
+            self.schedule_frame()
         except Exception as e:
-             self.simulation_running = False; messagebox.showerror("Hata", f"Simülasyon sırasında bir hata oluştu:\n{e}"); self.update_status(f"Hata nedeniyle durduruldu: {e}")
-             if self._after_id: self.root.after_cancel(self._after_id); self._after_id = None
-             self.update_charts(); import traceback; traceback.print_exc()
-
-    # --- boş kutucuk buma ---
-    def find_empty_cell(self, grid_labels):
-        rows = len(grid_labels); cols = len(grid_labels[0]) if rows > 0 else 0
-        for r in range(rows):
-            if r < len(grid_labels):
-                for c in range(cols):
-                    if c < len(grid_labels[r]) and grid_labels[r][c].winfo_exists() and grid_labels[r][c].cget('text') == "": return r, c
-        return None
+             self.simulation_running = False; messagebox.showerror("Hata", f"Simülasyon sırasında bir hata oluştu:\n{e}"); self._pending_status = f"Hata nedeniyle durduruldu: {e}"
+             self.schedule_frame(); import traceback; traceback.print_exc()
+
+    # --- motordan gelen adım sonucunu tablolara ve tarihçeye yansıtma (çizim kare döngüsünde) ---
+    def on_engine_step(self, result):
+        engine = self.engine
+        self.history.append(engine.total_sram_delay, engine.total_dram_delay, engine.total_sram_energy, engine.total_dram_energy,
+                            engine.total_dram_refresh_energy, engine.sram_access_count, engine.dram_access_count)
+        self.mrc_analyzer.feed(result.key)
+        self.draw_step(result)
+        self._last_result = result
 
     # --- İşlem Çubuğu ---
-    def process_char(self, char):
-        step_sram_delay, step_sram_energy, step_dram_delay, step_dram_energy = 0, 0, 0, 0
-        status_msg = ""; sram_original_bg = "white"; dram_original_bg = "white"
-        if char in self.sram_visual_map:
-            self.sram_access_count += 1; step_sram_delay = self.sram_access_delay; step_sram_energy = self.sram_read_energy
-            sram_row, sram_col = self.sram_visual_map[char]; self.highlight_cell(self.sram_labels, sram_row, sram_col, "lightblue", sram_original_bg)
-            self.sram_visual_map.move_to_end(char); status_msg = f"'{char}' SRAM HIT. Gecikme: {step_sram_delay}ns, S-Enerji: {step_sram_energy:.1f}pJ"
+    def draw_step(self, result):
+        char = format_key(result.key); sram_original_bg = "white"; dram_original_bg = "white"
+        sram_row, sram_col = result.sram_pos
+        if result.hit:
+            self.highlight_cell(self.sram_grid, sram_row, sram_col, "lightblue", sram_original_bg)
+            return
+        dram_row, dram_col = result.dram_pos
+        self._follow_pos = result.dram_pos
+        if result.dram_new:
+            self.highlight_cell(self.dram_grid, dram_row, dram_col, "lightgreen", dram_original_bg)
+            self.set_cell_text(self.dram_grid, dram_row, dram_col, char)
+        else:
+            self.highlight_cell(self.dram_grid, dram_row, dram_col, "yellow", dram_original_bg)
+        if result.evicted is not None: self.set_cell_text(self.sram_grid, sram_row, sram_col, "", bg=sram_original_bg)
+        self.set_cell_text(self.sram_grid, sram_row, sram_col, char); self.highlight_cell(self.sram_grid, sram_row, sram_col, "orange", sram_original_bg)
+
+    def describe_step(self, result):
+        char = format_key(result.key)
+        if result.hit:
+            status_msg = f"'{char}' SRAM HIT. Gecikme: {result.sram_delay}ns, S-Enerji: {result.sram_energy:.1f}pJ"
         else:
-            self.dram_access_count += 1; step_dram_delay = self.dram_access_delay; step_dram_energy = self.dram_read_energy
-            if char not in self.dram_visual_map:
-                dram_pos = self.find_empty_cell(self.dram_labels)
-                if dram_pos is None: raise Exception("DRAM görsel alanı doldu!")
-                dram_row, dram_col = dram_pos; self.highlight_cell(self.dram_labels, dram_row, dram_col, "lightgreen", dram_original_bg)
-                if dram_row < len(self.dram_labels) and dram_col < len(self.dram_labels[dram_row]) and self.dram_labels[dram_row][dram_col].winfo_exists(): self.dram_labels[dram_row][dram_col].config(text=char)
-                self.dram_visual_map[char] = (dram_row, dram_col)
-            else:
-                 dram_row, dram_col = self.dram_visual_map[char]; self.highlight_cell(self.dram_labels, dram_row, dram_col, "yellow", dram_original_bg)
-            removed_char = None
-            if len(self.sram_visual_map) >= self.sram_capacity:
-                try:
-                    lru_char, (lru_row, lru_col) = self.sram_visual_map.popitem(last=False); removed_char = lru_char
-                    if lru_row < len(self.sram_labels) and lru_col < len(self.sram_labels[lru_row]) and self.sram_labels[lru_row][lru_col].winfo_exists(): self.sram_labels[lru_row][lru_col].config(text="", bg=sram_original_bg)
-                    sram_pos = (lru_row, lru_col)
-                except KeyError: raise Exception("SRAM dolu ama LRU öğesi çıkarılamadı!")
-            else:
-                sram_pos = self.find_empty_cell(self.sram_labels)
-                if sram_pos is None: raise Exception("SRAM'de boş hücre bulunamadı (kapasite dolmamışken)!")
-            sram_row, sram_col = sram_pos
-            if sram_row < len(self.sram_labels) and sram_col < len(self.sram_labels[sram_row]) and self.sram_labels[sram_row][sram_col].winfo_exists():
-                 self.sram_labels[sram_row][sram_col].config(text=char); self.highlight_cell(self.sram_labels, sram_row, sram_col, "orange", sram_original_bg)
-            self.sram_visual_map[char] = (sram_row, sram_col); self.sram_write_count += 1; step_sram_energy = self.sram_write_energy
             status_msg = f"'{char}' DRAM MISS. "
-            if removed_char: status_msg += f"LRU ('{removed_char}') çıkarıldı. "
-            status_msg += f"D-Gecikme: {step_dram_delay}ns, D-Enerji: {step_dram_energy:.1f}pJ, S-Enerji: {step_sram_energy:.1f}pJ"
-        return step_sram_delay, step_sram_energy, step_dram_delay, step_dram_energy, status_msg
+            if result.evicted is not None: status_msg += f"{self.engine.policy_name} ('{format_key(result.evicted)}') çıkarıldı. "
+            status_msg += f"D-Gecikme: {result.dram_delay}ns, D-Enerji: {result.dram_energy:.1f}pJ, S-Enerji: {result.sram_energy:.1f}pJ"
+        if result.refresh_energy: status_msg += f" | DRAM Refresh (+{result.refresh_energy:.1f} pJ)"
+        return f"Adım {result.step}: {status_msg}"
+
+    def set_cell_text(self, grid, row, col, text, **options):
+        if 0 <= row < grid.rows and 0 <= col < grid.cols: self.renderer.set(grid.cell(row, col), text=text, **options)
 
-    # --- kutucukları yakıp söndürme ---
-    def highlight_cell(self, grid_labels, row, col, color, original_bg):
+    # --- kutucukları yakıp söndürme (sönme kare döngüsünde) ---
+    def highlight_cell(self, grid, row, col, color, original_bg):
         highlight_duration = max(100, int(self.animation_speed * 0.6))
-        if 0 <= row < len(grid_labels) and 0 <= col < len(grid_labels[row]):
-             label = grid_labels[row][col]
-             if label.winfo_exists():
-                 current_bg = label.cget('bg')
-                 if current_bg != color:
-                     label.config(bg=color)
-                     label.after(highlight_duration, lambda lbl=label, orig_bg=original_bg: lbl.config(bg=orig_bg) if lbl.winfo_exists() else None)
+        if 0 <= row < grid.rows and 0 <= col < grid.cols:
+             self.renderer.flash(grid.cell(row, col), color, original_bg, highlight_duration)
 
     # --- durumu güncelleme, TABLOLARI TEMİZLEME , simulasyonu sıfırlama ---
     def update_status(self, message): self.status_label.config(text=message)
     def clear_grids(self):
-        for r in range(self.sram_rows):
-            for c in range(self.sram_cols):
-                 if r < len(self.sram_labels) and c < len(self.sram_labels[r]) and self.sram_labels[r][c].winfo_exists(): self.sram_labels[r][c].config(text="", bg="white")
-        for r in range(self.dram_rows):
-            for c in range(self.dram_cols):
-                 if r < len(self.dram_labels) and c < len(self.dram_labels[r]) and self.dram_labels[r][c].winfo_exists(): self.dram_labels[r][c].config(text="", bg="white")
+        for grid in (self.sram_grid, self.dram_grid):
+            if grid.winfo_exists(): grid.clear()
     def reset_simulation(self):
         self.simulation_running = False
         if self._after_id: self.root.after_cancel(self._after_id); self._after_id = None
+        self.renderer.clear(); self._last_result = None; self._pending_status = None; self._show_report_after_frame = False; self._charted_steps = 0; self._follow_pos = None; self._resume_ready = False
         self.input_iterator = None; self.reset_metrics(); self.clear_grids(); self.update_charts(); self.update_status("Sistem sıfırlandı.")
         if self.report_window is not None and self.report_window.winfo_exists(): self.report_window.destroy(); self.report_window = None
+        self.report_cache.clear()
 
     
     # GRAFİĞİ GÜNCELLEME FONKSİYONU 
@@ -329,21 +467,9 @@ class MemorySimulator:
              return
 
         try:
-            # Line verilerini güncelle
-            self.line_sram_delay.set_data(self.steps_history, self.sram_cumulative_delay_history)
-            self.line_dram_delay.set_data(self.steps_history, self.dram_cumulative_delay_history)
-            self.line_sram_energy.set_data(self.steps_history, self.sram_cumulative_energy_history)
-            self.line_dram_energy.set_data(self.steps_history, self.dram_cumulative_energy_history)
-
-            # Grafik sınırlarını otomatik ayarlama
-            
-            self.ax1.relim()
-            self.ax1.autoscale_view(tight=True)
-            self.ax2.relim()
-            self.ax2.autoscale_view(tight=True)
-
-            # Kanvası çizdir 
-            self.canvas.draw()
+            if self.live_chart is not None: self.live_chart.update(); return
+
+            redraw_chart(self.canvas, (self.ax1, self.ax2), self.chart_series(), self.history)
         except Exception as e:
              print(f"Grafik güncelleme hatası : {e}")
              try:
@@ -359,51 +485,249 @@ class MemorySimulator:
     # --- sonda gösterilen rapor ---
 
     def show_final_report(self):
-        if self.step_count == 0: messagebox.showinfo("Rapor", "Simülasyon henüz çalışmadı veya tamamlanmadı."); return
+        if self.engine.step_count == 0: messagebox.showinfo("Rapor", "Simülasyon henüz çalışmadı veya tamamlanmadı."); return
         if self.report_window is not None and self.report_window.winfo_exists(): self.report_window.lift(); return
+        # Toplamlar aynı simülasyon durumu için bir kez hesaplanır; figür arka planda Agg ile çizilir (Tk donmaz)
+        self.report_cache.get(self.report_key(), lambda: collect_report(self.engine.totals(), self.mrc_analyzer, self.engine.sram_capacity))
         self.report_window = tk.Toplevel(self.root); self.report_window.title("Nihai Performans Raporu"); self.report_window.protocol("WM_DELETE_WINDOW", self.on_report_close)
-        final_sram_delay = self.sram_cumulative_delay_history[-1] if self.sram_cumulative_delay_history else 0; final_dram_delay = self.dram_cumulative_delay_history[-1] if self.dram_cumulative_delay_history else 0
-        final_sram_energy = self.sram_cumulative_energy_history[-1] if self.sram_cumulative_energy_history else 0; final_dram_energy = self.dram_cumulative_energy_history[-1] if self.dram_cumulative_energy_history else 0
-        final_refresh_energy = self.dram_refresh_cumulative_energy_history[-1] if self.dram_refresh_cumulative_energy_history else 0; final_total_dram_energy = final_dram_energy + final_refresh_energy
-        final_sram_access = self.sram_access_count; final_dram_access = self.dram_access_count
+        ttk.Button(self.report_window, text="Raporu Kaydet", command=self.save_report).pack(side=tk.BOTTOM, pady=(0, 10))
+        self.report_label = ttk.Label(self.report_window, text="Rapor hazırlanıyor...", anchor=tk.CENTER); self.report_label.pack(expand=True, fill=tk.BOTH, padx=10, pady=10)
+        self.when_done(self.report_cache.render("png", DISPLAY_DPI), self.show_report_image)
+
+    def report_key(self):
+        return (self.engine.step_count, self.engine.policy_name, self.engine.sram_capacity)
+
+    def when_done(self, future, callback):
+
+        # Arka plan işinin sonucu Tk ana döngüsünde yoklanır (Tk nesnelerine yalnızca ana iş parçacığından dokunulur).
+
+        if future.done(): callback(future)
+        else: self.root.after(50, self.when_done, future, callback)
+
+    def show_report_image(self, future):
+        if self.report_window is None or not self.report_window.winfo_exists(): return
         try:
-            fig, axes = plt.subplots(1, 3, figsize=(18, 6)); fig.suptitle("Bellek Performans Karşılaştırması (Simülasyon Sonu)", fontsize=14)
-            axes[0].bar(['SRAM', 'DRAM'], [final_sram_delay, final_dram_delay], color=['blue','goldenrod']); axes[0].set_ylabel("Toplam Birikimli Gecikme (ns)"); axes[0].set_title("Toplam Gecikme")
-            max_delay = max(final_sram_delay, final_dram_delay, 1)
-            for i, v in enumerate([final_sram_delay, final_dram_delay]): axes[0].text(i, v + 0.01 * max_delay, f"{v:.0f}", ha='center', va='bottom')
-            axes[0].set_ylim(bottom=0)
-            max_energy_for_scale = max(final_sram_energy, final_total_dram_energy, 1); axes[1].bar(['SRAM', 'DRAM Toplam'], [final_sram_energy, final_total_dram_energy], color=['deepskyblue', 'gold']); axes[1].set_ylabel("Toplam Enerji (pJ)"); axes[1].set_title("Toplam Enerji Tüketimi")
-            if final_dram_energy > 0.05 * max_energy_for_scale : axes[1].text(1, final_dram_energy / 2, f"Erişim\n{final_dram_energy:.1f} pJ", ha='center', va='center', color='black', weight='bold', fontsize='x-small')
-            if final_refresh_energy > 0.05 * max_energy_for_scale: axes[1].text(1, final_dram_energy + final_refresh_energy / 2, f"Refresh\n{final_refresh_energy:.1f} pJ", ha='center', va='center', color='black', weight='bold', fontsize='x-small')
-            axes[1].set_ylim(bottom=0); axes[1].text(0, final_sram_energy + 0.01 * max_energy_for_scale, f"{final_sram_energy:.1f}", ha='center', va='bottom'); axes[1].text(1, final_total_dram_energy + 0.01 * max_energy_for_scale, f"Toplam:{final_total_dram_energy:.1f}", ha='center', va='bottom', fontsize='small')
-            axes[2].bar(['SRAM (HIT)', 'DRAM (MISS)'], [final_sram_access, final_dram_access], color=['lightskyblue','khaki']); axes[2].set_ylabel("Toplam Erişim Sayısı"); axes[2].set_title("Erişim Sayısı (HIT/MISS)")
-            max_access = max(final_sram_access, final_dram_access, 1)
-            for i, v in enumerate([final_sram_access, final_dram_access]): axes[2].text(i, v + 0.01 * max_access, str(v), ha='center', va='bottom')
-            axes[2].set_ylim(bottom=0)
-            plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-            canvas = FigureCanvasTkAgg(fig, master=self.report_window); canvas_widget = canvas.get_tk_widget(); canvas_widget.pack(expand=True, fill=tk.BOTH, padx=10, pady=10); canvas.draw()
+            self._report_image = tk.PhotoImage(master=self.report_window, data=base64.b64encode(future.result()))
+            self.report_label.config(image=self._report_image, text="")
         except Exception as e:
-            messagebox.showerror("Rapor Hatası", f"Rapor grafiği oluşturulurken hata oluştu:\n{e}", parent=self.report_window); print(f"Rapor grafiği hatası: {e}"); import traceback; traceback.print_exc()
-            if self.report_window and self.report_window.winfo_exists(): self.report_window.destroy(); self.report_window = None
+            messagebox.showerror("Rapor Hatası", f"Rapor grafiği oluşturulurken hata oluştu:\n{e}", parent=self.report_window); print(f"Rapor grafiği hatası: {e}")
+            self.on_report_close()
+
+    def save_report(self):
+        path = filedialog.asksaveasfilename(title="Raporu Kaydet", parent=self.report_window, defaultextension=".png",
+                                            filetypes=[("PNG", "*.png"), ("SVG", "*.svg"), ("JSON", "*.json"), ("HTML", "*.html")])
+        if not path: return
+        try: future = self.report_cache.export(path)
+        except ValueError as e: messagebox.showerror("Rapor", str(e), parent=self.report_window); return
+        self.update_status(f"Rapor kaydediliyor: {os.path.basename(path)}...")
+        self.when_done(future, self.on_report_saved)
+
+    def on_report_saved(self, future):
+        try: self.update_status(f"Rapor kaydedildi: {future.result()}")
+        except Exception as e: messagebox.showerror("Rapor", f"Rapor kaydedilemedi:\n{e}")
 
     # --- ekran kapatma, rapor ekranını kapatma ---
     def on_report_close(self):
         if self.report_window:
-            try:
-                if hasattr(self.report_window, 'winfo_children') and self.report_window.winfo_children():
-                     canvas_widget = self.report_window.winfo_children()[0]
-                     if hasattr(canvas_widget, 'figure'): plt.close(canvas_widget.figure)
-            except Exception as e: print(f"Rapor figürü kapatılırken hata (önemsiz): {e}")
-            self.report_window.destroy(); self.report_window = None
-            
+            self.report_window.destroy(); self.report_window = None; self._report_image = None
+
     def on_main_window_close(self):
         if self._after_id: self.root.after_cancel(self._after_id); self._after_id = None
-        self.on_report_close()
+        self.on_report_close(); self.report_cache.shutdown()
         if hasattr(self, 'fig'): plt.close(self.fig)
         self.root.destroy()
 
+# --- Canlı grafik figürü (Tk'dan bağımsız; benchmarks/ bunu Agg ile ölçer, rapor figürü report.py'de) ---
+def build_performance_axes(fig):
+
+    # Gecikme (sol) ve enerji (sağ) eksenleri ile çizgiler; (ax1, ax2, [(çizgi, tarihçe sütunu), ...]) döndürür.
+
+    ax1 = fig.add_subplot(); ax2 = ax1.twinx()
+    fig.suptitle("Bellek Performansı ve Kullanımı")
+
+    # Sol Y ekseni (Gecikme)
+    ax1.set_xlabel("Adım Sayısı")
+    ax1.set_ylabel("Toplam Gecikme (ns)", color='royalblue') # Etiket güncellendi
+    ax1.tick_params(axis='y', labelcolor='royalblue')
+    ax1.grid(True, axis='y')
+
+    # Sağ Y ekseni (Enerji)
+    ax2.set_ylabel("Enerji Kullanımı(pJ)", color='red')
+    ax2.tick_params(axis='y', labelcolor='red')
+    ax2.grid(True, axis='y', linestyle='--')
+
+    # --- Çizgileri oluştur (GECİKME ve ENERJİ) ---
+    line_sram_delay, = ax1.plot([], [], label='SRAM Gecikme (ns)', color='blue')
+    line_dram_delay, = ax1.plot([], [], label='DRAM Gecikme (ns)', color='darkorange')
+    line_sram_energy, = ax2.plot([], [], label='SRAM Enerji (pJ)', color='cornflowerblue')
+    line_dram_energy, = ax2.plot([], [], label='DRAM Enerji (pJ)', color='orange')
+
+    # --- Legend'ları birleştir (SADECE KALANLAR İÇİN) ---
+    lines1, labels1 = ax1.get_legend_handles_labels()
+    lines2, labels2 = ax2.get_legend_handles_labels()
+    ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
+    return ax1, ax2, [(line_sram_delay, "sram_delay"), (line_dram_delay, "dram_delay"),
+                      (line_sram_energy, "sram_energy"), (line_dram_energy, "dram_energy")]
+
+
+# Hızlı grafik kapalıyken: tüm tarihçe çizilir, eksenler yeniden ölçeklenir.
+def redraw_chart(canvas, axes, series, history):
+    steps = history.column("step")
+    for line, name in series: line.set_data(steps, history.column(name))
+    for ax in axes:
+        ax.relim()
+        ax.autoscale_view(tight=True)
+    canvas.draw()
+
+
+# Arayüzdeki hazır iş yükleri (kutuya "desen:param=değer" biçiminde başka bir tanım da yazılabilir)
+WORKLOAD_PRESETS = ["", "sequential:footprint=4096", "strided:stride=64,footprint=4096", "looping:working_set=12",
+                    "uniform:footprint=64", "zipf:footprint=1024,alpha=1.0",
+                    "looping:working_set=8,count=2000+zipf:footprint=256,count=2000"]
+GUI_WORKLOAD_COUNT = 1000000
+
+
+# Trace adresleri tablolarda onaltılık gösterilir.
+def format_key(key):
+    return f"{key:X}" if isinstance(key, int) else str(key)
+
+
+# Arayüzsüz girdi: trace dosyası veya sentetik iş yükü (workloads.py)
+def input_keys(args):
+    if args.workload: return iter_workload(args.workload, args.count, args.seed)
+    return iter_trace(args.trace, base=args.base)
+
+
+# --- Arayüzsüz (headless) trace oynatma ---
+def run_headless(args):
+    engine_kwargs = dict(sram_rows=args.sram_rows, sram_cols=args.sram_cols, dram_rows=args.dram_rows, dram_cols=args.dram_cols,
+                         dram_model=args.dram_model, dram_banks=args.dram_banks)
+    if args.hierarchy: return run_hierarchy(args)
+    if args.compare: return print_policy_comparison(engine_kwargs, args)
+    try: engine = SimEngine(policy=args.policy, **engine_kwargs)
+    except ValueError as e: raise SystemExit(f"Hata: {e}")
+    if args.mrc: return print_miss_ratio_curve(engine, args)
+    if args.report: return write_reports(engine, args)
+    try: totals = run_with_snapshots(engine, args) if args.snapshot_every or args.resume else engine.run(input_keys(args))
+    except (OSError, TraceFormatError, ValueError, SnapshotError) as e: raise SystemExit(f"Hata: {e}")
+    for name, value in totals.items(): print(f"{name}: {value}")
+
+
+# --resume: kaydedilmiş görüntüden (bu çalıştırmanın politika/boyut/yenileme ayarlarıyla) devam eder, önceki erişimler
+# simüle edilmeden atlanır. --snapshot-every: her N adımda görüntü alır ve --snapshots dosyasına yazar.
+def run_with_snapshots(engine, args):
+    keys = input_keys(args)
+    store = SnapshotStore.load(args.resume) if args.resume else SnapshotStore()
+    if args.resume:
+        if not len(store): raise SnapshotError(f"Dosyada anlık görüntü yok: {args.resume}")
+        restored = store.restore(len(store) - 1 if args.resume_index is None else args.resume_index, engine)
+        advance_input(keys, restored.position)
+        print(f"{restored.position}. adımdan devam ediliyor ({args.resume})")
+    if not args.snapshot_every: return engine.run(keys)
+    try:
+        while True:
+            steps = engine.step_count
+            engine.run(islice(keys, args.snapshot_every))
+            if engine.step_count == steps: break
+            store.take(engine)
+    finally:
+        if args.snapshots: store.save(args.snapshots)
+    return engine.totals()
+
+
+# Oynatma sonunda raporu verilen dosyalara yazar (biçim uzantıdan: png/svg/json/html).
+def write_reports(engine, args):
+    try:
+        for path in args.report: report_format(path)
+        analyzer = make_analyzer(args.sample_rate, args.max_samples)
+
+        def feed(keys):
+            for key in keys: analyzer.feed(key); yield key
+
+        totals = engine.run(feed(input_keys(args)))
+        report = collect_report(totals, analyzer, engine.sram_capacity)
+        for path in args.report: export_report(report, path); print(f"Rapor kaydedildi: {path}")
+    except (OSError, TraceFormatError, ValueError) as e: raise SystemExit(f"Hata: {e}")
+    for name, value in totals.items(): print(f"{name}: {value}")
+
+
+# Trace'i çok seviyeli önbellek hiyerarşisinde oynatır (seviye başına gecikme/enerji).
+def run_hierarchy(args):
+    try:
+        hierarchy = CacheHierarchy.from_json(args.hierarchy)
+        accesses = ((address, False) for address in input_keys(args)) if args.workload else iter_trace_ops(args.trace, base=args.base)
+        totals = hierarchy.run(accesses)
+    except (OSError, TraceFormatError, ValueError, KeyError, TypeError) as e: raise SystemExit(f"Hata: {e}")
+    for name, value in totals.items(): print(f"{name}: {value}")
+    if args.hierarchy_plot: plot_hierarchy_report(hierarchy, args.hierarchy_plot); print(f"Grafik kaydedildi: {args.hierarchy_plot}")
+
+
+# Aynı trace'i tek geçişte birden fazla politikayla çalıştırır (CSV olarak yazdırır).
+def print_policy_comparison(engine_kwargs, args):
+    try: results = compare_policies(input_keys(args), args.compare.split(","), **engine_kwargs)
+    except (OSError, TraceFormatError, ValueError) as e: raise SystemExit(f"Hata: {e}")
+    print_csv(list(results.values()))
+
+
+# Sayılar kesin yazılır: tamsayılar olduğu gibi, ondalıklılar repr ile (gidiş-dönüş kayıpsız; :g 6 basamağa yuvarlar).
+def csv_value(value):
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def print_csv(rows):
+    writer = csv.writer(sys.stdout, lineterminator="\n")
+    writer.writerow(rows[0])
+    for row in rows: writer.writerow([csv_value(value) for value in row.values()])
+
+
+# Tüm SRAM kapasiteleri için tek geçişte kaçırma oranı eğrisi (CSV olarak yazdırır).
+def print_miss_ratio_curve(engine, args):
+    analyzer = make_analyzer(args.sample_rate, args.max_samples)
+    try: analyzer.feed_many(input_keys(args))
+    except (OSError, TraceFormatError, ValueError) as e: raise SystemExit(f"Hata: {e}")
+    capacities = []; capacity = 1
+    while capacity < analyzer.distinct_keys: capacities.append(capacity); capacity *= 2
+    capacities.append(max(capacity, 1))
+    print_csv(analyzer.curve(capacities).totals(engine))
+
+
 # --- Main ---
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = MemorySimulator(root)
-    root.mainloop()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="SRAM/DRAM Simülatörü")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--trace", help="Arayüz açmadan oynatılacak trace dosyası (metin veya ikili)")
+    source.add_argument("--workload", help="Arayüz açmadan oynatılacak sentetik iş yükü, örn. zipf:footprint=100000,alpha=0.9")
+    parser.add_argument("--count", type=int, default=1000000, help="--workload için erişim sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="--workload için rastgelelik tohumu")
+    parser.add_argument("--base", type=int, default=0, help="Metin trace adres tabanı (0 = otomatik)")
+    parser.add_argument("--policy", default="LRU", choices=list(POLICIES), type=str.upper, help="SRAM yer değiştirme politikası")
+    parser.add_argument("--compare", help="Virgülle ayrılmış politikaları tek geçişte karşılaştır (örn. LRU,FIFO,ARC)")
+    parser.add_argument("--hierarchy", help="Çok seviyeli önbellek yapılandırması (JSON, örn. hierarchy_example.json)")
+    parser.add_argument("--hierarchy-plot", help="--hierarchy için seviye başına rapor grafiğinin kaydedileceği dosya (PNG/SVG)")
+    parser.add_argument("--mrc", action="store_true", help="Tek geçişte tüm SRAM kapasiteleri için kaçırma oranı eğrisi")
+    parser.add_argument("--report", action="append", help="Oynatma sonunda raporun yazılacağı dosya (png/svg/json/html; birden fazla verilebilir)")
+    parser.add_argument("--sample-rate", type=float, help="--mrc ve --report için SHARDS örnekleme oranı (örn. 0.01)")
+    parser.add_argument("--max-samples", type=int, help="--mrc ve --report için izlenecek en fazla anahtar (sabit bellek)")
+    parser.add_argument("--snapshot-every", type=int, default=0, help="Her N adımda bir anlık görüntü al (0 = kapalı)")
+    parser.add_argument("--snapshots", help="Arayüzsüz oynatmada anlık görüntülerin yazılacağı dosya")
+    parser.add_argument("--resume", help="Anlık görüntü dosyasından devam et (politika/SRAM boyutu/yenileme aralığı değiştirilebilir)")
+    parser.add_argument("--resume-index", type=int, help="--resume için görüntü numarası (varsayılan: son)")
+    parser.add_argument("--history", choices=["full", "ring", "rollup"], default="full", help="Arayüz tarihçe deposu: tümü, son N adım veya çok çözünürlüklü")
+    parser.add_argument("--history-rows", type=int, default=100000, help="ring/rollup modunda tutulacak satır sayısı")
+    parser.add_argument("--profile", action="store_true", help="Arayüz evre ölçümlerini (profil) açık başlat")
+    parser.add_argument("--sram-rows", type=int, default=3)
+    parser.add_argument("--sram-cols", type=int, default=3)
+    parser.add_argument("--dram-rows", type=int, default=1024)
+    parser.add_argument("--dram-cols", type=int, default=1024)
+    parser.add_argument("--dram-model", choices=list(DRAM_MODELS), default="flat", help="flat: sabit DRAM gecikmesi, event: banka/satır tamponu/tREFI modeli")
+    parser.add_argument("--dram-banks", type=int, default=8, help="--dram-model event için banka sayısı")
+    args = parser.parse_args()
+    if args.trace or args.workload:
+        if args.snapshot_every and not args.snapshots: parser.error("--snapshot-every arayüzsüz oynatmada --snapshots ile birlikte kullanılmalı")
+        run_headless(args)
+    else:
+        root = tk.Tk()
+        app = MemorySimulator(root, history_mode=args.history, history_rows=args.history_rows, profile=args.profile, snapshot_every=args.snapshot_every,
+                              sram_rows=args.sram_rows, sram_cols=args.sram_cols, dram_rows=args.dram_rows, dram_cols=args.dram_cols,
+                              dram_model=args.dram_model, dram_banks=args.dram_banks)
+        root.mainloop()
\ No newline at end of file
@@ -0,0 +1,223 @@
+import heapq
+import zlib
+from bisect import bisect_right
+from itertools import accumulate
+
+
+# Tüm SRAM kapasiteleri için tek geçişte LRU isabet/kaçırma sayıları (Mattson yığın mesafesi).
+# Bir erişimin yığın mesafesi, aynı anahtara önceki erişimden bu yana görülen farklı anahtar
+# sayısı + 1'dir; tam ilişkili LRU önbellekte erişim ancak mesafe <= kapasite ise HIT olur.
+
+
+#Zaman damgaları üzerinde önek toplamı (Fenwick ağacı).
+class _FenwickTree:
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index, delta):
+        tree = self.tree; size = self.size
+        while index <= size:
+            tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index):
+        tree = self.tree; total = 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+
+class StackDistanceAnalyzer:
+    def __init__(self, initial_size=1 << 12):
+
+        # Her anahtarın son erişim zamanı ağaçta 1 ile işaretlenir. Zaman ekseni dolduğunda
+        # canlı anahtarlar yeniden numaralandırılır, böylece bellek farklı anahtar sayısıyla sınırlı kalır.
+
+        self._initial_size = initial_size
+        self.reset()
+
+    def reset(self):
+        self._tree = _FenwickTree(self._initial_size)
+        self._last_time = {}
+        self._clock = 0
+        self.histogram = {}       # mesafe -> erişim sayısı
+        self.cold_misses = 0      # ilk erişimler (sonsuz mesafe)
+        self.total = 0
+
+    def _compact(self):
+        live = sorted(self._last_time.items(), key=lambda item: item[1])
+        self._tree = _FenwickTree(max(self._initial_size, 2 * len(live)))
+        for new_time, (key, _) in enumerate(live, 1):
+            self._last_time[key] = new_time
+            self._tree.add(new_time, 1)
+        self._clock = len(live)
+
+    def _distance(self, key):
+
+        # Anahtarın mesafesini döndürür (ilk erişimde None) ve onu yığının tepesine taşır.
+
+        if self._clock >= self._tree.size: self._compact()
+        tree = self._tree
+        self._clock += 1; now = self._clock
+        previous = self._last_time.get(key)
+        self._last_time[key] = now
+        tree.add(now, 1)
+        if previous is None: return None
+        tree.add(previous, -1)
+        return tree.prefix_sum(now - 1) - tree.prefix_sum(previous) + 1
+
+    def _forget(self, key):
+        previous = self._last_time.pop(key, None)
+        if previous is not None: self._tree.add(previous, -1)
+
+    def feed(self, key):
+        self.total += 1
+        distance = self._distance(key)
+        if distance is None: self.cold_misses += 1
+        else: self.histogram[distance] = self.histogram.get(distance, 0) + 1
+
+    def feed_many(self, keys):
+        for key in keys: self.feed(key)
+        return self
+
+    @property
+    def distinct_keys(self):
+        return len(self._last_time)
+
+    def curve(self, capacities=None):
+        if capacities is None: capacities = range(1, max(self.distinct_keys, 1) + 1)
+        return MissRatioCurve.from_histogram(self.histogram, self.total, capacities)
+
+
+# --- Örneklemeli yaklaşık analiz (SHARDS) ---
+_HASH_MODULUS = 1 << 24
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+def _spatial_hash(key):
+
+    # Süreçler arası kararlı karma (Python'un hash() değeri str için her çalıştırmada değişir).
+
+    if isinstance(key, int): return ((key * _HASH_MULTIPLIER) >> 20) % _HASH_MODULUS
+    return zlib.crc32(str(key).encode("utf-8")) % _HASH_MODULUS
+
+
+class ShardsAnalyzer(StackDistanceAnalyzer):
+    def __init__(self, sample_rate=0.01, max_samples=None, initial_size=1 << 12):
+
+        # Yalnızca karması eşiğin altında kalan anahtarlar izlenir; mesafeler ve sayılar 1/oran ile ölçeklenir.
+        # max_samples verilirse izlenen anahtar sayısı bu değeri aşınca en büyük karmalı anahtar atılır
+        # ve eşik düşürülür (sabit bellekli SHARDS). Mesafe çözünürlüğü yaklaşık 1/oran hücredir.
+
+        self.initial_sample_rate = sample_rate
+        self.max_samples = max_samples
+        super().__init__(initial_size)
+
+    def reset(self):
+        super().reset()
+        self.threshold = max(1, int(self.initial_sample_rate * _HASH_MODULUS))
+        self._hash_heap = []      # (-karma, anahtar): en büyük karmalı izlenen anahtar tepede
+        self.sampled = 0          # izlenen (örneklenen) erişim sayısı
+
+    @property
+    def sample_rate(self):
+        return self.threshold / _HASH_MODULUS
+
+    def feed(self, key):
+        self.total += 1
+        key_hash = _spatial_hash(key)
+        if key_hash >= self.threshold: return
+        if self.max_samples is not None and key not in self._last_time:
+            heapq.heappush(self._hash_heap, (-key_hash, key))
+        rate = self.sample_rate
+        self.sampled += 1
+        distance = self._distance(key)
+        if distance is None: self.cold_misses += 1 / rate
+        else:
+            scaled = max(1, round(distance / rate))
+            self.histogram[scaled] = self.histogram.get(scaled, 0) + 1 / rate
+        if self.max_samples is not None:
+            while len(self._last_time) > self.max_samples:
+                negative_hash, evicted = heapq.heappop(self._hash_heap)
+                self._forget(evicted)
+                self.threshold = -negative_hash
+                # Aynı karmaya sahip diğer anahtarlar da artık eşiğin dışında
+                while self._hash_heap and -self._hash_heap[0][0] >= self.threshold:
+                    self._forget(heapq.heappop(self._hash_heap)[1])
+
+    @property
+    def distinct_keys(self):
+        return round(len(self._last_time) / self.sample_rate)
+
+    def curve(self, capacities=None):
+
+        # SHARDS-adj: gerçek erişim sayısı ile ölçeklenmiş örneklerin toplamı arasındaki fark en küçük mesafeye
+        # eklenir. Her örnek alındığı andaki 1/oran ile sayıldığından fark zaten ölçekli birimdedir; sabit bellekte
+        # oran sonradan düşse de yeniden ölçeklenmez.
+
+        histogram = dict(self.histogram)
+        correction = self.total - (sum(histogram.values()) + self.cold_misses)
+        if histogram and correction:
+            smallest = min(histogram)
+            histogram[smallest] += correction  # negatif olabilir (sık erişilen bir anahtar örneklenmişse); from_histogram kırpar
+        if capacities is None: capacities = range(1, max(self.distinct_keys, 1) + 1)
+        return MissRatioCurve.from_histogram(histogram, self.total, capacities)
+
+
+def make_analyzer(sample_rate=None, max_samples=None):
+    if sample_rate is None and max_samples is None: return StackDistanceAnalyzer()
+    return ShardsAnalyzer(1.0 if sample_rate is None else sample_rate, max_samples)
+
+
+# --- Kaçırma oranı eğrisi ---
+def capacity_points(upper, max_points=256):
+
+    # 1..upper arası kapasiteler; çok büyük aralıklar logaritmik aralıklı noktalara indirgenir.
+
+    upper = max(1, int(upper))
+    if upper <= max_points: return list(range(1, upper + 1))
+    ratio = upper ** (1 / (max_points - 1))
+    return sorted({max(1, round(ratio ** i)) for i in range(max_points)} | {upper})
+
+
+class MissRatioCurve:
+    def __init__(self, capacities, hits, total):
+        self.capacities = list(capacities)
+        self.hits = list(hits)
+        self.total = total
+        self.misses = [total - h for h in self.hits]
+
+    @classmethod
+    def from_histogram(cls, histogram, total, capacities):
+        distances = sorted(histogram)
+        cumulative = list(accumulate(histogram[d] for d in distances))
+        hits = []
+        for capacity in capacities:
+            index = bisect_right(distances, capacity)
+            hits.append(min(total, max(0, cumulative[index - 1])) if index else 0)
+        return cls(capacities, hits, total)
+
+    def miss_ratios(self):
+        return [m / self.total if self.total else 0.0 for m in self.misses]
+
+    def totals(self, engine):
+
+        # Her kapasite için SimEngine ile aynı formüllerle gecikme ve enerji toplamlarını hesaplar.
+        # Yenileme enerjisi adım sayısına bağlıdır, kapasiteden bağımsızdır.
+
+        refresh = (self.total // engine.dram_refresh_interval) * engine.dram_refresh_energy
+        rows = []
+        for capacity, hits, misses in zip(self.capacities, self.hits, self.misses):
+            rows.append({
+                "sram_capacity": capacity,
+                "sram_hits": hits,
+                "dram_misses": misses,
+                "sram_delay": hits * engine.sram_access_delay,
+                "dram_delay": misses * engine.dram_access_delay,
+                "sram_energy": hits * engine.sram_read_energy + misses * engine.sram_write_energy,
+                "dram_energy": misses * engine.dram_read_energy,
+                "dram_refresh_energy": refresh,
+            })
+        return rows
@@ -0,0 +1,202 @@
+import argparse
+import csv
+import hashlib
+import inspect
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from sim_engine import SimEngine, SimulationError
+from trace_loader import iter_trace, TraceFormatError
+
+
+# Parametre taraması: SimEngine parametrelerinin ızgarası x trace dosyaları.
+# Çalıştırmalar süreç havuzuna gruplar halinde dağıtılır; aynı trace'i kullanan bir gruptaki tüm
+# yapılandırmalar trace'i tek geçişte okur. Sonuçlar tamamlandıkça CSV'ye (veya Parquet parçalarına)
+# yazılır; çıktı dosyasında zaten bulunan run_id'ler atlandığı için yarıda kalan tarama kaldığı yerden sürer.
+
+TOTAL_COLUMNS = [name for name in SimEngine().totals() if name != "policy"]
+READ_CHUNK = 1 << 16
+
+
+def load_grid(path):
+
+    # {"sram_rows": [3, 4], "policy": ["LRU", "ARC"], ...}; tek değerler liste yerine yazılabilir.
+
+    with open(path, "r", encoding="utf-8") as f: grid = json.load(f)
+    if not isinstance(grid, dict) or not grid: raise ValueError("Izgara boş olmayan bir JSON nesnesi olmalı")
+    valid = list(inspect.signature(SimEngine).parameters)
+    for name in grid:
+        if name not in valid: raise ValueError(f"Bilinmeyen parametre: {name} (geçerli: {', '.join(valid)})")
+    return {name: values if isinstance(values, list) else [values] for name, values in grid.items()}
+
+
+def expand_grid(grid):
+    names = sorted(grid)
+    for values in itertools.product(*(grid[name] for name in names)):
+        yield dict(zip(names, values))
+
+
+def run_id(trace, params):
+    key = json.dumps([os.path.abspath(trace), params], sort_keys=True)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+# --- işçi süreç ---
+def run_batch(trace, base, batch):
+
+    # batch: [(run_id, params), ...]. Trace bir kez okunur, her parça tüm motorlara verilir.
+    # Geçersiz bir yapılandırma (örn. bilinmeyen politika) ya da çalışırken hata veren motor yalnızca kendi
+    # satırının error sütununa yazılır.
+
+    engines = []; errors = {}
+    for rid, params in batch:
+        try: engine = SimEngine(**params)
+        except (ValueError, TypeError) as e: engine = None; errors[rid] = str(e)
+        engines.append((rid, params, engine))
+    try:
+        keys = iter_trace(trace, base=base)
+        while True:
+            chunk = list(itertools.islice(keys, READ_CHUNK))
+            if not chunk: break
+            for rid, _, engine in engines:
+                if rid in errors: continue
+                try: engine.run(chunk)
+                except SimulationError as e: errors[rid] = str(e)
+                except Exception as e: errors[rid] = f"{type(e).__name__}: {e}"  # tek yapılandırma grubu düşürmesin
+    except (OSError, TraceFormatError) as e:
+        for rid, _, _ in engines: errors.setdefault(rid, str(e))
+    rows = []
+    for rid, params, engine in engines:
+        row = {"run_id": rid, "trace": trace, **params}
+        if engine is not None: row.update({name: value for name, value in engine.totals().items() if name != "policy"})
+        row["error"] = errors.get(rid, "")
+        rows.append(row)
+    return rows
+
+
+# --- sonuç yazıcıları ---
+class CsvSink:
+    def __init__(self, path, columns):
+        self.path = path
+        self.columns = columns
+
+    def completed(self):
+        if not os.path.exists(self.path): return set()
+        with open(self.path, "r", newline="", encoding="utf-8") as f:
+            # Yarım yazılmış satırda son sütunlar None olur, o çalıştırma yeniden yapılır
+            return {row["run_id"] for row in csv.DictReader(f) if row.get("run_id") and row.get("error") is not None}
+
+    def _drop_partial_line(self):
+
+        # Kesilen taramada dosya satır ortasında bitmişse son yarım satır silinir.
+
+        with open(self.path, "rb+") as f:
+            size = f.seek(0, 2)
+            if size == 0: return
+            f.seek(size - 1)
+            if f.read(1) == b"\n": return
+            position = size
+            while position > 0:
+                step = min(4096, position); position -= step
+                f.seek(position); block = f.read(step)
+                newline = block.rfind(b"\n")
+                if newline >= 0: f.truncate(position + newline + 1); return
+            f.truncate(0)
+
+    def __enter__(self):
+        if os.path.exists(self.path): self._drop_partial_line()
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self._file = open(self.path, "a", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction="ignore")
+        if new_file: self._writer.writeheader()
+        return self
+
+    def write(self, rows):
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def __exit__(self, *exc):
+        self._file.close()
+
+
+class ParquetSink:
+
+    # Çıktı bir klasördür; tamamlanan her grup ayrı bir parça dosyası olarak yazılır (pyarrow gerekir).
+
+    def __init__(self, path, columns):
+        try: import pyarrow, pyarrow.parquet
+        except ImportError: raise SystemExit("Parquet çıktısı için pyarrow gerekli: pip install pyarrow") from None
+        self.pa, self.pq = pyarrow, pyarrow.parquet
+        self.path = path
+        self.columns = columns
+
+    def completed(self):
+        if not os.path.isdir(self.path): return set()
+        done = set()
+        for name in os.listdir(self.path):
+            if name.endswith(".parquet"):
+                done.update(self.pq.read_table(os.path.join(self.path, name), columns=["run_id"]).column("run_id").to_pylist())
+        return done
+
+    def __enter__(self):
+        os.makedirs(self.path, exist_ok=True)
+        return self
+
+    def write(self, rows):
+        table = self.pa.Table.from_pylist([{name: row.get(name) for name in self.columns} for row in rows])
+        name = f"part-{rows[0]['run_id']}.parquet"
+        temporary = os.path.join(self.path, name + ".tmp")
+        self.pq.write_table(table, temporary)
+        os.replace(temporary, os.path.join(self.path, name))
+
+    def __exit__(self, *exc):
+        pass
+
+
+def run_sweep(grid, traces, out, workers=None, batch_size=32, base=0, progress=None):
+    parameter_names = sorted(grid)
+    columns = ["run_id", "trace"] + parameter_names + [name for name in TOTAL_COLUMNS if name not in grid] + ["error"]
+    sink = ParquetSink(out, columns) if out.endswith(".parquet") else CsvSink(out, columns)
+    done = sink.completed()
+
+    batches = []; total = 0
+    for trace in traces:
+        pending = []
+        for params in expand_grid(grid):
+            total += 1
+            rid = run_id(trace, params)
+            if rid not in done: pending.append((rid, params))
+        batches += [(trace, pending[i:i + batch_size]) for i in range(0, len(pending), batch_size)]
+
+    finished = total - sum(len(batch) for _, batch in batches)
+    if progress: progress(finished, total)
+    with sink, ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_batch, trace, base, batch) for trace, batch in batches]
+        for future in as_completed(futures):
+            rows = future.result()
+            sink.write(rows)
+            finished += len(rows)
+            if progress: progress(finished, total)
+    return finished, total
+
+
+def _print_progress(finished, total):
+    print(f"\r{finished}/{total} çalıştırma tamamlandı", end="", file=sys.stderr, flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SRAM/DRAM parametre taraması (çok çekirdekli, kaldığı yerden devam eder)")
+    parser.add_argument("--grid", required=True, help="Parametre ızgarası (JSON)")
+    parser.add_argument("--trace", required=True, action="append", help="Trace dosyası (birden fazla verilebilir)")
+    parser.add_argument("--out", required=True, help="Sonuç dosyası (.csv) veya klasörü (.parquet)")
+    parser.add_argument("--workers", type=int, default=None, help="İşçi süreç sayısı (varsayılan: tüm çekirdekler)")
+    parser.add_argument("--batch-size", type=int, default=32, help="Bir görevde aynı trace üzerinde çalışan yapılandırma sayısı")
+    parser.add_argument("--base", type=int, default=0, help="Metin trace adres tabanı (0 = otomatik)")
+    args = parser.parse_args()
+    try: grid = load_grid(args.grid)
+    except (OSError, ValueError) as e: raise SystemExit(f"Hata: {e}")
+    finished, total = run_sweep(grid, args.trace, args.out, args.workers, args.batch_size, args.base, _print_progress)
+    print(file=sys.stderr)
@@ -0,0 +1,53 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dram_model import DRAMModel
+from sim_engine import SimEngine
+from workloads import iter_workload
+
+
+# Olay güdümlü DRAM modelinde banka ve satır anahtarın adresinden gelir; arayüz ızgarasının genişliği
+# (dram_cols) satır isabeti/çakışması sayılarını ve gecikmeyi değiştirmemeli.
+
+ROW_STATS = ("dram_row_hits", "dram_row_misses", "dram_row_conflicts", "dram_delay", "elapsed_time")
+
+
+def row_stats(keys, dram_cols):
+    engine = SimEngine(sram_rows=4, sram_cols=4, dram_rows=65536 // dram_cols, dram_cols=dram_cols, dram_model="event")
+    totals = engine.run(keys)
+    return {name: totals[name] for name in ROW_STATS}
+
+
+class AddressMappingTest(unittest.TestCase):
+    def test_map_address(self):
+        model = DRAMModel(banks=4, row_size=16)
+        self.assertEqual(model.map_address(0), (0, 0))
+        self.assertEqual(model.map_address(15), (0, 0))
+        self.assertEqual(model.map_address(16), (1, 0))
+        self.assertEqual(model.map_address(4 * 16), (0, 1))
+
+    def test_independent_of_grid_width(self):
+        streams = {
+            "uniform": list(iter_workload("uniform:footprint=4000", 20000)),
+            "sequential": list(iter_workload("sequential", 20000)),
+            "text": list("HELLO WORLD, MERHABA DÜNYA " * 200),
+        }
+        for name, keys in streams.items():
+            with self.subTest(stream=name):
+                self.assertEqual(row_stats(keys, 16), row_stats(keys, 1024))
+
+    def test_locality(self):
+
+        # Rastgele erişimde satır çakışmaları baskın, ardışık erişimde satır isabetleri.
+
+        uniform = row_stats(list(iter_workload("uniform:footprint=4000", 20000)), 1024)
+        self.assertGreater(uniform["dram_row_conflicts"], uniform["dram_row_hits"])
+        sequential = row_stats(list(iter_workload("sequential", 20000)), 1024)
+        self.assertGreater(sequential["dram_row_hits"], 10 * (sequential["dram_row_misses"] + sequential["dram_row_conflicts"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import math
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from policies import POLICIES
+from sim_engine import SimEngine, SimulationError
+
+
+# SimEngine.run'ın abonesiz hızlı döngüsü access() mantığının bir kopyasıdır; ikisi aynı akışta aynı
+# toplamları ve aynı SRAM/DRAM konum haritalarını üretmelidir. Toplamlar farklı sırada toplandığından
+# ondalıklı sayaçlar küçük bir toleransla karşılaştırılır.
+
+ENGINE_KWARGS = {"sram_rows": 3, "sram_cols": 4, "dram_rows": 16, "dram_cols": 16, "dram_refresh_interval": 7}
+
+
+def make_stream(count, footprint, seed=0):
+    rng = random.Random(seed)
+    hot = max(1, footprint // 8)
+    return [rng.randrange(hot) if rng.random() < 0.7 else rng.randrange(footprint) for _ in range(count)]
+
+
+def stepped(keys, **kwargs):
+
+    # Her erişim bir abone üzerinden tek tek access() ile işlenir (arayüzün yolu).
+
+    engine = SimEngine(**kwargs)
+    steps = []
+    engine.subscribe(steps.append)
+    for key in keys: engine.access(key)
+    return engine, steps
+
+
+class RunMatchesAccessTest(unittest.TestCase):
+    def assertSameState(self, fast, slow):
+        fast_totals, slow_totals = fast.totals(), slow.totals()
+        self.assertEqual(fast_totals.keys(), slow_totals.keys())
+        for name, value in fast_totals.items():
+            if isinstance(value, float) or isinstance(slow_totals[name], float):
+                self.assertTrue(math.isclose(value, slow_totals[name], rel_tol=1e-9), f"{name}: {value} != {slow_totals[name]}")
+            else:
+                self.assertEqual(value, slow_totals[name], name)
+        self.assertEqual(fast.time, slow.time)
+        self.assertEqual(fast.sram_visual_map, slow.sram_visual_map)
+        self.assertEqual(fast.dram_visual_map, slow.dram_visual_map)
+        self.assertEqual(list(fast.policy.keys()), list(slow.policy.keys()))
+
+    def test_every_policy(self):
+        keys = make_stream(5000, 200)
+        for policy in POLICIES:
+            with self.subTest(policy=policy):
+                fast = SimEngine(policy=policy, **ENGINE_KWARGS)
+                fast.run(keys)
+                slow, steps = stepped(keys, policy=policy, **ENGINE_KWARGS)
+                self.assertEqual(len(steps), len(keys))
+                self.assertSameState(fast, slow)
+
+    def test_chunked_runs(self):
+
+        # Parçalar arasında sayaçlar ve boş hücre listeleri (invalidate sonrası) doğru aktarılmalı.
+
+        keys = make_stream(4000, 150, seed=1)
+        for policy in POLICIES:
+            with self.subTest(policy=policy):
+                fast = SimEngine(policy=policy, **ENGINE_KWARGS)
+                slow = SimEngine(policy=policy, **ENGINE_KWARGS)
+                slow.subscribe(lambda result: None)
+                for start in range(0, len(keys), 333):
+                    chunk = keys[start:start + 333]
+                    fast.run(chunk); slow.run(chunk)
+                    for key in chunk[:3]:
+                        fast.invalidate(key, release_dram=True); slow.invalidate(key, release_dram=True)
+                self.assertSameState(fast, slow)
+
+    def test_dram_full(self):
+        keys = list(range(300))
+        for policy in POLICIES:
+            with self.subTest(policy=policy):
+                fast = SimEngine(policy=policy, **ENGINE_KWARGS)
+                with self.assertRaises(SimulationError): fast.run(keys)
+                slow = SimEngine(policy=policy, **ENGINE_KWARGS)
+                slow.subscribe(lambda result: None)
+                with self.assertRaises(SimulationError): slow.run(keys)
+                self.assertSameState(fast, slow)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stack_distance import ShardsAnalyzer, StackDistanceAnalyzer, make_analyzer
+from workloads import iter_workload
+
+
+# SHARDS yaklaşık eğrisi, çarpık (zipf) bir iş yükünde kesin Mattson eğrisine yakın olmalı. Sabit bellekli
+# modda örnekleme oranı çalışma sırasında düşer; düzeltme yine de tüm erişimleri doğru ölçekte saymalı.
+
+FOOTPRINT = 20000
+CAPACITIES = [2000, 5000, 10000, FOOTPRINT]
+
+
+class ShardsAccuracyTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.streams = {seed: [int(key) for key in iter_workload(f"zipf:footprint={FOOTPRINT},alpha=0.8", 200000, seed=seed)]
+                       for seed in (0, 2)}
+        cls.exact = {seed: StackDistanceAnalyzer().feed_many(keys).curve(CAPACITIES).miss_ratios()
+                     for seed, keys in cls.streams.items()}
+
+    def assertCloseCurve(self, analyzer, seed):
+        approximate = analyzer.feed_many(self.streams[seed]).curve(CAPACITIES).miss_ratios()
+        for capacity, estimate, exact in zip(CAPACITIES, approximate, self.exact[seed]):
+            tolerance = 0.01 if capacity == FOOTPRINT else 0.06
+            self.assertAlmostEqual(estimate, exact, delta=tolerance, msg=f"kapasite {capacity}")
+
+    def test_fixed_rate(self):
+        for seed in self.streams:
+            with self.subTest(seed=seed):
+                self.assertCloseCurve(make_analyzer(0.1), seed)
+
+    def test_fixed_size(self):
+        for seed in self.streams:
+            with self.subTest(seed=seed):
+                analyzer = make_analyzer(0.1, max_samples=1000)
+                self.assertIsInstance(analyzer, ShardsAnalyzer)
+                self.assertCloseCurve(analyzer, seed)
+                self.assertLessEqual(len(analyzer._last_time), 1000)
+                self.assertLess(analyzer.sample_rate, 0.1)  # oran gerçekten düşmüş olmalı
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sim_engine import SimEngine
+from sweep import expand_grid, run_batch, run_id
+from trace_loader import write_binary_trace
+
+
+# Geçersiz bir ızgara değeri yalnızca kendi satırının error sütununa yazılmalı; aynı gruptaki diğer
+# yapılandırmalar sonuç üretmeye devam eder.
+
+class RunBatchErrorsTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.trace = tempfile.mkstemp(suffix=".bin"); os.close(handle)
+        write_binary_trace(self.trace, [address % 30 for address in range(2000)])
+
+    def tearDown(self):
+        os.remove(self.trace)
+
+    def run_grid(self, grid):
+        batch = [(run_id(self.trace, params), params) for params in expand_grid(grid)]
+        return run_batch(self.trace, 0, batch)
+
+    def test_invalid_values_are_recorded_per_row(self):
+        grid = {"dram_refresh_interval": [10, 0], "sram_access_delay": [5, "5", -1], "policy": ["LRU", "NOPE"]}
+        rows = self.run_grid(grid)
+        self.assertEqual(len(rows), 12)
+        for row in rows:
+            valid = row["dram_refresh_interval"] == 10 and row["sram_access_delay"] == 5 and row["policy"] == "LRU"
+            with self.subTest(params={name: row[name] for name in grid}):
+                if valid:
+                    self.assertEqual(row["error"], "")
+                    self.assertEqual(row["steps"], 2000)
+                else:
+                    self.assertNotEqual(row["error"], "")
+                    self.assertNotIn("steps", row)
+
+    def test_runtime_failure_is_recorded_per_row(self):
+
+        # Kurulumda geçen ama çalışırken hata veren yapılandırma (DRAM'e sığmayan trace).
+
+        rows = self.run_grid({"dram_rows": [2, 16], "dram_cols": [4]})
+        errors = {row["dram_rows"]: row["error"] for row in rows}
+        self.assertIn("DRAM", errors[2])
+        self.assertEqual(errors[16], "")
+
+    def test_engine_rejects_invalid_parameters(self):
+        for params in ({"dram_refresh_interval": 0}, {"sram_access_delay": "5"}, {"dram_read_energy": -1.0},
+                       {"sram_rows": 0}, {"dram_banks": 2.5}, {"sram_write_energy": float("nan")}):
+            with self.subTest(params=params):
+                with self.assertRaises(ValueError): SimEngine(**params)
+
+
+if __name__ == "__main__":
+    unittest.main()
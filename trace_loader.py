@@ -0,0 +1,136 @@
+import mmap
+import struct
+import sys
+from array import array
+from itertools import chain
+
+
+# --- İkili trace biçimi ---
+# 16 baytlık başlık (8 bayt sihirli değer, uint32 sürüm, uint32 ayrılmış) ve ardından
+# her erişim için little-endian uint64 adres.
+BINARY_MAGIC = b"SDTRACE\x00"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<8sII")
+RECORD_SIZE = 8
+
+DEFAULT_CHUNK_SIZE = 1 << 16  # erişim sayısı
+TEXT_READ_SIZE = 1 << 20      # bayt
+
+
+class TraceFormatError(Exception):
+    pass
+
+
+# --- metin trace: her satırda bir adres ---
+def _parse_address(line, base):
+    return int(line.split()[-1], base)
+
+
+def _parse_operation(line, base):
+
+    # "W 0x1f40" -> (0x1f40, True); işlem sütunu yoksa okuma kabul edilir.
+
+    fields = line.split()
+    return int(fields[-1], base), len(fields) > 1 and fields[0] in ("W", "w")
+
+
+def iter_text_trace_chunks(path, base=0, read_size=TEXT_READ_SIZE, with_ops=False):
+
+    # Dosyayı sabit boyutlu bloklar halinde okur, her blok için adres listesi üretir.
+    # Boş satırlar ve '#' ile başlayan satırlar atlanır; "R 0x1f40" gibi satırlarda son sütun adrestir.
+    # base=0 iken "0x" önekli onaltılık ve onluk sayılar otomatik tanınır.
+    # with_ops=True iken (adres, yazma_mı) çiftleri üretilir.
+
+    parse = _parse_operation if with_ops else _parse_address
+
+    with open(path, "r", encoding="ascii", errors="replace") as f:
+        tail = ""
+        line_no = 0
+        while True:
+            block = f.read(read_size)
+            if not block: break
+            lines = (tail + block).split("\n")
+            tail = lines.pop()
+            chunk = []
+            for line in lines:
+                line_no += 1
+                line = line.strip()
+                if not line or line[0] == "#": continue
+                try: chunk.append(parse(line, base))
+                except ValueError: raise TraceFormatError(f"{path}:{line_no}: geçersiz adres: {line!r}") from None
+            if chunk: yield chunk
+        tail = tail.strip()
+        if tail and tail[0] != "#":
+            try: yield [parse(tail, base)]
+            except ValueError: raise TraceFormatError(f"{path}:{line_no + 1}: geçersiz adres: {tail!r}") from None
+
+
+# --- ikili trace: bellek eşlemeli (mmap) okuma ---
+def iter_binary_trace_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    with open(path, "rb") as f:
+        header = f.read(BINARY_HEADER.size)
+        if len(header) < BINARY_HEADER.size: raise TraceFormatError(f"{path}: ikili trace başlığı eksik")
+        magic, version, _ = BINARY_HEADER.unpack(header)
+        if magic != BINARY_MAGIC: raise TraceFormatError(f"{path}: ikili trace değil")
+        if version != BINARY_VERSION: raise TraceFormatError(f"{path}: desteklenmeyen trace sürümü {version}")
+        body_size = f.seek(0, 2) - BINARY_HEADER.size
+        if body_size % RECORD_SIZE: raise TraceFormatError(f"{path}: kayıt boyutu {RECORD_SIZE} baytın katı değil")
+        if body_size == 0: return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            step = chunk_size * RECORD_SIZE
+            end = BINARY_HEADER.size + body_size
+            for start in range(BINARY_HEADER.size, end, step):
+                records = array("Q", mm[start:min(start + step, end)])
+                if sys.byteorder == "big": records.byteswap()
+                yield records.tolist()
+
+
+def write_binary_trace(path, addresses, chunk_size=DEFAULT_CHUNK_SIZE):
+
+    # Adres akışını ikili biçime yazar; girdi bir üreteç olabilir, bellek kullanımı sabit kalır.
+
+    count = 0
+    with open(path, "wb") as f:
+        f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0))
+        buffer = array("Q")
+        for address in addresses:
+            buffer.append(address)
+            if len(buffer) >= chunk_size:
+                if sys.byteorder == "big": buffer.byteswap()
+                buffer.tofile(f); count += len(buffer); buffer = array("Q")
+        if buffer:
+            if sys.byteorder == "big": buffer.byteswap()
+            buffer.tofile(f); count += len(buffer)
+    return count
+
+
+def is_binary_trace(path):
+    with open(path, "rb") as f: return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def iter_trace_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, base=0):
+    if is_binary_trace(path): return iter_binary_trace_chunks(path, chunk_size)
+    return iter_text_trace_chunks(path, base)
+
+
+def iter_trace(path, chunk_size=DEFAULT_CHUNK_SIZE, base=0):
+
+    # Biçimi otomatik algılar ve erişimleri tek tek üretir (SimEngine.run / process_next_char için).
+
+    return chain.from_iterable(iter_trace_chunks(path, chunk_size, base))
+
+
+def iter_trace_ops(path, chunk_size=DEFAULT_CHUNK_SIZE, base=0):
+
+    # (adres, yazma_mı) çiftleri; ikili biçimde işlem bilgisi olmadığından tüm erişimler okumadır.
+
+    if is_binary_trace(path):
+        return ((address, False) for chunk in iter_binary_trace_chunks(path, chunk_size) for address in chunk)
+    return chain.from_iterable(iter_text_trace_chunks(path, base, with_ops=True))
+
+
+# --- Metin trace'i ikili biçime dönüştürme ---
+if __name__ == "__main__":
+    if len(sys.argv) != 3: sys.exit("Kullanım: python trace_loader.py <girdi.txt> <çıktı.bin>")
+    written = write_binary_trace(sys.argv[2], iter_trace(sys.argv[1]))
+    print(f"{written} erişim yazıldı: {sys.argv[2]}")
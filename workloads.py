@@ -0,0 +1,193 @@
+import argparse
+from itertools import chain
+
+import numpy as np
+
+from trace_loader import BINARY_HEADER, BINARY_MAGIC, BINARY_VERSION
+
+
+# Sentetik iş yükü üreteci. Erişimler NumPy dizileri halinde (varsayılan 1M'lik gruplar) üretilir;
+# aynı tohum (seed) aynı erişim dizisini verir.
+#
+# İş yükü tanımı: "desen:param=değer,param=değer". Birden fazla evre "+" ile birleştirilir ve her evre
+# count parametresi kadar erişim ürettikten sonra sıradakine geçilir (toplam sayıya ulaşılana kadar döner):
+#   zipf:footprint=100000,alpha=0.9
+#   looping:working_set=64,count=5000+uniform:footprint=4096,count=20000
+#
+# Desenler (adresler base'den başlar):
+#   sequential : base, base+1, ...                  (footprint verilirse başa döner)
+#   strided    : base, base+stride, ...             (footprint verilirse başa döner)
+#   looping    : 0..working_set-1 tekrar tekrar     (döngüsel çalışma kümesi)
+#   uniform    : [0, footprint) aralığında düzgün rastgele
+#   zipf       : [0, footprint) aralığında Zipf (sıcak/soğuk); alpha büyüdükçe sıcak küme küçülür
+
+DEFAULT_BATCH_SIZE = 1 << 20
+ADDRESS_DTYPE = np.uint64
+
+
+class AccessPattern:
+    name = ""
+
+    def __init__(self, rng, base=0):
+        self.rng = rng
+        self.base = base
+
+    def batch(self, size):
+        raise NotImplementedError
+
+
+class SequentialPattern(AccessPattern):
+    name = "sequential"
+
+    def __init__(self, rng, base=0, stride=1, footprint=None):
+        super().__init__(rng, base)
+        if stride < 1: raise ValueError("stride en az 1 olmalı")
+        if footprint is not None and footprint < 1: raise ValueError("footprint en az 1 olmalı")
+        self.stride = stride
+        self.footprint = footprint
+        self._position = 0
+
+    def batch(self, size):
+        index = np.arange(self._position, self._position + size, dtype=ADDRESS_DTYPE)
+        self._position += size
+        if self.footprint is not None: index %= ADDRESS_DTYPE(self.footprint)
+        return index * ADDRESS_DTYPE(self.stride) + ADDRESS_DTYPE(self.base)
+
+
+class StridedPattern(SequentialPattern):
+    name = "strided"
+
+    def __init__(self, rng, base=0, stride=64, footprint=None):
+        super().__init__(rng, base, stride, footprint)
+
+
+class LoopingPattern(SequentialPattern):
+    name = "looping"
+
+    def __init__(self, rng, base=0, working_set=1024, stride=1):
+        super().__init__(rng, base, stride, working_set)
+
+
+class UniformPattern(AccessPattern):
+    name = "uniform"
+
+    def __init__(self, rng, base=0, footprint=4096):
+        super().__init__(rng, base)
+        if footprint < 1: raise ValueError("footprint en az 1 olmalı")
+        self.footprint = footprint
+
+    def batch(self, size):
+        return self.rng.integers(0, self.footprint, size, dtype=ADDRESS_DTYPE) + ADDRESS_DTYPE(self.base)
+
+
+class ZipfPattern(AccessPattern):
+    name = "zipf"
+
+    def __init__(self, rng, base=0, footprint=4096, alpha=0.99, scramble=1):
+
+        # Sınırlı Zipf: k. sıradaki anahtarın olasılığı 1/k^alpha ile orantılı; örnekler birikimli dağılımda
+        # ikili aramayla çekilir. scramble=1 iken sıralar adres uzayına karıştırılır (sıcak anahtarlar bitişik olmaz).
+
+        super().__init__(rng, base)
+        if footprint < 1: raise ValueError("footprint en az 1 olmalı")
+        if alpha < 0: raise ValueError("alpha negatif olamaz")
+        weights = np.arange(1, footprint + 1, dtype=np.float64) ** -alpha
+        self._cdf = np.cumsum(weights); self._cdf /= self._cdf[-1]
+        self._addresses = rng.permutation(footprint).astype(ADDRESS_DTYPE) if scramble else None
+        self.footprint = footprint
+
+    def batch(self, size):
+        ranks = np.searchsorted(self._cdf, self.rng.random(size), side="right")
+        np.minimum(ranks, self.footprint - 1, out=ranks)
+        addresses = self._addresses[ranks] if self._addresses is not None else ranks.astype(ADDRESS_DTYPE)
+        return addresses + ADDRESS_DTYPE(self.base)
+
+
+PATTERNS = {pattern.name: pattern for pattern in (SequentialPattern, StridedPattern, LoopingPattern, UniformPattern, ZipfPattern)}
+
+
+def make_pattern(name, rng, **params):
+    try: pattern = PATTERNS[name.lower()]
+    except KeyError: raise ValueError(f"Bilinmeyen desen: {name} (seçenekler: {', '.join(PATTERNS)})") from None
+    try: return pattern(rng, **params)
+    except TypeError as e: raise ValueError(f"{name}: geçersiz parametre ({e})") from None
+
+
+# --- iş yükü tanımı ---
+def _parse_value(text):
+    try: return int(text)
+    except ValueError: return float(text)
+
+
+def parse_workload(spec):
+
+    # "zipf:alpha=0.9+looping:count=100" -> [("zipf", None, {"alpha": 0.9}), ("looping", 100, {})]
+
+    phases = []
+    for part in spec.split("+"):
+        name, _, arguments = part.strip().partition(":")
+        if not name: raise ValueError(f"Geçersiz iş yükü tanımı: {spec!r}")
+        params = {}
+        for argument in filter(None, (argument.strip() for argument in arguments.split(","))):
+            key, separator, value = argument.partition("=")
+            if not separator: raise ValueError(f"Geçersiz parametre: {argument!r} (param=değer bekleniyor)")
+            try: params[key.strip()] = _parse_value(value.strip())
+            except ValueError: raise ValueError(f"Geçersiz sayı: {argument!r}") from None
+        count = params.pop("count", None)
+        if count is not None and count < 1: raise ValueError(f"{name}: count en az 1 olmalı")
+        phases.append((name, count, params))
+    if len(phases) > 1 and any(count is None for _, count, _ in phases): raise ValueError("Çok evreli iş yükünde her evre için count gerekli")
+    return phases
+
+
+def iter_workload_batches(spec, count, seed=0, batch_size=DEFAULT_BATCH_SIZE):
+
+    # Toplam count erişimi uint64 NumPy dizileri halinde üretir (her dizi en fazla batch_size eleman).
+
+    rng = np.random.default_rng(seed)
+    phases = [(make_pattern(name, rng, **params), phase_count) for name, phase_count, params in parse_workload(spec)]
+    return _generate(phases, count, batch_size)  # tanım hataları üretece geçmeden burada yükselir
+
+
+def _generate(phases, count, batch_size):
+    remaining = count
+    while remaining > 0:
+        for pattern, phase_count in phases:
+            phase_remaining = min(remaining, phase_count or remaining)
+            remaining -= phase_remaining
+            while phase_remaining > 0:
+                size = min(phase_remaining, batch_size)
+                yield pattern.batch(size)
+                phase_remaining -= size
+            if remaining == 0: break
+
+
+def iter_workload(spec, count, seed=0, batch_size=DEFAULT_BATCH_SIZE):
+
+    # Erişimleri Python tamsayıları olarak tek tek üretir (SimEngine.run / arayüz için); dönüşüm grup başına
+    # tek tolist() çağrısıyla C tarafında yapılır.
+
+    return chain.from_iterable(batch.tolist() for batch in iter_workload_batches(spec, count, seed, batch_size))
+
+
+def write_workload(path, spec, count, seed=0, batch_size=DEFAULT_BATCH_SIZE):
+
+    # İş yükünü ikili trace biçiminde yazar (trace_loader ile okunabilir).
+
+    with open(path, "wb") as f:
+        f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0))
+        for batch in iter_workload_batches(spec, count, seed, batch_size): batch.astype("<u8", copy=False).tofile(f)
+    return count
+
+
+# --- İş yükünü ikili trace olarak kaydetme ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sentetik iş yükünü ikili trace dosyasına yazar")
+    parser.add_argument("spec", help="İş yükü tanımı, örn. zipf:footprint=100000,alpha=0.9")
+    parser.add_argument("count", type=int, help="Erişim sayısı")
+    parser.add_argument("out", help="Çıktı dosyası (.bin)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    try: written = write_workload(args.out, args.spec, args.count, args.seed)
+    except ValueError as e: raise SystemExit(f"Hata: {e}")
+    print(f"{written} erişim yazıldı: {args.out}")